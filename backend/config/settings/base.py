@@ -143,4 +143,10 @@ CORS_ALLOWED_ORIGINS = [
     "http://localhost:5173",  # Vite dev server
 ]
 
-CORS_ALLOW_CREDENTIALS = True
\ No newline at end of file
+CORS_ALLOW_CREDENTIALS = True
+
+# Validation: optional SQLite file for parse results shared across restarts.
+# Results loaded from it carry no 'tree' (Python AST), only the extracted
+# imports, classes and functions, so it mainly saves parse_many and JavaScript
+# parses; rows are keyed on PARSE_CACHE_VERSION.
+PARSE_CACHE_DB = config('PARSE_CACHE_DB', default='')
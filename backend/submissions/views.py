@@ -96,7 +96,7 @@ class SubmissionViewSet(viewsets.ModelViewSet):
                 score=0
             )
             
-            logger.debug(f"Created submission {str(submission.submission_id)[:8]}")
+            logger.debug(f"Created submission {submission.submission_id.hex[:8]}")
             
             # PHASE 2: VALIDATE SUBMISSION
             start_time = time.time()
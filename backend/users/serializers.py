@@ -4,6 +4,7 @@ Serializers for users app models.
 
 from rest_framework import serializers
 from django.contrib.auth.models import User
+from django.db.models import Q
 from .models import UserProfile, HintUsage
 
 
@@ -27,9 +28,16 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         fields = ['username', 'email', 'password', 'password_confirm', 'first_name', 'last_name']
     
     def validate(self, data):
-        """Validate that passwords match."""
+        """Validate that passwords match and the account does not exist yet."""
         if data['password'] != data['password_confirm']:
             raise serializers.ValidationError("Passwords do not match")
+        
+        # Reject duplicates before create_user runs the (slow) password hasher
+        lookup = Q(username=data['username'])
+        if data.get('email'):
+            lookup |= Q(email__iexact=data['email'])
+        if User.objects.filter(lookup).exists():
+            raise serializers.ValidationError("A user with that username or email already exists")
         return data
     
     def create(self, validated_data):
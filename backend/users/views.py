@@ -8,6 +8,7 @@ from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework_simplejwt.tokens import RefreshToken
 from django.contrib.auth.models import User
+from django.db import transaction
 from .models import UserProfile, HintUsage
 from .serializers import (
     UserSerializer,
@@ -21,6 +22,7 @@ from problems.models import Problem
 
 @api_view(['POST'])
 @permission_classes([AllowAny])
+@transaction.atomic
 def register(request):
     """Register a new user."""
     serializer = UserRegistrationSerializer(data=request.data)
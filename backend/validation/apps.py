@@ -5,3 +5,11 @@ class ValidationConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'validation'
     verbose_name = 'Validation'
+
+    def ready(self):
+        from django.conf import settings
+        from validation.services.parser_service import ParserService
+
+        # Keep parse results across restarts when a cache file is configured
+        if settings.PARSE_CACHE_DB:
+            ParserService.init_persistent_cache(settings.PARSE_CACHE_DB)
@@ -3,7 +3,60 @@ Feedback Generator - Convert validation results to user-friendly messages
 OPTIMIZED VERSION with old format detection and better error messages
 """
 
-from typing import Dict, List, Any
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Tuple
+
+# Feedback types and component icons
+_ERROR = 'error'
+_WARNING = 'warning'
+_INFO = 'info'
+_SUCCESS = 'success'
+
+_ICON_IMPORTS = '📦'
+_ICON_STRUCTURE = '🏗️'
+_ICON_BEHAVIOR = '⚡'
+
+# Shared read-only fallback for missing component results
+_EMPTY = MappingProxyType({})
+
+# Components whose details are scanned by get_failed_checks
+_CHECKED_COMPONENTS = ('imports', 'structure', 'behavior', 'semantic')
+
+# Phrases that flag a problem still using the old validation_spec format
+_OLD_FORMAT_MARKERS = ('PROBLEM DEFINITION ERROR', 'outdated validation format')
+
+# Leading marker -> feedback type for semantic detail lines
+_SEMANTIC_DETAIL_TYPES = {
+    '✓': _SUCCESS,
+    '✗': _WARNING,
+}
+
+# Feedback type -> prefix used by format_feedback_for_display
+_DISPLAY_PREFIXES = {
+    _ERROR: '❌',
+    _WARNING: '⚠️',
+    _SUCCESS: '✅',
+    _INFO: 'ℹ️',
+}
+
+# Static hint messages shown by _helpful_hints for low-scoring components
+_IMPORT_HINTS = (
+    '💡 Tip: Check that all required imports are included at the top of your file',
+)
+_STRUCTURE_HINTS = (
+    '💡 Tip: Make sure your class/function names match the requirements exactly',
+    '💡 Tip: Check that you\'ve implemented all required methods/functions',
+)
+_BEHAVIOR_HINTS = (
+    '💡 Tip: Review the problem requirements - your code may be missing key functionality',
+)
+
+
+def _entry(msg_type: str, message: str, line: Optional[int] = None,
+           column: Optional[int] = None) -> Dict[str, Any]:
+    """Build a single feedback entry"""
+    return {'type': msg_type, 'message': message, 'line': line, 'column': column}
 
 
 class FeedbackGenerator:
@@ -27,29 +80,25 @@ class FeedbackGenerator:
                 }
             ]
         """
-        feedback = []
-        
         # ====================================
         # 1. SYNTAX ERRORS (Highest Priority)
         # ====================================
         if not validation_results.get('parse_success'):
             error = validation_results.get('parse_error', 'Unknown syntax error')
             line = validation_results.get('error_line')
-            feedback.append({
-                'type': 'error',
-                'message': f'❌ Syntax Error: {error}',
-                'line': line,
-                'column': validation_results.get('error_offset')
-            })
-            return feedback
+            return [_entry(
+                _ERROR,
+                f'❌ Syntax Error: {error}',
+                line,
+                validation_results.get('error_offset')
+            )]
         
         # ====================================
         # 2. CHECK FOR OLD FORMAT PROBLEM
         # ====================================
         structure_result = validation_results.get('structure', {})
         if FeedbackGenerator._is_old_format_error(structure_result):
-            FeedbackGenerator._add_old_format_warning(feedback, structure_result)
-            return feedback
+            return FeedbackGenerator._old_format_warning(structure_result)
         
         # ====================================
         # 3. OVERALL VERDICT MESSAGE
@@ -58,27 +107,16 @@ class FeedbackGenerator:
         total_score = validation_results.get('total_score', 0)
         difficulty = validation_results.get('difficulty', 'unknown')
         
+        score_str = f'{total_score:.1f}/100'
+        
         if verdict == 'accepted':
-            feedback.append({
-                'type': 'success',
-                'message': f'🎉 Solution Accepted! Score: {total_score:.1f}/100 ({difficulty.capitalize()} level)',
-                'line': None,
-                'column': None
-            })
+            # Difficulty values are lowercase choice keys, so only the first letter needs raising
+            level = difficulty[:1].upper() + difficulty[1:]
+            feedback = [_entry(_SUCCESS, f'🎉 Solution Accepted! Score: {score_str} ({level} level)')]
         elif verdict == 'partially_passed':
-            feedback.append({
-                'type': 'warning',
-                'message': f'⚠️ Partially Correct. Score: {total_score:.1f}/100. Review the feedback below to improve.',
-                'line': None,
-                'column': None
-            })
+            feedback = [_entry(_WARNING, f'⚠️ Partially Correct. Score: {score_str}. Review the feedback below to improve.')]
         else:
-            feedback.append({
-                'type': 'error',
-                'message': f'❌ Solution Failed. Score: {total_score:.1f}/100. Please fix the errors below.',
-                'line': None,
-                'column': None
-            })
+            feedback = [_entry(_ERROR, f'❌ Solution Failed. Score: {score_str}. Please fix the errors below.')]
         
         # ====================================
         # 4. COMPONENT-LEVEL FEEDBACK
@@ -87,42 +125,39 @@ class FeedbackGenerator:
         # Import feedback
         imports_result = validation_results.get('imports', {})
         if imports_result:
-            FeedbackGenerator._add_component_feedback(
-                feedback, 
+            feedback.extend(FeedbackGenerator._component_feedback(
                 imports_result, 
                 'Imports',
-                '📦'
-            )
+                _ICON_IMPORTS
+            ))
         
         # Structure feedback
         if structure_result:
-            FeedbackGenerator._add_component_feedback(
-                feedback, 
+            feedback.extend(FeedbackGenerator._component_feedback(
                 structure_result, 
                 'Structure',
-                '🏗️'
-            )
+                _ICON_STRUCTURE
+            ))
         
         # Behavior feedback
         behavior_result = validation_results.get('behavior', {})
         if behavior_result:
-            FeedbackGenerator._add_component_feedback(
-                feedback, 
+            feedback.extend(FeedbackGenerator._component_feedback(
                 behavior_result, 
                 'Behavior',
-                '⚡'
-            )
+                _ICON_BEHAVIOR
+            ))
         
         # Semantic feedback (Pro level)
         semantic_result = validation_results.get('semantic', {})
         if semantic_result and semantic_result.get('patterns_checked'):
-            FeedbackGenerator._add_semantic_feedback(feedback, semantic_result)
+            feedback.extend(FeedbackGenerator._semantic_feedback(semantic_result))
         
         # ====================================
         # 5. HELPFUL HINTS (if score is low)
         # ====================================
         if total_score < 50:
-            FeedbackGenerator._add_helpful_hints(feedback, validation_results)
+            feedback.extend(FeedbackGenerator._helpful_hints(validation_results))
         
         return feedback
     
@@ -134,58 +169,38 @@ class FeedbackGenerator:
             return False
         
         # Check if first detail mentions old format
-        first_detail = str(details[0])
-        return 'PROBLEM DEFINITION ERROR' in first_detail or 'outdated validation format' in first_detail
+        first_detail = details[0]
+        if not isinstance(first_detail, str):
+            return False
+        return any(marker in first_detail for marker in _OLD_FORMAT_MARKERS)
     
     @staticmethod
-    def _add_old_format_warning(feedback: List, structure_result: Dict):
-        """Add special warning for old format problems"""
+    def _old_format_warning(structure_result: Dict) -> List[Dict[str, Any]]:
+        """Build the special warning for old format problems"""
         details = structure_result.get('details', [])
         
-        feedback.append({
-            'type': 'error',
-            'message': '🚨 PROBLEM CONFIGURATION ERROR',
-            'line': None,
-            'column': None
-        })
-        
-        feedback.append({
-            'type': 'warning',
-            'message': '⚠️ This problem uses an outdated validation format and cannot be graded.',
-            'line': None,
-            'column': None
-        })
+        feedback = [
+            _entry(_ERROR, '🚨 PROBLEM CONFIGURATION ERROR'),
+            _entry(_WARNING, '⚠️ This problem uses an outdated validation format and cannot be graded.'),
+        ]
         
         # Add specific details from validator
-        for detail in details:
-            if 'Expected format' in detail:
-                feedback.append({
-                    'type': 'info',
-                    'message': f'ℹ️ {detail}',
-                    'line': None,
-                    'column': None
-                })
-        
-        feedback.append({
-            'type': 'info',
-            'message': '💡 What to do: Contact the course administrator to update this problem.',
-            'line': None,
-            'column': None
-        })
-        
-        feedback.append({
-            'type': 'info',
-            'message': '📚 For admins: Update the validation_spec to use "classes": [{"name": "...", "methods": [...]}] format',
-            'line': None,
-            'column': None
-        })
+        feedback.extend(
+            _entry(_INFO, f'ℹ️ {detail}')
+            for detail in details if 'Expected format' in detail
+        )
+        
+        feedback.append(_entry(_INFO, '💡 What to do: Contact the course administrator to update this problem.'))
+        
+        feedback.append(_entry(_INFO, '📚 For admins: Update the validation_spec to use "classes": [{"name": "...", "methods": [...]}] format'))
+        return feedback
     
     @staticmethod
-    def _add_component_feedback(feedback: List, component_result: Dict, 
-                                component_name: str, icon: str):
-        """Add feedback for a validation component"""
+    def _component_feedback(component_result: Dict, component_name: str,
+                            icon: str) -> List[Dict[str, Any]]:
+        """Build feedback for a validation component"""
         if not component_result:
-            return
+            return []
         
         passed = component_result.get('passed', False)
         score = component_result.get('score', 0)
@@ -193,125 +208,79 @@ class FeedbackGenerator:
         
         # Component header
         status_icon = '✅' if passed else '⚠️'
-        feedback.append({
-            'type': 'info' if passed else 'warning',
-            'message': f'{icon} {component_name}: {status_icon} Score: {score:.1f}/100',
-            'line': None,
-            'column': None
-        })
-        
-        # Component details with smart formatting
-        for detail in details:
-            if not isinstance(detail, str):
-                continue
-            
-            # Determine message type based on content
-            if detail.startswith('✓') or 'found' in detail.lower() and '✓' in detail:
-                msg_type = 'success'
-            elif detail.startswith('✗') or 'missing' in detail.lower() or 'not found' in detail.lower():
-                msg_type = 'error'
-            elif detail.startswith('⚠️') or detail.startswith('ℹ️'):
-                msg_type = 'info'
-            else:
-                msg_type = 'info'
-            
-            # Add indentation for sub-items
-            indent = ''
-            if detail.startswith('  '):
-                indent = '  '
-            elif detail.startswith('    '):
-                indent = '    '
-            
-            feedback.append({
-                'type': msg_type,
-                'message': f'{indent}{detail.strip()}',
-                'line': None,
-                'column': None
-            })
+        feedback = [_entry(_INFO if passed else _WARNING, f'{icon} {component_name}: {status_icon} Score: {score:.1f}/100')]
+        
+        # Component details with smart formatting, built in one pass
+        classify = FeedbackGenerator._classify_detail
+        feedback.extend([
+            _entry(msg_type, f'{indent}{detail.strip()}')
+            for detail in details if isinstance(detail, str)
+            for indent, msg_type in (classify(detail),)
+        ])
+        return feedback
+    
+    @staticmethod
+    def _classify_detail(detail: str) -> Tuple[str, str]:
+        """Return (indent, message type) for a component detail line"""
+        # Add indentation for sub-items
+        indent = '  ' if detail.startswith('  ') else ''
+        
+        # Determine message type based on content (lowercase copy made once)
+        marker = detail[:1]
+        if marker == '✓':
+            return indent, _SUCCESS
+        
+        lowered = detail.lower()
+        if '✓' in detail and 'found' in lowered:
+            return indent, _SUCCESS
+        if marker == '✗' or 'missing' in lowered or 'not found' in lowered:
+            return indent, _ERROR
+        return indent, _INFO
     
     @staticmethod
-    def _add_semantic_feedback(feedback: List, semantic_result: Dict):
-        """Add feedback for semantic validation (Pro level)"""
-        feedback.append({
-            'type': 'info',
-            'message': '🎯 Advanced Pattern Analysis:',
-            'line': None,
-            'column': None
-        })
+    def _semantic_feedback(semantic_result: Dict) -> List[Dict[str, Any]]:
+        """Build feedback for semantic validation (Pro level)"""
+        feedback = [_entry(_INFO, '🎯 Advanced Pattern Analysis:')]
         
         patterns_checked = semantic_result.get('patterns_checked', [])
         details = semantic_result.get('details', [])
         
         # Add patterns checked info
         if patterns_checked:
-            feedback.append({
-                'type': 'info',
-                'message': f'  Patterns analyzed: {", ".join(patterns_checked)}',
-                'line': None,
-                'column': None
-            })
+            feedback.append(_entry(_INFO, f'  Patterns analyzed: {", ".join(patterns_checked)}'))
         
         # Add detailed results
-        for detail in details:
-            if detail.startswith('✓'):
-                feedback.append({
-                    'type': 'success',
-                    'message': f'  {detail}',
-                    'line': None,
-                    'column': None
-                })
-            elif detail.startswith('✗'):
-                feedback.append({
-                    'type': 'warning',
-                    'message': f'  {detail}',
-                    'line': None,
-                    'column': None
-                })
-            else:
-                feedback.append({
-                    'type': 'info',
-                    'message': f'  {detail}',
-                    'line': None,
-                    'column': None
-                })
+        feedback.extend(
+            _entry(_SEMANTIC_DETAIL_TYPES.get(detail[:1], _INFO), f'  {detail}')
+            for detail in details
+        )
+        return feedback
     
     @staticmethod
-    def _add_helpful_hints(feedback: List, validation_results: Dict):
-        """Add helpful hints when score is very low"""
+    def _helpful_hints(validation_results: Dict) -> List[Dict[str, Any]]:
+        """Build helpful hints when score is very low"""
         hints = []
         
         # Check imports
-        imports_result = validation_results.get('imports', {})
+        imports_result = validation_results.get('imports') or _EMPTY
         if imports_result.get('score', 0) < 50:
-            hints.append('💡 Tip: Check that all required imports are included at the top of your file')
+            hints.extend(_IMPORT_HINTS)
         
         # Check structure
-        structure_result = validation_results.get('structure', {})
+        structure_result = validation_results.get('structure') or _EMPTY
         if structure_result.get('score', 0) < 50:
-            hints.append('💡 Tip: Make sure your class/function names match the requirements exactly')
-            hints.append('💡 Tip: Check that you\'ve implemented all required methods/functions')
+            hints.extend(_STRUCTURE_HINTS)
         
         # Check behavior
-        behavior_result = validation_results.get('behavior', {})
+        behavior_result = validation_results.get('behavior') or _EMPTY
         if behavior_result.get('score', 0) < 50:
-            hints.append('💡 Tip: Review the problem requirements - your code may be missing key functionality')
-        
-        # Add hints to feedback
-        if hints:
-            feedback.append({
-                'type': 'info',
-                'message': '',
-                'line': None,
-                'column': None
-            })
-            
-            for hint in hints:
-                feedback.append({
-                    'type': 'info',
-                    'message': hint,
-                    'line': None,
-                    'column': None
-                })
+            hints.extend(_BEHAVIOR_HINTS)
+        
+        if not hints:
+            return []
+        
+        # Blank separator followed by the hints
+        return [_entry(_INFO, message) for message in ('', *hints)]
     
     @staticmethod
     def format_feedback_for_display(feedback: List[Dict[str, Any]]) -> str:
@@ -319,29 +288,13 @@ class FeedbackGenerator:
         Format feedback list as plain text for display
         Useful for logging or text-based interfaces
         """
-        lines = []
-        
-        for item in feedback:
-            msg_type = item.get('type', 'info')
-            message = item.get('message', '')
-            line = item.get('line')
-            
+        prefixes = _DISPLAY_PREFIXES
+        return '\n'.join(
+            f"{prefixes.get(item.get('type'), 'ℹ️')} {item.get('message', '')}"
             # Add line number if present
-            line_info = f" (Line {line})" if line else ""
-            
-            # Format based on type
-            if msg_type == 'error':
-                prefix = '❌'
-            elif msg_type == 'warning':
-                prefix = '⚠️'
-            elif msg_type == 'success':
-                prefix = '✅'
-            else:
-                prefix = 'ℹ️'
-            
-            lines.append(f"{prefix} {message}{line_info}")
-        
-        return '\n'.join(lines)
+            + (f" (Line {item['line']})" if item.get('line') else "")
+            for item in feedback
+        )
     
     @staticmethod
     def get_score_breakdown(validation_results: Dict[str, Any]) -> Dict[str, float]:
@@ -356,16 +309,18 @@ class FeedbackGenerator:
                 'total': 82.3
             }
         """
+        get = validation_results.get
         breakdown = {
-            'imports': validation_results.get('imports', {}).get('score', 0),
-            'structure': validation_results.get('structure', {}).get('score', 0),
-            'behavior': validation_results.get('behavior', {}).get('score', 0),
-            'total': validation_results.get('total_score', 0)
+            'imports': (get('imports') or _EMPTY).get('score', 0),
+            'structure': (get('structure') or _EMPTY).get('score', 0),
+            'behavior': (get('behavior') or _EMPTY).get('score', 0),
+            'total': get('total_score', 0)
         }
         
         # Add semantic if present (pro level)
-        if 'semantic' in validation_results:
-            breakdown['semantic'] = validation_results['semantic'].get('score', 0)
+        semantic_result = get('semantic')
+        if semantic_result is not None:
+            breakdown['semantic'] = semantic_result.get('score', 0)
         
         return breakdown
     
@@ -377,32 +332,31 @@ class FeedbackGenerator:
         Returns:
             list: ['Missing import: rest_framework', 'Method post missing', ...]
         """
-        failed_checks = []
-        
-        for component in ['imports', 'structure', 'behavior', 'semantic']:
-            component_result = validation_results.get(component, {})
-            if not component_result:
-                continue
-            
-            details = component_result.get('details', [])
-            for detail in details:
-                if isinstance(detail, str) and ('✗' in detail or 'missing' in detail.lower()):
-                    # Clean up the message
-                    clean_detail = detail.replace('✗', '').strip()
-                    failed_checks.append(clean_detail)
-        
-        return failed_checks
+        details = chain.from_iterable(
+            (validation_results.get(component) or _EMPTY).get('details', ())
+            for component in _CHECKED_COMPONENTS
+        )
+        
+        # Clean up the message of every failed or missing check
+        return [
+            detail.replace('✗', '').strip()
+            for detail in details
+            if isinstance(detail, str) and ('✗' in detail or 'missing' in detail.lower())
+        ]
     
     @staticmethod
     def should_show_hints(validation_results: Dict[str, Any]) -> bool:
         """Determine if hints should be shown to user"""
-        total_score = validation_results.get('total_score', 0)
-        attempt_number = validation_results.get('attempt_number', 1)
+        total_score = validation_results.get('total_score') or 0
         
         # Show hints if:
         # - Score is below 50, OR
         # - Score is below 70 and it's their 3rd+ attempt
-        return total_score < 50 or (total_score < 70 and attempt_number >= 3)
+        if total_score >= 70:
+            return False
+        if total_score < 50:
+            return True
+        return validation_results.get('attempt_number', 1) >= 3
     
     @staticmethod
     def generate_summary(validation_results: Dict[str, Any]) -> str:
@@ -5,14 +5,18 @@ from pathlib import Path
 
 def setup_logger():
     """Setup lightweight logging for validation system"""
-    log_dir = Path('logs')
-    log_dir.mkdir(exist_ok=True)
-    
     logger = logging.getLogger('validation')
     if logger.handlers:
         return logger
     
+    # Only touch the filesystem the first time the logger is configured
+    log_dir = Path('logs')
+    if not log_dir.exists():
+        log_dir.mkdir(parents=True, exist_ok=True)
+    
     logger.setLevel(logging.DEBUG)
+    # Records are handled here only; don't walk the root logger's handlers too
+    logger.propagate = False
     
     # File handler only - rotating file (5MB max per file, keep 3 backups)
     file_handler = logging.handlers.RotatingFileHandler(
@@ -32,4 +36,4 @@ def setup_logger():
     
     return logger
 
-validation_logger = setup_logger()
\ No newline at end of file
+validation_logger = setup_logger()
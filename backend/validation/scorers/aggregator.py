@@ -2,11 +2,26 @@
 Score Aggregator - Combine all component scores
 """
 
+from operator import itemgetter
 from typing import Dict, List, Any
 import logging
 
 logger = logging.getLogger('validation')
 
+# Fields every component score dict carries, fetched in one C-level call
+_COMPONENT_FIELDS = itemgetter('component', 'raw_score', 'weight', 'weighted_score')
+
+
+class _Lazy:
+    """Defer building a log string until a handler actually formats it"""
+    __slots__ = ('fn',)
+    
+    def __init__(self, fn):
+        self.fn = fn
+    
+    def __str__(self):
+        return self.fn()
+
 
 class ScoreAggregator:
     """Aggregate scores from all validation components"""
@@ -29,15 +44,34 @@ class ScoreAggregator:
                 'breakdown': dict
             }
         """
-        logger.debug(f"Aggregating {len(component_scores)} components")
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            logger.debug("Aggregating %d components", len(component_scores))
         
-        # Calculate total score by summing weighted scores
+        # Single pass: sum weighted scores, count passes and build the breakdown
         # Each weighted score is already (raw_score * weight) where weight is a decimal (0-1)
         # So total_score = sum(weighted_scores) which gives a value between 0-100
-        total_score = sum(comp['weighted_score'] for comp in component_scores)
+        total_score = 0.0
+        components_passed = 0
+        breakdown = {}
+        for comp in component_scores:
+            name, raw_score, weight, weighted_score = _COMPONENT_FIELDS(comp)
+            total_score += weighted_score
+            if comp.get('passed', False):
+                components_passed += 1
+            
+            # Detailed breakdown for frontend display
+            breakdown[name] = {
+                'raw_score': round(raw_score, 2),
+                'weight': weight,
+                'weighted_score': round(weighted_score, 2),
+                'passed': comp.get('passed', raw_score >= 70.0),  # Default passing threshold
+                'max_possible': round(weight * 100, 2)  # Maximum possible score for this component
+            }
         
         # Ensure total score doesn't exceed 100
-        total_score = min(total_score, 100.0)
+        if total_score > 100.0:
+            total_score = 100.0
         
         # Determine verdict
         if total_score >= passing_score:
@@ -47,38 +81,28 @@ class ScoreAggregator:
         else:
             verdict = 'failed'
         
-        # Log detailed score breakdown
-        score_details = []
-        for comp in component_scores:
-            score_details.append(
+        # Log detailed score breakdown (only formatted when DEBUG is enabled)
+        if debug_enabled:
+            logger.debug("Score breakdown: %s", _Lazy(lambda: ', '.join(
                 f"{comp['component']}: raw={comp['raw_score']:.1f}, "
                 f"weight={comp['weight']}, weighted={comp['weighted_score']:.1f}"
-            )
-        
-        logger.debug(f"Score breakdown: {', '.join(score_details)}")
-        logger.debug(f"Total: {total_score:.2f}/{passing_score} → {verdict}")
+                for comp in component_scores
+            )))
+            logger.debug("Total: %.2f/%s → %s", total_score, passing_score, verdict)
         
-        # Create detailed breakdown for frontend display
-        breakdown = {}
-        for comp in component_scores:
-            breakdown[comp['component']] = {
-                'raw_score': round(comp['raw_score'], 2),
-                'weight': comp['weight'],
-                'weighted_score': round(comp['weighted_score'], 2),
-                'passed': comp.get('passed', comp['raw_score'] >= 70.0),  # Default passing threshold
-                'max_possible': round(comp['weight'] * 100, 2)  # Maximum possible score for this component
-            }
+        # Round the total once for both the summary and the result
+        rounded_total = round(total_score, 2)
         
         # Add summary to breakdown
         breakdown['summary'] = {
-            'total_score': round(total_score, 2),
+            'total_score': rounded_total,
             'passing_score': passing_score,
             'components_count': len(component_scores),
-            'components_passed': sum(1 for comp in component_scores if comp.get('passed', False))
+            'components_passed': components_passed
         }
         
         return {
-            'total_score': round(total_score, 2),
+            'total_score': rounded_total,
             'passing_score': passing_score,
             'passed': total_score >= passing_score,
             'verdict': verdict,
@@ -0,0 +1,47 @@
+"""
+Component Scorer - Shared weighted score calculation for validation components
+"""
+
+from typing import Dict, Any, Callable
+
+
+def make_scorer(component_name: str) -> Callable[[Dict[str, Any], float], Dict[str, Any]]:
+    """
+    Build a calculate_score function specialized for one component
+    
+    Args:
+        component_name: Component label stored on the result (e.g., 'imports')
+    
+    Returns:
+        callable: calculate_score(results, weight) -> dict
+    """
+    def calculate_score(results: Dict[str, Any], weight: float) -> Dict[str, Any]:
+        """
+        Calculate weighted score for the component
+        
+        Args:
+            results: Results from the component matcher
+            weight: Weight percentage (e.g., 45.0 for 45%)
+        
+        Returns:
+            dict: {
+                'component': str,
+                'raw_score': float (0-100),
+                'weight': float,
+                'weighted_score': float,
+                'passed': bool
+            }
+        """
+        raw_score = results.get('score', 0.0)
+        weighted_score = (raw_score * weight) / 100.0
+        
+        return {
+            'component': component_name,
+            'raw_score': raw_score,
+            'weight': weight,
+            'weighted_score': round(weighted_score, 2),
+            'passed': results.get('passed', False),
+            'details': results.get('details', [])
+        }
+
+    return calculate_score
@@ -0,0 +1,45 @@
+"""
+Bounded LRU cache shared by the validation services
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+def source_digest(code: str) -> bytes:
+    """SHA-256 digest of source code, used as the content part of cache keys"""
+    return hashlib.sha256(code.encode('utf-8', 'surrogatepass')).digest()
+
+
+class BoundedCache:
+    """Thread-safe mapping that evicts its least recently used entry beyond maxsize"""
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the value stored for key, marking it recently used; None on a miss"""
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+    
+    def put(self, key: Hashable, value: Any):
+        """Store value for key as the most recently used entry"""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -4,16 +4,402 @@ Handles Python (Django) and JavaScript/TypeScript (React, Angular, Express)
 """
 
 import ast
+import atexit
 import json
+import multiprocessing
+import os
+import queue
 import subprocess
-import tempfile
 import re
+import sqlite3
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 import logging
+import threading
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from validation.services._cache import BoundedCache, source_digest
+
+# Optional in-process JavaScript parser; without it parsing goes through Node.js.
+# A tree_sitter older than the grammar's single-pointer Language API raises
+# TypeError or AttributeError here, and is treated as not installed.
+try:
+    import tree_sitter_javascript
+    from tree_sitter import Language, Parser
+    _TS_JS_LANGUAGE = Language(tree_sitter_javascript.language())
+except (ImportError, TypeError, AttributeError):
+    _TS_JS_LANGUAGE = None
+
+# orjson decodes the (potentially large) esprima output faster when installed
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = logging.getLogger('validation')
 
+# LRU cache of parse results keyed by (language, sha256 of source)
+PARSE_CACHE_SIZE = 256
+_parse_cache = BoundedCache(PARSE_CACHE_SIZE)
+
+# Optional SQLite cache behind the LRU, shared across processes and restarts
+# (enabled with ParserService.init_persistent_cache)
+_persistent_cache = None
+_persistent_cache_lock = threading.Lock()
+# Part of every stored row's key; bump it whenever a parser or its extraction
+# changes the results, so rows written by older code are never served
+PARSE_CACHE_VERSION = 1
+
+# Regex fallback patterns for JavaScript, compiled once at import
+# ES6 imports: import { x } from 'module'
+_JS_IMPORT_RE = re.compile(r'import\s+(?:(?:\*\s+as\s+(\w+))|(?:\{([^}]+)\})|([^;]+?))\s+from\s+[\'"]([^\'"]+)[\'"]')
+# Declarations sharing the `const|let|var name =` head, scanned in one pass:
+# CommonJS requires (const x = require('module')) and arrow functions
+# (const myFunc = () => { ... }), which also yield React components
+_JS_DECLARATION_RE = re.compile(
+    r'(?:const|let|var)\s+(?P<name>\w+)\s*=\s*'
+    r'(?:(?P<require>require\s*\(\s*[\'"](?P<module>[^\'"]+)[\'"]\s*\))'
+    r'|(?P<arrow>\((?P<params>[^)]*)\)\s*=>\s*\{))'
+)
+# Class headers: class MyClass extends Base {
+_JS_CLASS_HEAD_RE = re.compile(r'class\s+(\w+)(?:\s+extends\s+([\w.]+))?\s*\{')
+# Class body tokens: method heads name(...) { and bare braces, so the scan can
+# track nesting depth and find where the body ends
+_JS_CLASS_BODY_TOKEN_RE = re.compile(
+    r'(?P<method>(?:(?P<static>static)\s+)?(?:async\s+)?(?P<name>\w+)\s*\([^)]*\)\s*\{)'
+    r'|(?P<open>\{)|(?P<close>\})'
+)
+# Function declarations: function myFunc() { ... }
+_JS_FUNCTION_RE = re.compile(r'function\s+(\w+)\s*\(([^)]*)\)\s*\{')
+# Named exports: export { name1, name2 }
+_JS_NAMED_EXPORT_RE = re.compile(r'export\s+\{([^}]+)\}')
+# Default exports: export default MyComponent
+_JS_DEFAULT_EXPORT_RE = re.compile(r'export\s+default\s+(\w+)')
+# Module.exports: module.exports = { ... }
+_JS_MODULE_EXPORT_RE = re.compile(r'module\.exports\s*=\s*(\w+|{)')
+# Line breaks, indexed once per source to map match offsets to line numbers
+_NEWLINE_RE = re.compile(r'\n')
+
+# AST fields holding statement lists (in _fields order). Imports and classes are
+# statements, so walking only these finds them all without visiting expressions.
+_PY_STATEMENT_FIELDS = ('body', 'handlers', 'orelse', 'finalbody', 'cases')
+
+
+# esprima-based extraction shared by the persistent worker and one-off runs.
+# Defines extract(code) which returns the parsed structure as a plain object.
+_ESPRIMA_EXTRACT_JS = r"""
+const esprima = require('esprima');
+
+function extract(code) {
+    const ast = esprima.parseModule(code, { 
+        jsx: true, 
+        tolerant: true,
+        range: true,
+        tokens: true
+    });
+    
+    // Extract imports - HANDLES BOTH ES6 AND COMMONJS
+    const imports = [];
+    
+    // ES6 imports: import x from 'module'
+    ast.body
+        .filter(node => node.type === 'ImportDeclaration')
+        .forEach(node => {
+            imports.push({
+                type: 'import',
+                module: node.source.value,
+                specifiers: node.specifiers.map(spec => ({
+                    type: spec.type,
+                    local: spec.local.name,
+                    imported: spec.imported ? spec.imported.name : 'default'
+                })),
+                line: node.loc ? node.loc.start.line : null
+            });
+        });
+    
+    // CommonJS requires: const x = require('module')
+    ast.body
+        .filter(node => node.type === 'VariableDeclaration')
+        .forEach(node => {
+            node.declarations.forEach(decl => {
+                if (decl.init && decl.init.type === 'CallExpression' && 
+                    decl.init.callee.name === 'require') {
+                    imports.push({
+                        type: 'require',
+                        module: decl.init.arguments[0].value,
+                        specifiers: [{
+                            type: 'RequireSpecifier',
+                            local: decl.id.name,
+                            imported: 'default'
+                        }],
+                        line: node.loc ? node.loc.start.line : null
+                    });
+                }
+            });
+        });
+    
+    // Extract classes with methods and properties
+    const classes = ast.body
+        .filter(node => node.type === 'ClassDeclaration')
+        .map(node => ({
+            name: node.id ? node.id.name : 'anonymous',
+            superClass: node.superClass ? node.superClass.name : null,
+            methods: node.body.body
+                .filter(method => method.type === 'MethodDefinition')
+                .map(method => ({
+                    name: method.key.name,
+                    kind: method.kind,
+                    static: method.static,
+                    line: method.loc ? method.loc.start.line : null
+                })),
+            line: node.loc ? node.loc.start.line : null
+        }));
+    
+    // Extract functions (including arrow functions and function expressions)
+    const functions = [];
+    ast.body.forEach(node => {
+        if (node.type === 'FunctionDeclaration') {
+            functions.push({
+                name: node.id ? node.id.name : 'anonymous',
+                type: 'function',
+                params: node.params.map(param => param.name),
+                line: node.loc ? node.loc.start.line : null
+            });
+        } else if (node.type === 'VariableDeclaration') {
+            node.declarations.forEach(decl => {
+                if (decl.init && (
+                    decl.init.type === 'FunctionExpression' || 
+                    decl.init.type === 'ArrowFunctionExpression'
+                )) {
+                    functions.push({
+                        name: decl.id.name,
+                        type: decl.init.type === 'ArrowFunctionExpression' ? 'arrow' : 'function',
+                        params: decl.init.params.map(param => param.name),
+                        line: decl.loc ? decl.loc.start.line : null
+                    });
+                }
+            });
+        }
+    });
+    
+    // Extract exports - SUPPORTS BOTH SYNTAXES
+    const exports = [];
+    
+    // ES6 exports
+    ast.body
+        .filter(node => node.type === 'ExportNamedDeclaration' || node.type === 'ExportDefaultDeclaration')
+        .forEach(node => {
+            exports.push({
+                type: node.type,
+                declaration: node.declaration ? node.declaration.name : null,
+                line: node.loc ? node.loc.start.line : null
+            });
+        });
+    
+    // CommonJS module.exports
+    ast.body
+        .filter(node => node.type === 'AssignmentExpression' || node.type === 'ExpressionStatement')
+        .forEach(node => {
+            if (node.type === 'ExpressionStatement' && node.expression.type === 'AssignmentExpression') {
+                const expr = node.expression;
+                if (expr.left.type === 'MemberExpression' && 
+                    expr.left.object.name === 'module' && 
+                    expr.left.property.name === 'exports') {
+                    exports.push({
+                        type: 'ModuleExports',
+                        declaration: expr.right.name || 'object',
+                        line: node.loc ? node.loc.start.line : null
+                    });
+                }
+            }
+        });
+    
+    return {
+        success: true,
+        imports: imports,
+        classes: classes,
+        functions: functions,
+        exports: exports,
+        ast_type: 'esprima'
+    };
+}
+
+function failure(error) {
+    return {
+        success: false,
+        error: error.message,
+        line: error.lineNumber
+    };
+}
+"""
+
+# One-off process: source arrives on stdin, result is written to stdout
+_NODE_ONESHOT_JS = _ESPRIMA_EXTRACT_JS + r"""
+const fs = require('fs');
+
+try {
+    console.log(JSON.stringify(extract(fs.readFileSync(0, 'utf8'))));
+} catch (error) {
+    console.log(JSON.stringify(failure(error)));
+}
+"""
+
+# One-off batch process: a JSON array of sources in, a JSON array of results out
+_NODE_BATCH_JS = _ESPRIMA_EXTRACT_JS + r"""
+const fs = require('fs');
+
+const codes = JSON.parse(fs.readFileSync(0, 'utf8'));
+console.log(JSON.stringify(codes.map(code => {
+    try {
+        return extract(code);
+    } catch (error) {
+        return failure(error);
+    }
+})));
+"""
+
+# Persistent worker: one JSON request per stdin line, one JSON response per stdout line
+_NODE_WORKER_JS = _ESPRIMA_EXTRACT_JS + r"""
+const readline = require('readline');
+const rl = readline.createInterface({ input: process.stdin, terminal: false });
+
+rl.on('line', line => {
+    let response;
+    try {
+        response = extract(JSON.parse(line).code);
+    } catch (error) {
+        response = failure(error);
+    }
+    process.stdout.write(JSON.stringify(response) + '\n');
+});
+"""
+
+# tree-sitter parsers are not thread-safe, so each thread builds its own
+_ts_local = threading.local()
+
+# Python batches at least this large are parsed across CPU cores; smaller ones
+# do not repay starting the worker processes
+PARALLEL_PARSE_MIN_SOURCES = 1000
+
+# Seconds to wait for Node.js to parse a single source
+NODE_PARSE_TIMEOUT = 10
+
+
+class _NodeWorker:
+    """Long-lived Node.js process that parses JavaScript sent over stdin"""
+    
+    def __init__(self, timeout: float = NODE_PARSE_TIMEOUT):
+        self.timeout = timeout
+        self._process = None
+        self._responses = None
+        self._lock = threading.Lock()
+    
+    def try_parse(self, code: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse code with the worker, starting (or restarting) it if needed
+        
+        Returns:
+            dict: esprima result, or None if the worker is busy with another request
+        
+        Raises:
+            FileNotFoundError: Node.js is not installed
+            subprocess.TimeoutExpired: the worker did not answer in time
+            RuntimeError: the worker exited (e.g. esprima is missing)
+        """
+        results = self.try_parse_many([code])
+        return None if results is None else results[0]
+    
+    def try_parse_many(self, codes: List[str]) -> Optional[List[Dict[str, Any]]]:
+        """
+        Parse several sources with the worker, writing all requests before reading
+        
+        Returns:
+            list: esprima results in order, or None if the worker is busy
+        
+        Raises:
+            Same as try_parse; the timeout applies to each response
+        """
+        if not self._lock.acquire(blocking=False):
+            return None
+        try:
+            self._ensure_started()
+            try:
+                for code in codes:
+                    self._process.stdin.write(json.dumps({'code': code}) + '\n')
+                self._process.stdin.flush()
+            except (OSError, ValueError):
+                self._stop()
+                raise RuntimeError('Node.js parser worker exited')
+            
+            # Read every response before decoding so none is left for the next request
+            lines = []
+            for _ in codes:
+                try:
+                    line = self._responses.get(timeout=self.timeout)
+                except queue.Empty:
+                    self._stop()
+                    raise subprocess.TimeoutExpired('node', self.timeout)
+                
+                if line is None:
+                    self._stop()
+                    raise RuntimeError('Node.js parser worker exited')
+                lines.append(line)
+            return [_json_loads(line) for line in lines]
+        finally:
+            self._lock.release()
+    
+    def stop(self):
+        """Terminate the worker process"""
+        with self._lock:
+            self._stop()
+    
+    def _ensure_started(self):
+        if self._process is not None and self._process.poll() is None:
+            return
+        # Release the pipes of a worker that exited on its own
+        self._stop()
+        
+        self._process = subprocess.Popen(
+            ['node', '-e', _NODE_WORKER_JS],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            encoding='utf-8',
+            bufsize=1
+        )
+        # Responses are read on a thread so waits can time out on every platform
+        self._responses = queue.Queue()
+        threading.Thread(
+            target=self._read_responses,
+            args=(self._process.stdout, self._responses),
+            daemon=True
+        ).start()
+        logger.debug("Started Node.js parser worker (pid %s)", self._process.pid)
+    
+    @staticmethod
+    def _read_responses(stream, responses: queue.Queue):
+        with stream:
+            for line in stream:
+                responses.put(line)
+        responses.put(None)  # Worker exited
+    
+    def _stop(self):
+        if self._process is None:
+            return
+        try:
+            self._process.kill()
+            self._process.wait()
+            self._process.stdin.close()
+        except OSError:
+            pass
+        self._process = None
+
+
+_node_worker = _NodeWorker()
+atexit.register(_node_worker.stop)
+
 
 class ParserService:
     """Enhanced service to parse code into Abstract Syntax Trees"""
@@ -30,15 +416,153 @@ class ParserService:
         Returns:
             dict: Parsed AST and metadata
         """
+        # Identical sources are parsed once; results are cached by content hash
+        key = ParserService._cache_key(code, language)
+        cached = ParserService._cache_get(key)
+        if cached is None:
+            cached = ParserService._parse_code_uncached(code, language)
+            if ParserService._is_cacheable(cached):
+                ParserService._cache_put(key, cached)
+        elif language == 'python' and cached.get('success') and 'tree' not in cached:
+            # Results from parse_many's worker processes or the SQLite cache have
+            # no AST; parse again so parse_code always returns 'tree' on success
+            cached = ParserService._parse_code_uncached(code, language)
+            ParserService._cache_put(key, cached, persist=False)
+        
+        # Validators annotate the result (semantics, framework), so hand out a copy
+        return dict(cached)
+    
+    @staticmethod
+    def parse_many(codes: List[str], language: str) -> List[Dict[str, Any]]:
+        """
+        Parse several sources of the same language
+        
+        Like parse_code for each source, but JavaScript sources missing from
+        the cache share a single Node.js round trip, and large Python batches
+        are parsed in parallel (see parse_many_python).
+        
+        Returns:
+            list: Parsed results in the order of codes
+        """
+        keys = [ParserService._cache_key(code, language) for code in codes]
+        results = {key: ParserService._cache_get(key) for key in keys}
+        
+        pending = {key: code for key, code in zip(keys, codes) if results[key] is None}
+        if pending:
+            if language in ['javascript', 'typescript']:
+                parsed = ParserService.parse_many_javascript(list(pending.values()))
+            elif language == 'python':
+                parsed = ParserService.parse_many_python(list(pending.values()))
+            else:
+                parsed = [ParserService._parse_code_uncached(code, language) for code in pending.values()]
+            for key, result in zip(pending, parsed):
+                if ParserService._is_cacheable(result):
+                    ParserService._cache_put(key, result)
+                results[key] = result
+        
+        return [dict(results[key]) for key in keys]
+    
+    @staticmethod
+    def _cache_key(code: str, language: str) -> tuple:
+        """Cache key for a source: its language and SHA-256 digest"""
+        return (language, source_digest(code))
+    
+    @staticmethod
+    def _is_cacheable(result: Dict[str, Any]) -> bool:
+        """
+        Whether a parse result may be memoized
+        
+        The regex fallback is used when Node.js times out, crashes or lacks
+        esprima, which may be transient, so those results are parsed again
+        next time rather than served for the life of the process.
+        """
+        return result.get('parser_used') != 'regex'
+    
+    @staticmethod
+    def init_persistent_cache(path: str):
+        """
+        Also keep parse results in a SQLite database at path
+        
+        Results are stored as JSON without 'tree', so Python results loaded
+        from the database carry no AST (parse_code parses those sources again,
+        parse_many returns them as they are). Rows from other PARSE_CACHE_VERSIONs
+        (or from before the version column existed) are dropped.
+        """
+        global _persistent_cache
+        
+        connection = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        connection.execute('PRAGMA journal_mode=WAL')
+        columns = {row[1] for row in connection.execute('PRAGMA table_info(parse_cache)')}
+        if columns and 'version' not in columns:
+            connection.execute('DROP TABLE parse_cache')
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS parse_cache '
+            '(lang TEXT, sha BLOB, version INTEGER, result TEXT, PRIMARY KEY (lang, sha, version))'
+        )
+        connection.execute('DELETE FROM parse_cache WHERE version != ?', (PARSE_CACHE_VERSION,))
+        with _persistent_cache_lock:
+            _persistent_cache = connection
+        logger.info("Persistent parse cache at %s", path)
+    
+    @staticmethod
+    def _cache_get(key: tuple) -> Optional[Dict[str, Any]]:
+        """Look up a cached parse result, marking it recently used"""
+        cached = _parse_cache.get(key)
+        if cached is None and _persistent_cache is not None:
+            cached = ParserService._persistent_get(key)
+            if cached is not None:
+                ParserService._cache_put(key, cached, persist=False)
+        return cached
+    
+    @staticmethod
+    def _cache_put(key: tuple, result: Dict[str, Any], persist: bool = True):
+        """Store a parse result, evicting the least recently used beyond PARSE_CACHE_SIZE"""
+        _parse_cache.put(key, result)
+        if persist and _persistent_cache is not None:
+            ParserService._persistent_put(key, result)
+    
+    @staticmethod
+    def _persistent_get(key: tuple) -> Optional[Dict[str, Any]]:
+        """Read a parse result from the SQLite cache; errors count as a miss"""
+        try:
+            with _persistent_cache_lock:
+                row = _persistent_cache.execute(
+                    'SELECT result FROM parse_cache WHERE lang = ? AND sha = ? AND version = ?',
+                    (*key, PARSE_CACHE_VERSION)
+                ).fetchone()
+            return json.loads(row[0]) if row else None
+        except (sqlite3.Error, ValueError) as e:
+            logger.warning("Persistent parse cache read failed: %s", e)
+            return None
+    
+    @staticmethod
+    def _persistent_put(key: tuple, result: Dict[str, Any]):
+        """Write a parse result to the SQLite cache; failures only skip the write"""
+        # Never persist a regex fallback: one Node.js failure would outlive restarts
+        if not ParserService._is_cacheable(result):
+            return
+        
+        try:
+            stored = json.dumps({name: value for name, value in result.items() if name != 'tree'})
+            with _persistent_cache_lock:
+                _persistent_cache.execute(
+                    'INSERT OR REPLACE INTO parse_cache (lang, sha, version, result) VALUES (?, ?, ?, ?)',
+                    (*key, PARSE_CACHE_VERSION, stored)
+                )
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning("Persistent parse cache write failed: %s", e)
+    
+    @staticmethod
+    def _parse_code_uncached(code: str, language: str) -> Dict[str, Any]:
+        """Parse code based on language without consulting the cache"""
         if language == 'python':
-            return ParserService.parse_python(code)
+            return ParserService._parse_python_uncached(code)
         elif language in ['javascript', 'typescript']:
             return ParserService.parse_javascript_enhanced(code)
         else:
             return {
                 'success': False,
-                'error': f'Unsupported language: {language}',
-                'ast': None
+                'error': f'Unsupported language: {language}'
             }
     
     @staticmethod
@@ -49,27 +573,58 @@ class ParserService:
         Returns:
             dict: {
                 'success': bool,
-                'ast': dict or None,
                 'error': str or None,
                 'imports': list,
                 'classes': list,
-                'functions': list
+                'functions': list,
+                'tree': ast.Module (only on success)
             }
         """
-        logger.debug(f"Parsing Python: {len(code)} chars")
+        # Shares parse_code's cache, so callers parsing the same source again
+        # (other analyzers, repeat submissions) get the stored result
+        return ParserService.parse_code(code, 'python')
+    
+    @staticmethod
+    def parse_many_python(codes: List[str]) -> List[Dict[str, Any]]:
+        """
+        Parse several Python sources, across CPU cores for large batches
+        
+        Results parsed in worker processes carry no 'tree': ASTs are costly
+        to send back between processes.
+        
+        Returns:
+            list: Parsed structures in the order of codes
+        """
+        if len(codes) < PARALLEL_PARSE_MIN_SOURCES or (os.cpu_count() or 1) < 2:
+            return [ParserService._parse_python_uncached(code) for code in codes]
+        
+        logger.debug("Parsing %d Python sources in worker processes", len(codes))
+        # spawn, not fork: the server process already runs threads (e.g. the Node.js worker reader)
+        with ProcessPoolExecutor(mp_context=multiprocessing.get_context('spawn')) as executor:
+            return list(executor.map(ParserService._parse_python_detached, codes, chunksize=8))
+    
+    @staticmethod
+    def _parse_python_detached(code: str) -> Dict[str, Any]:
+        """Parse Python code in a worker process, leaving out the AST"""
+        result = ParserService._parse_python_uncached(code)
+        result.pop('tree', None)
+        return result
+    
+    @staticmethod
+    def _parse_python_uncached(code: str) -> Dict[str, Any]:
+        """Parse Python code with the ast module, without consulting the cache"""
+        logger.debug("Parsing Python: %d chars", len(code))
         try:
-            # Parse code to AST
-            tree = ast.parse(code)
+            # Parse code to AST; this is what ast.parse does, minus its Python wrapper
+            tree = compile(code, '<unknown>', 'exec', ast.PyCF_ONLY_AST, dont_inherit=True)
             
             # Extract components
-            imports = ParserService._extract_python_imports(tree)
-            classes = ParserService._extract_python_classes(tree)
+            imports, classes = ParserService._extract_python_definitions(tree)
             functions = ParserService._extract_python_functions(tree)
             
-            logger.debug(f"Parse OK: {len(imports)} imports, {len(classes)} classes")
+            logger.debug("Parse OK: %d imports, %d classes", len(imports), len(classes))
             return {
                 'success': True,
-                'ast': ast.dump(tree),
                 'error': None,
                 'imports': imports,
                 'classes': classes,
@@ -79,10 +634,9 @@ class ParserService:
             }
             
         except SyntaxError as e:
-            logger.warning(f"Syntax error line {e.lineno}: {e.msg}")
+            logger.warning("Syntax error line %s: %s", e.lineno, e.msg)
             return {
                 'success': False,
-                'ast': None,
                 'error': f'Line {e.lineno}: {e.msg}',
                 'line': e.lineno,
                 'offset': e.offset,
@@ -94,7 +648,6 @@ class ParserService:
         except Exception as e:
             return {
                 'success': False,
-                'ast': None,
                 'error': str(e),
                 'imports': [],
                 'classes': [],
@@ -110,11 +663,54 @@ class ParserService:
         Returns:
             dict: Parsed structure with comprehensive data
         """
-        logger.debug(f"Parsing JavaScript: {len(code)} chars")
+        logger.debug("Parsing JavaScript: %d chars", len(code))
         
-        # First try Node.js with esprima for accurate parsing
-        node_result = ParserService._parse_javascript_with_node(code)
+        # Prefer tree-sitter when installed: it parses in-process, no subprocess
+        ts_result = ParserService._try_tree_sitter(code)
+        if ts_result is not None:
+            return ts_result
         
+        # Then try Node.js with esprima for accurate parsing
+        return ParserService._javascript_result(code, ParserService._parse_javascript_with_node(code))
+    
+    @staticmethod
+    def parse_many_javascript(codes: List[str]) -> List[Dict[str, Any]]:
+        """
+        Batch version of parse_javascript_enhanced
+        
+        Sources tree-sitter cannot handle are sent to Node.js together, so
+        one round trip (and at most one process start) covers the batch.
+        
+        Returns:
+            list: Parsed structures in the order of codes
+        """
+        logger.debug("Parsing %d JavaScript sources", len(codes))
+        results = [ParserService._try_tree_sitter(code) for code in codes]
+        
+        pending = [index for index, result in enumerate(results) if result is None]
+        if pending:
+            node_results = ParserService._parse_many_javascript_with_node([codes[index] for index in pending])
+            for index, node_result in zip(pending, node_results):
+                results[index] = ParserService._javascript_result(codes[index], node_result)
+        
+        return results
+    
+    @staticmethod
+    def _try_tree_sitter(code: str) -> Optional[Dict[str, Any]]:
+        """Parse with tree-sitter if installed; None when unavailable or unsuccessful"""
+        if _TS_JS_LANGUAGE is None:
+            return None
+        
+        ts_result = ParserService._parse_javascript_with_tree_sitter(code)
+        if not ts_result.get('success'):
+            return None
+        
+        logger.debug("JavaScript parsed successfully with tree-sitter")
+        return {**ts_result, 'language': 'javascript', 'parser_used': 'tree-sitter'}
+    
+    @staticmethod
+    def _javascript_result(code: str, node_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Use the Node.js result if it succeeded, otherwise fall back to regex parsing"""
         if node_result.get('success'):
             logger.debug("JavaScript parsed successfully with Node.js")
             return {**node_result, 'language': 'javascript', 'parser_used': 'esprima'}
@@ -125,6 +721,207 @@ class ParserService:
         
         return {**regex_result, 'language': 'javascript', 'parser_used': 'regex'}
     
+    @staticmethod
+    def _parse_javascript_with_tree_sitter(code: str) -> Dict[str, Any]:
+        """
+        Parse JavaScript with tree-sitter, extracting the same structure as esprima
+        
+        Returns:
+            dict: Parsed structure, or a failure when the source has syntax errors
+        """
+        parser = getattr(_ts_local, 'parser', None)
+        if parser is None:
+            parser = _ts_local.parser = Parser(_TS_JS_LANGUAGE)
+        
+        root = parser.parse(code.encode('utf-8')).root_node
+        if root.has_error:
+            # Leave broken sources to esprima's tolerant mode and the regex fallback
+            return {
+                'success': False,
+                'error': 'tree-sitter found syntax errors',
+                'imports': [],
+                'classes': [],
+                'functions': []
+            }
+        
+        imports = []
+        requires = []
+        classes = []
+        functions = []
+        exports = []
+        
+        # Only top-level statements, like the esprima extraction
+        for node in root.named_children:
+            node_type = node.type
+            line = node.start_point[0] + 1
+            
+            if node_type == 'import_statement':
+                imports.append({
+                    'type': 'import',
+                    'module': ParserService._ts_text(node.child_by_field_name('source'))[1:-1],
+                    'specifiers': ParserService._ts_import_specifiers(node),
+                    'line': line
+                })
+            elif node_type in ('lexical_declaration', 'variable_declaration'):
+                for decl in node.named_children:
+                    if decl.type != 'variable_declarator':
+                        continue
+                    name = ParserService._ts_identifier(decl.child_by_field_name('name'))
+                    value = decl.child_by_field_name('value')
+                    if value is None:
+                        continue
+                    
+                    if value.type == 'call_expression' and ParserService._ts_identifier(value.child_by_field_name('function')) == 'require':
+                        # esprima leaves out module for a non-literal argument and local
+                        # for a destructuring pattern, so those keys are only set when known
+                        args = value.child_by_field_name('arguments').named_children
+                        require = {'type': 'require'}
+                        if args and args[0].type == 'string':
+                            require['module'] = ParserService._ts_text(args[0])[1:-1]
+                        specifier = {'type': 'RequireSpecifier', 'imported': 'default'}
+                        if name is not None:
+                            specifier['local'] = name
+                        require['specifiers'] = [specifier]
+                        require['line'] = line
+                        requires.append(require)
+                    elif value.type in ('arrow_function', 'function_expression', 'function', 'generator_function'):
+                        functions.append({
+                            'name': name,
+                            'type': 'arrow' if value.type == 'arrow_function' else 'function',
+                            'params': ParserService._ts_params(value),
+                            'line': decl.start_point[0] + 1
+                        })
+            elif node_type == 'class_declaration':
+                classes.append(ParserService._ts_class(node))
+            elif node_type in ('function_declaration', 'generator_function_declaration'):
+                functions.append({
+                    'name': ParserService._ts_identifier(node.child_by_field_name('name')) or 'anonymous',
+                    'type': 'function',
+                    'params': ParserService._ts_params(node),
+                    'line': line
+                })
+            elif node_type == 'export_statement':
+                is_default = any(child.type == 'default' for child in node.children)
+                exported = node.child_by_field_name('value') or node.child_by_field_name('declaration')
+                export = {'type': 'ExportDefaultDeclaration' if is_default else 'ExportNamedDeclaration'}
+                # Like esprima: None without a declaration, no key for a declaration without a name
+                declaration = ParserService._ts_identifier(exported)
+                if exported is None or declaration is not None:
+                    export['declaration'] = declaration
+                export['line'] = line
+                exports.append(export)
+            elif node_type == 'expression_statement':
+                expr = node.named_children[0] if node.named_children else None
+                if expr is None or expr.type != 'assignment_expression':
+                    continue
+                left = expr.child_by_field_name('left')
+                if (left.type == 'member_expression'
+                        and ParserService._ts_text(left.child_by_field_name('object')) == 'module'
+                        and ParserService._ts_text(left.child_by_field_name('property')) == 'exports'):
+                    exports.append({
+                        'type': 'ModuleExports',
+                        'declaration': ParserService._ts_identifier(expr.child_by_field_name('right')) or 'object',
+                        'line': line
+                    })
+        
+        return {
+            'success': True,
+            'imports': imports + requires,
+            'classes': classes,
+            'functions': functions,
+            'exports': exports,
+            'ast_type': 'tree-sitter'
+        }
+    
+    @staticmethod
+    def _ts_text(node) -> str:
+        """Source text of a tree-sitter node"""
+        return node.text.decode('utf-8')
+    
+    @staticmethod
+    def _ts_identifier(node) -> Optional[str]:
+        """Name of an identifier node, None for any other expression (esprima's .name)"""
+        if node is not None and node.type in ('identifier', 'property_identifier'):
+            return ParserService._ts_text(node)
+        return None
+    
+    @staticmethod
+    def _ts_params(function_node) -> list:
+        """Parameter names of a function node; destructured parameters map to None"""
+        single = function_node.child_by_field_name('parameter')
+        if single is not None:
+            return [ParserService._ts_identifier(single)]
+        params = function_node.child_by_field_name('parameters')
+        if params is None:
+            return []
+        return [ParserService._ts_identifier(param) for param in params.named_children if param.type != 'comment']
+    
+    @staticmethod
+    def _ts_import_specifiers(node) -> list:
+        """Specifiers of an import statement in esprima's shape"""
+        specifiers = []
+        for clause in node.named_children:
+            if clause.type != 'import_clause':
+                continue
+            for part in clause.named_children:
+                if part.type == 'identifier':
+                    local = ParserService._ts_text(part)
+                    specifiers.append({'type': 'ImportDefaultSpecifier', 'local': local, 'imported': 'default'})
+                elif part.type == 'namespace_import':
+                    local = ParserService._ts_text(part.named_children[-1])
+                    specifiers.append({'type': 'ImportNamespaceSpecifier', 'local': local, 'imported': 'default'})
+                elif part.type == 'named_imports':
+                    for spec in part.named_children:
+                        if spec.type != 'import_specifier':
+                            continue
+                        imported = ParserService._ts_text(spec.child_by_field_name('name'))
+                        alias = spec.child_by_field_name('alias')
+                        specifiers.append({
+                            'type': 'ImportSpecifier',
+                            'local': ParserService._ts_text(alias) if alias is not None else imported,
+                            'imported': imported
+                        })
+        return specifiers
+    
+    @staticmethod
+    def _ts_class(node) -> dict:
+        """Extract a class declaration with its methods"""
+        base = None
+        for child in node.named_children:
+            if child.type == 'class_heritage' and child.named_children:
+                base = child.named_children[0]
+        
+        methods = []
+        for member in node.child_by_field_name('body').named_children:
+            if member.type != 'method_definition':
+                continue
+            name = ParserService._ts_identifier(member.child_by_field_name('name'))
+            modifiers = {child.type for child in member.children if not child.is_named}
+            if name == 'constructor':
+                kind = 'constructor'
+            elif 'get' in modifiers:
+                kind = 'get'
+            elif 'set' in modifiers:
+                kind = 'set'
+            else:
+                kind = 'method'
+            methods.append({
+                'name': name,
+                'kind': kind,
+                'static': 'static' in modifiers,
+                'line': member.start_point[0] + 1
+            })
+        
+        name_node = node.child_by_field_name('name')
+        extracted = {'name': ParserService._ts_text(name_node) if name_node is not None else 'anonymous'}
+        # Like esprima: None without extends, no key for a base like React.Component
+        super_class = ParserService._ts_identifier(base)
+        if base is None or super_class is not None:
+            extracted['superClass'] = super_class
+        extracted['methods'] = methods
+        extracted['line'] = node.start_point[0] + 1
+        return extracted
+    
     @staticmethod
     def _parse_javascript_with_regex(code: str) -> Dict[str, Any]:
         """
@@ -134,10 +931,12 @@ class ParserService:
             dict: Parsed structure with regex-extracted components
         """
         try:
-            imports = ParserService._extract_js_imports_regex(code)
-            classes = ParserService._extract_js_classes_regex(code)
-            functions = ParserService._extract_js_functions_regex(code)
-            exports = ParserService._extract_js_exports_regex(code)
+            newlines = ParserService._newline_offsets(code)
+            requires, arrows, components = ParserService._extract_js_declarations_regex(code, newlines)
+            imports = ParserService._extract_js_imports_regex(code, newlines) + requires
+            classes = ParserService._extract_js_classes_regex(code, newlines)
+            functions = ParserService._extract_js_functions_regex(code, newlines) + arrows + components
+            exports = ParserService._extract_js_exports_regex(code, newlines)
             
             return {
                 'success': True,
@@ -161,185 +960,12 @@ class ParserService:
     def _parse_javascript_with_node(code: str) -> Dict[str, Any]:
         """Parse JavaScript using Node.js and esprima - SUPPORTS BOTH ES6 AND COMMONJS"""
         try:
-            # Create temporary file with JS code
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.js', delete=False) as f:
-                f.write(code)
-                temp_path = f.name
-            
-            # Enhanced parser script with CommonJS support
-            parser_script = f"""
-    const fs = require('fs');
-    const esprima = require('esprima');
-
-    try {{
-        const code = fs.readFileSync('{temp_path}', 'utf8');
-        const ast = esprima.parseModule(code, {{ 
-            jsx: true, 
-            tolerant: true,
-            range: true,
-            tokens: true
-        }});
-        
-        // Extract imports - HANDLES BOTH ES6 AND COMMONJS
-        const imports = [];
-        
-        // ES6 imports: import x from 'module'
-        ast.body
-            .filter(node => node.type === 'ImportDeclaration')
-            .forEach(node => {{
-                imports.push({{
-                    type: 'import',
-                    module: node.source.value,
-                    specifiers: node.specifiers.map(spec => ({{
-                        type: spec.type,
-                        local: spec.local.name,
-                        imported: spec.imported ? spec.imported.name : 'default'
-                    }})),
-                    line: node.loc ? node.loc.start.line : null
-                }});
-            }});
-        
-        // CommonJS requires: const x = require('module')
-        ast.body
-            .filter(node => node.type === 'VariableDeclaration')
-            .forEach(node => {{
-                node.declarations.forEach(decl => {{
-                    if (decl.init && decl.init.type === 'CallExpression' && 
-                        decl.init.callee.name === 'require') {{
-                        imports.push({{
-                            type: 'require',
-                            module: decl.init.arguments[0].value,
-                            specifiers: [{{
-                                type: 'RequireSpecifier',
-                                local: decl.id.name,
-                                imported: 'default'
-                            }}],
-                            line: node.loc ? node.loc.start.line : null
-                        }});
-                    }}
-                }});
-            }});
-        
-        // Extract classes with methods and properties
-        const classes = ast.body
-            .filter(node => node.type === 'ClassDeclaration')
-            .map(node => ({{
-                name: node.id ? node.id.name : 'anonymous',
-                superClass: node.superClass ? node.superClass.name : null,
-                methods: node.body.body
-                    .filter(method => method.type === 'MethodDefinition')
-                    .map(method => ({{
-                        name: method.key.name,
-                        kind: method.kind,
-                        static: method.static,
-                        line: method.loc ? method.loc.start.line : null
-                    }})),
-                line: node.loc ? node.loc.start.line : null
-            }}));
-        
-        // Extract functions (including arrow functions and function expressions)
-        const functions = [];
-        ast.body.forEach(node => {{
-            if (node.type === 'FunctionDeclaration') {{
-                functions.push({{
-                    name: node.id ? node.id.name : 'anonymous',
-                    type: 'function',
-                    params: node.params.map(param => param.name),
-                    line: node.loc ? node.loc.start.line : null
-                }});
-            }} else if (node.type === 'VariableDeclaration') {{
-                node.declarations.forEach(decl => {{
-                    if (decl.init && (
-                        decl.init.type === 'FunctionExpression' || 
-                        decl.init.type === 'ArrowFunctionExpression'
-                    )) {{
-                        functions.push({{
-                            name: decl.id.name,
-                            type: decl.init.type === 'ArrowFunctionExpression' ? 'arrow' : 'function',
-                            params: decl.init.params.map(param => param.name),
-                            line: decl.loc ? decl.loc.start.line : null
-                        }});
-                    }}
-                }});
-            }}
-        }});
-        
-        // Extract exports - SUPPORTS BOTH SYNTAXES
-        const exports = [];
-        
-        // ES6 exports
-        ast.body
-            .filter(node => node.type === 'ExportNamedDeclaration' || node.type === 'ExportDefaultDeclaration')
-            .forEach(node => {{
-                exports.push({{
-                    type: node.type,
-                    declaration: node.declaration ? node.declaration.name : null,
-                    line: node.loc ? node.loc.start.line : null
-                }});
-            }});
-        
-        // CommonJS module.exports
-        ast.body
-            .filter(node => node.type === 'AssignmentExpression' || node.type === 'ExpressionStatement')
-            .forEach(node => {{
-                if (node.type === 'ExpressionStatement' && node.expression.type === 'AssignmentExpression') {{
-                    const expr = node.expression;
-                    if (expr.left.type === 'MemberExpression' && 
-                        expr.left.object.name === 'module' && 
-                        expr.left.property.name === 'exports') {{
-                        exports.push({{
-                            type: 'ModuleExports',
-                            declaration: expr.right.name || 'object',
-                            line: node.loc ? node.loc.start.line : null
-                        }});
-                    }}
-                }}
-            }});
-        
-        console.log(JSON.stringify({{
-            success: true,
-            imports: imports,
-            classes: classes,
-            functions: functions,
-            exports: exports,
-            ast_type: 'esprima'
-        }}));
-        
-    }} catch (error) {{
-        console.log(JSON.stringify({{
-            success: false,
-            error: error.message,
-            line: error.lineNumber
-        }}));
-    }} finally {{
-        try {{
-            fs.unlinkSync('{temp_path}');
-        }} catch (e) {{
-            // Ignore cleanup errors
-        }}
-    }}
-    """
-            
-            # Try to run with Node.js
-            result = subprocess.run(
-                ['node', '-e', parser_script],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            if result.returncode == 0:
-                parsed = json.loads(result.stdout)
-                logger.debug("JavaScript parsed (ES6 + CommonJS support)")
-                return parsed
-            else:
-                return {
-                    'success': False,
-                    'error': f'Node.js parser error: {result.stderr}',
-                    'imports': [],
-                    'classes': [],
-                    'functions': []
-                }
+            parsed = _node_worker.try_parse(code)
+            if parsed is None:
+                # Worker is serving another request; parse in a one-off process instead
+                parsed = ParserService._parse_javascript_once(code)
+            logger.debug("JavaScript parsed (ES6 + CommonJS support)")
+            return parsed
                 
         except FileNotFoundError:
             return {
@@ -375,13 +1001,67 @@ class ParserService:
             }
     
     @staticmethod
-    def _extract_js_imports_regex(code: str) -> list:
+    def _parse_many_javascript_with_node(codes: List[str]) -> List[Dict[str, Any]]:
+        """Parse several sources with Node.js and esprima in one round trip"""
+        try:
+            parsed = _node_worker.try_parse_many(codes)
+            if parsed is None:
+                # Worker is serving another request; parse in a one-off process instead
+                parsed = ParserService._parse_javascript_batch_once(codes)
+            return parsed
+        except Exception as e:
+            # Retry one by one so each source gets its own error (or result)
+            logger.debug("Batch JavaScript parsing failed (%s), parsing sources individually", e)
+            return [ParserService._parse_javascript_with_node(code) for code in codes]
+    
+    @staticmethod
+    def _parse_javascript_batch_once(codes: List[str]) -> List[Dict[str, Any]]:
+        """Parse several sources in a dedicated Node.js process"""
+        result = subprocess.run(
+            ['node', '-e', _NODE_BATCH_JS],
+            input=json.dumps(codes),
+            capture_output=True,
+            text=True,
+            timeout=NODE_PARSE_TIMEOUT * len(codes)
+        )
+        
+        if result.returncode != 0:
+            raise RuntimeError(f'Node.js parser error: {result.stderr}')
+        return _json_loads(result.stdout)
+    
+    @staticmethod
+    def _parse_javascript_once(code: str) -> Dict[str, Any]:
+        """Parse JavaScript in a dedicated Node.js process"""
+        result = subprocess.run(
+            ['node', '-e', _NODE_ONESHOT_JS],
+            input=code,
+            capture_output=True,
+            text=True,
+            timeout=NODE_PARSE_TIMEOUT
+        )
+        
+        if result.returncode == 0:
+            return _json_loads(result.stdout)
+        return {
+            'success': False,
+            'error': f'Node.js parser error: {result.stderr}',
+            'imports': [],
+            'classes': [],
+            'functions': []
+        }
+    
+    @staticmethod
+    def _extract_js_imports_regex(code: str, newlines: list) -> list:
         """Extract JavaScript imports using regex patterns"""
+        # Each extractor first checks for a substring every match must contain,
+        # skipping the regex scan entirely when it is absent
+        if 'import' not in code:
+            return []
+        
         imports = []
         
         # ES6 imports: import { x } from 'module'
-        import_pattern = r'import\s+(?:(?:\*\s+as\s+(\w+))|(?:\{([^}]+)\})|([^;]+?))\s+from\s+[\'"]([^\'"]+)[\'"]'
-        for match in re.finditer(import_pattern, code):
+        for match in _JS_IMPORT_RE.finditer(code):
             default_import, named_imports, star_import, module = match.groups()
             
             if default_import:
@@ -389,7 +1069,7 @@ class ParserService:
                     'type': 'import',
                     'module': module,
                     'specifiers': [{'type': 'ImportDefaultSpecifier', 'local': default_import, 'imported': 'default'}],
-                    'line': ParserService._get_line_number(code, match.start())
+                    'line': ParserService._get_line_number(newlines, match.start())
                 })
             elif named_imports:
                 for specifier in named_imports.split(','):
@@ -400,164 +1080,197 @@ class ParserService:
                             'type': 'import',
                             'module': module,
                             'specifiers': [{'type': 'ImportSpecifier', 'local': local.strip(), 'imported': imported.strip()}],
-                            'line': ParserService._get_line_number(code, match.start())
+                            'line': ParserService._get_line_number(newlines, match.start())
                         })
                     else:
                         imports.append({
                             'type': 'import',
                             'module': module,
                             'specifiers': [{'type': 'ImportSpecifier', 'local': specifier, 'imported': specifier}],
-                            'line': ParserService._get_line_number(code, match.start())
+                            'line': ParserService._get_line_number(newlines, match.start())
                         })
             elif star_import:
                 imports.append({
                     'type': 'import',
                     'module': module,
                     'specifiers': [{'type': 'ImportNamespaceSpecifier', 'local': star_import.strip(), 'imported': '*'}],
-                    'line': ParserService._get_line_number(code, match.start())
+                    'line': ParserService._get_line_number(newlines, match.start())
                 })
         
-        # CommonJS requires: const x = require('module')
-        require_pattern = r'(?:const|let|var)\s+(\w+)\s*=\s*require\s*\(\s*[\'"]([^\'"]+)[\'"]\s*\)'
-        for match in re.finditer(require_pattern, code):
-            local, module = match.groups()
-            imports.append({
-                'type': 'require',
-                'module': module,
-                'specifiers': [{'type': 'RequireSpecifier', 'local': local, 'imported': 'default'}],
-                'line': ParserService._get_line_number(code, match.start())
+        return imports
+    
+    @staticmethod
+    def _extract_js_declarations_regex(code: str, newlines: list) -> Tuple[list, list, list]:
+        """Extract CommonJS requires, arrow functions and React components in one scan"""
+        if 'require' not in code and '=>' not in code:
+            return [], [], []
+        
+        requires = []
+        arrows = []
+        components = []
+        
+        for match in _JS_DECLARATION_RE.finditer(code):
+            name = match.group('name')
+            line = ParserService._get_line_number(newlines, match.start())
+            
+            if match.lastgroup == 'require':
+                requires.append({
+                    'type': 'require',
+                    'module': match.group('module'),
+                    'specifiers': [{'type': 'RequireSpecifier', 'local': name, 'imported': 'default'}],
+                    'line': line
+                })
+                continue
+            
+            params = match.group('params')
+            arrows.append({
+                'name': name,
+                'type': 'arrow',
+                'params': [p.strip() for p in params.split(',') if p.strip()],
+                'line': line
             })
+            
+            # React components: arrow functions with a capitalized name
+            if 'A' <= name[0] <= 'Z':
+                components.append({
+                    'name': name,
+                    'type': 'react_component',
+                    'params': ['props'],
+                    'line': line
+                })
         
-        return imports
+        return requires, arrows, components
     
     @staticmethod
-    def _extract_js_classes_regex(code: str) -> list:
+    def _extract_js_classes_regex(code: str, newlines: list) -> list:
         """Extract JavaScript classes using regex patterns"""
+        if 'class' not in code:
+            return []
+        
         classes = []
         
         # Class declarations: class MyClass { ... }
-        class_pattern = r'class\s+(\w+)(?:\s+extends\s+(\w+))?\s*\{([^}]*)\}'
-        for match in re.finditer(class_pattern, code, re.DOTALL):
-            class_name, super_class, class_body = match.groups()
+        for match in _JS_CLASS_HEAD_RE.finditer(code):
+            class_name, super_class = match.groups()
             
-            # Extract methods from class body
+            # Walk the body up to its matching brace; method heads only count
+            # at the top level, anything deeper is a method or block body
             methods = []
-            method_pattern = r'(\w+)\s*\([^)]*\)\s*\{[^}]*\}'
-            for method_match in re.finditer(method_pattern, class_body):
-                methods.append({
-                    'name': method_match.group(1),
-                    'kind': 'method',
-                    'static': 'static' in method_match.group(0),
-                    'line': ParserService._get_line_number(code, match.start() + method_match.start())
-                })
-            
-            # Extract constructor
-            if 'constructor(' in class_body:
-                methods.append({
-                    'name': 'constructor',
-                    'kind': 'constructor',
-                    'static': False,
-                    'line': ParserService._get_line_number(code, match.start())
-                })
+            depth = 0
+            for token in _JS_CLASS_BODY_TOKEN_RE.finditer(code, match.end()):
+                kind = token.lastgroup
+                if kind == 'close':
+                    if not depth:
+                        break
+                    depth -= 1
+                    continue
+                
+                if kind == 'method' and not depth:
+                    name = token.group('name')
+                    methods.append({
+                        'name': name,
+                        'kind': 'constructor' if name == 'constructor' else 'method',
+                        'static': token.group('static') is not None,
+                        'line': ParserService._get_line_number(newlines, token.start())
+                    })
+                depth += 1
             
             classes.append({
                 'name': class_name,
                 'superClass': super_class,
                 'methods': methods,
-                'line': ParserService._get_line_number(code, match.start())
+                'line': ParserService._get_line_number(newlines, match.start())
             })
         
         return classes
     
     @staticmethod
-    def _extract_js_functions_regex(code: str) -> list:
+    def _extract_js_functions_regex(code: str, newlines: list) -> list:
         """Extract JavaScript functions using regex patterns"""
+        if 'function' not in code:
+            return []
+        
         functions = []
         
         # Function declarations: function myFunc() { ... }
-        func_pattern = r'function\s+(\w+)\s*\(([^)]*)\)\s*\{'
-        for match in re.finditer(func_pattern, code):
+        for match in _JS_FUNCTION_RE.finditer(code):
             func_name, params = match.groups()
             functions.append({
                 'name': func_name,
                 'type': 'function',
                 'params': [p.strip() for p in params.split(',') if p.strip()],
-                'line': ParserService._get_line_number(code, match.start())
-            })
-        
-        # Arrow functions: const myFunc = () => { ... }
-        arrow_pattern = r'(?:const|let|var)\s+(\w+)\s*=\s*\(([^)]*)\)\s*=>\s*\{'
-        for match in re.finditer(arrow_pattern, code):
-            func_name, params = match.groups()
-            functions.append({
-                'name': func_name,
-                'type': 'arrow',
-                'params': [p.strip() for p in params.split(',') if p.strip()],
-                'line': ParserService._get_line_number(code, match.start())
-            })
-        
-        # React components: const MyComponent = () => { ... }
-        react_pattern = r'(?:const|let|var)\s+([A-Z][\w]*)\s*=\s*(?:\([^)]*\)|\(\))\s*=>\s*\{'
-        for match in re.finditer(react_pattern, code):
-            comp_name = match.group(1)
-            functions.append({
-                'name': comp_name,
-                'type': 'react_component',
-                'params': ['props'],
-                'line': ParserService._get_line_number(code, match.start())
+                'line': ParserService._get_line_number(newlines, match.start())
             })
         
         return functions
     
     @staticmethod
-    def _extract_js_exports_regex(code: str) -> list:
+    def _extract_js_exports_regex(code: str, newlines: list) -> list:
         """Extract JavaScript exports using regex patterns"""
+        # Also covers module.exports
+        if 'export' not in code:
+            return []
+        
         exports = []
         
         # Named exports: export { name1, name2 }
-        named_export_pattern = r'export\s+\{([^}]+)\}'
-        for match in re.finditer(named_export_pattern, code):
+        for match in _JS_NAMED_EXPORT_RE.finditer(code):
             exports_list = match.group(1)
             for export_name in exports_list.split(','):
                 exports.append({
                     'type': 'ExportNamedDeclaration',
                     'declaration': export_name.strip(),
-                    'line': ParserService._get_line_number(code, match.start())
+                    'line': ParserService._get_line_number(newlines, match.start())
                 })
         
         # Default exports: export default MyComponent
-        default_export_pattern = r'export\s+default\s+(\w+)'
-        for match in re.finditer(default_export_pattern, code):
+        for match in _JS_DEFAULT_EXPORT_RE.finditer(code):
             export_name = match.group(1)
             exports.append({
                 'type': 'ExportDefaultDeclaration',
                 'declaration': export_name,
-                'line': ParserService._get_line_number(code, match.start())
+                'line': ParserService._get_line_number(newlines, match.start())
             })
         
         # Module.exports: module.exports = { ... }
-        module_export_pattern = r'module\.exports\s*=\s*(\w+|{)'
-        for match in re.finditer(module_export_pattern, code):
+        for match in _JS_MODULE_EXPORT_RE.finditer(code):
             exports.append({
                 'type': 'ModuleExports',
                 'declaration': match.group(1),
-                'line': ParserService._get_line_number(code, match.start())
+                'line': ParserService._get_line_number(newlines, match.start())
             })
         
         return exports
     
     @staticmethod
-    def _get_line_number(code: str, position: int) -> int:
+    def _newline_offsets(code: str) -> list:
+        """Get the sorted offsets of every newline, for _get_line_number"""
+        return [match.start() for match in _NEWLINE_RE.finditer(code)]
+    
+    @staticmethod
+    def _get_line_number(newlines: list, position: int) -> int:
         """Get line number from character position"""
-        return code[:position].count('\n') + 1
+        # Number of newlines before position, found by binary search
+        return bisect_left(newlines, position) + 1
     
     # Python-specific methods (unchanged from original)
     @staticmethod
-    def _extract_python_imports(tree: ast.AST) -> list:
-        """Extract import statements from Python AST"""
+    def _extract_python_definitions(tree: ast.AST) -> Tuple[list, list]:
+        """Extract import statements and class definitions from Python AST in one walk"""
         imports = []
+        classes = []
         
-        for node in ast.walk(tree):
+        # Breadth-first like ast.walk (so results keep its order), but through
+        # statement lists only; except handlers and match cases are the only
+        # non-statement nodes on the way
+        pending = deque([tree])
+        while pending:
+            node = pending.popleft()
+            for field in _PY_STATEMENT_FIELDS:
+                children = getattr(node, field, None)
+                if children:
+                    pending.extend(children)
+            
             if isinstance(node, ast.Import):
                 for alias in node.names:
                     imports.append({
@@ -576,48 +1289,43 @@ class ParserService:
                         'alias': alias.asname,
                         'line': node.lineno
                     })
+            elif isinstance(node, ast.ClassDef):
+                classes.append(ParserService._extract_python_class(node))
         
-        return imports
+        return imports, classes
     
     @staticmethod
-    def _extract_python_classes(tree: ast.AST) -> list:
-        """Extract class definitions from Python AST"""
-        classes = []
+    def _extract_python_class(node: ast.ClassDef) -> dict:
+        """Extract a single class definition from Python AST"""
+        # Get parent classes
+        bases = [ParserService._get_node_name(base) for base in node.bases]
         
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                # Get parent classes
-                bases = [ParserService._get_node_name(base) for base in node.bases]
-                
-                # Get methods
-                methods = []
-                for item in node.body:
-                    if isinstance(item, ast.FunctionDef):
-                        methods.append({
-                            'name': item.name,
-                            'line': item.lineno,
-                            'args': [arg.arg for arg in item.args.args],
-                            'decorators': [ParserService._get_node_name(dec) for dec in item.decorator_list]
-                        })
-                
-                # Get class variables/fields
-                fields = []
-                for item in node.body:
-                    if isinstance(item, ast.Assign):
-                        for target in item.targets:
-                            if isinstance(target, ast.Name):
-                                fields.append(target.id)
-                
-                classes.append({
-                    'name': node.name,
-                    'line': node.lineno,
-                    'bases': bases,
-                    'methods': methods,
-                    'fields': fields,
-                    'decorators': [ParserService._get_node_name(dec) for dec in node.decorator_list]
+        # Get methods and class variables/fields in one pass; ast.parse builds
+        # exact node types, so type() identity checks are safe here
+        methods = []
+        fields = []
+        for item in node.body:
+            item_type = type(item)
+            if item_type is ast.FunctionDef:
+                methods.append({
+                    'name': item.name,
+                    'line': item.lineno,
+                    'args': [arg.arg for arg in item.args.args],
+                    'decorators': [ParserService._get_node_name(dec) for dec in item.decorator_list]
                 })
+            elif item_type is ast.Assign:
+                for target in item.targets:
+                    if type(target) is ast.Name:
+                        fields.append(target.id)
         
-        return classes
+        return {
+            'name': node.name,
+            'line': node.lineno,
+            'bases': bases,
+            'methods': methods,
+            'fields': fields,
+            'decorators': [ParserService._get_node_name(dec) for dec in node.decorator_list]
+        }
     
     @staticmethod
     def _extract_python_functions(tree: ast.AST) -> list:
@@ -638,11 +1346,16 @@ class ParserService:
     @staticmethod
     def _get_node_name(node) -> str:
         """Extract name from AST node"""
-        if isinstance(node, ast.Name):
-            return node.id
-        elif isinstance(node, ast.Attribute):
-            return f"{ParserService._get_node_name(node.value)}.{node.attr}"
-        elif isinstance(node, ast.Call):
-            return ParserService._get_node_name(node.func)
-        else:
-            return str(node)
\ No newline at end of file
+        # Walk down attribute chains and calls collecting parts, then join once
+        parts = []
+        while True:
+            if isinstance(node, ast.Attribute):
+                parts.append(node.attr)
+                node = node.value
+            elif isinstance(node, ast.Call):
+                node = node.func
+            else:
+                break
+        
+        parts.append(node.id if isinstance(node, ast.Name) else str(node))
+        return '.'.join(reversed(parts))
\ No newline at end of file
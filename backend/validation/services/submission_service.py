@@ -3,22 +3,38 @@ Submission Service - Main orchestrator for code validation
 Uses tiered validation engine for difficulty-aware validation
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List
 from django.utils import timezone
 import time
 import logging
 
 logger = logging.getLogger('validation')
 
+from validation.services._cache import BoundedCache
 from validation.services.parser_service import ParserService
 from validation.services.tiered_validator import EnhancedValidationEngine
 from validation.scorers.aggregator import ScoreAggregator
 from validation.feedback.feedback_generator import FeedbackGenerator
 
+# Programming language of each framework's submissions
+_LANGUAGE_MAP = {
+    'django': 'python',
+    'react': 'javascript',
+    'angular': 'typescript',
+    'express': 'javascript'
+}
+
+# Validation specs built per problem, keyed on (pk, updated_at, framework name)
+SPEC_CACHE_SIZE = 512
+_spec_cache = BoundedCache(SPEC_CACHE_SIZE)
+
 
 class SubmissionService:
     """Main service to validate code submissions using tiered validation"""
     
+    # Validators keep no per-call state, so one engine serves every submission
+    _engine = EnhancedValidationEngine()
+    
     @staticmethod
     def validate_submission(submission) -> Dict[str, Any]:
         """
@@ -30,44 +46,84 @@ class SubmissionService:
         Returns:
             dict: Complete validation results
         """
-        sub_id = str(submission.submission_id)[:8]
-        logger.info(f"[{sub_id}] Starting validation")
-        start = time.time()
+        sub_id = submission.submission_id.hex[:8]
+        _dbg = logger.isEnabledFor(logging.DEBUG)
+        logger.info("[%s] Starting validation", sub_id)
+        start_ns = time.perf_counter_ns()
         
         problem = submission.problem
         code = submission.code
         
         # DEBUG: Log the code being validated
-        logger.debug(f"[{sub_id}] Code snippet: {code[:200]}...")
+        if _dbg:
+            logger.debug("[%s] Code snippet: %s...", sub_id, code[:200])
         
         # Determine language
         language = SubmissionService._determine_language(problem.framework.name)
         
         # Parse code
-        parse_start = time.time()
+        parse_start_ns = time.perf_counter_ns()
         parsed_code = ParserService.parse_code(code, language)
-        parse_ms = (time.time() - parse_start) * 1000
-        logger.debug(f"[{sub_id}] Parse: {parse_ms:.0f}ms")
+        parse_ns = time.perf_counter_ns() - parse_start_ns
         
-        # DEBUG: Log parsed imports for troubleshooting
-        if parsed_code.get('success'):
-            imports = parsed_code.get('imports', [])
-            logger.debug(f"[{sub_id}] Parsed imports: {imports}")
-            
-            # Extract import details for debugging
-            import_details = []
-            for imp in imports:
-                if imp['type'] == 'import':
-                    import_details.append(f"import {imp['module']}")
-                elif imp['type'] == 'from_import':
-                    import_details.append(f"from {imp['module']} import {imp['name']}")
-                elif imp['type'] == 'require':
-                    import_details.append(f"require('{imp['module']}')")
-            logger.debug(f"[{sub_id}] Import details: {import_details}")
+        return SubmissionService._validate_parsed(submission, parsed_code, parse_ns, start_ns)
+    
+    @staticmethod
+    def validate_submissions(submissions) -> List[Dict[str, Any]]:
+        """
+        Validate several submissions, e.g. when regrading a problem
+        
+        Code of the same language is parsed in one ParserService.parse_many
+        batch before any submission is validated, so the per-submission
+        timing logs cover validation only. Validation specs are cached per
+        problem. Pass a queryset with select_related('problem__framework')
+        to avoid a query per submission.
+        
+        Args:
+            submissions: Iterable of Submission model instances
+        
+        Returns:
+            list: Validation results in the order of submissions
+        """
+        submissions = list(submissions)
+        logger.info("Starting validation of %d submissions", len(submissions))
+        
+        # Group submissions by language so each group is parsed in one batch
+        by_language = {}
+        for index, submission in enumerate(submissions):
+            language = SubmissionService._determine_language(submission.problem.framework.name)
+            by_language.setdefault(language, []).append(index)
+        
+        parsed = [None] * len(submissions)
+        parse_times = [0] * len(submissions)
+        for language, indices in by_language.items():
+            parse_start_ns = time.perf_counter_ns()
+            results = ParserService.parse_many([submissions[i].code for i in indices], language)
+            # Each submission is charged an equal share of its batch's parse time
+            share_ns = (time.perf_counter_ns() - parse_start_ns) // len(indices)
+            for index, parsed_code in zip(indices, results):
+                parsed[index] = parsed_code
+                parse_times[index] = share_ns
+        
+        results = []
+        for submission, parsed_code, parse_ns in zip(submissions, parsed, parse_times):
+            logger.info("[%s] Starting validation", submission.submission_id.hex[:8])
+            start_ns = time.perf_counter_ns()
+            results.append(SubmissionService._validate_parsed(submission, parsed_code, parse_ns, start_ns))
+        
+        return results
+    
+    @staticmethod
+    def _validate_parsed(submission, parsed_code: Dict[str, Any], parse_ns: int, start_ns: int) -> Dict[str, Any]:
+        """Validate already parsed submission code and build the results dict"""
+        sub_id = submission.submission_id.hex[:8]
+        _dbg = logger.isEnabledFor(logging.DEBUG)
+        problem = submission.problem
+        code = submission.code
         
         # If parsing failed, return syntax error
         if not parsed_code.get('success'):
-            logger.warning(f"[{sub_id}] Parse failed: {parsed_code.get('error')}")
+            logger.warning("[%s] Parse failed: %s", sub_id, parsed_code.get('error'))
             return {
                 'verdict': 'syntax_error',
                 'score': 0.0,
@@ -85,38 +141,44 @@ class SubmissionService:
                     'total_score': 0.0
                 }),
                 'matched_patterns': [],
-                'execution_time_ms': parse_ms
+                'execution_time_ms': parse_ns / 1e6
             }
         
+        # DEBUG: Log parse timing and imports for troubleshooting
+        if _dbg:
+            logger.debug("[%s] Parse: %.0fms", sub_id, parse_ns / 1e6)
+            imports = parsed_code.get('imports', [])
+            logger.debug("[%s] Parsed imports: %s", sub_id, imports)
+            
+            # Extract import details for debugging
+            import_details = []
+            for imp in imports:
+                if imp['type'] == 'import':
+                    import_details.append(f"import {imp['module']}")
+                elif imp['type'] == 'from_import':
+                    import_details.append(f"from {imp['module']} import {imp['name']}")
+                elif imp['type'] == 'require':
+                    import_details.append(f"require('{imp['module']}')")
+            logger.debug("[%s] Import details: %s", sub_id, import_details)
+        
         # Prepare validation spec for tiered validator
-        validation_spec = {
-            'difficulty': problem.difficulty,
-            'framework': problem.framework.name,
-            'required_imports': problem.validation_spec.get('required_imports', []),
-            'required_structure': problem.validation_spec.get('required_structure', {}),
-            'behavior_patterns': problem.validation_spec.get('behavior_patterns', []),
-            'scoring': {
-                'import_weight': float(problem.import_weight),
-                'structure_weight': float(problem.structure_weight),
-                'behavior_weight': float(problem.behavior_weight)
-            },
-            'passing_score': float(problem.passing_score)
-        }
+        validation_spec = SubmissionService._get_validation_spec(problem)
         
         # DEBUG: Log validation spec for troubleshooting
-        logger.debug(f"[{sub_id}] Validation spec - Difficulty: {validation_spec['difficulty']}, "
-                    f"Required imports: {validation_spec['required_imports']}")
+        if _dbg:
+            logger.debug("[%s] Validation spec - Difficulty: %s, Required imports: %s",
+                         sub_id, validation_spec['difficulty'], validation_spec['required_imports'])
         
         # Run tiered validation engine
-        validate_start = time.time()
-        engine = EnhancedValidationEngine()
-        tiered_results = engine.validate_submission(parsed_code, validation_spec, code)
-        validate_ms = (time.time() - validate_start) * 1000
-        logger.debug(f"[{sub_id}] Validation: {validate_ms:.0f}ms")
+        validate_start_ns = time.perf_counter_ns()
+        tiered_results = SubmissionService._engine.validate_submission(parsed_code, validation_spec, code)
+        validate_ns = time.perf_counter_ns() - validate_start_ns
+        if _dbg:
+            logger.debug("[%s] Validation: %.0fms", sub_id, validate_ns / 1e6)
         
         # Check if there was an error in validation
         if 'error' in tiered_results:
-            logger.error(f"[{sub_id}] Validation error: {tiered_results['error']}")
+            logger.error("[%s] Validation error: %s", sub_id, tiered_results['error'])
             return {
                 'verdict': 'failed',
                 'score': 0.0,
@@ -130,7 +192,7 @@ class SubmissionService:
                     'column': None
                 }],
                 'matched_patterns': [],
-                'execution_time_ms': parse_ms + validate_ms
+                'execution_time_ms': (parse_ns + validate_ns) / 1e6
             }
         
         # Determine verdict based on score and passing threshold
@@ -153,28 +215,26 @@ class SubmissionService:
         }
         
         # DEBUG: Log validation results for troubleshooting
-        logger.debug(f"[{sub_id}] Validation results - "
-                    f"Imports: {validation_results['imports'].get('score', 0):.1f}, "
-                    f"Structure: {validation_results['structure'].get('score', 0):.1f}, "
-                    f"Behavior: {validation_results['behavior'].get('score', 0):.1f}, "
-                    f"Overall: {overall_score:.1f}")
+        if _dbg:
+            logger.debug("[%s] Validation results - Imports: %.1f, Structure: %.1f, Behavior: %.1f, Overall: %.1f",
+                         sub_id,
+                         validation_results['imports'].get('score', 0),
+                         validation_results['structure'].get('score', 0),
+                         validation_results['behavior'].get('score', 0),
+                         overall_score)
         
         # Add semantic results if present (for Pro level)
         if 'semantic' in tiered_results:
             validation_results['semantic'] = tiered_results['semantic']
         
         # Add framework-specific results if present
-        for key in tiered_results:
-            if key.endswith('_specific'):
-                validation_results[key] = tiered_results[key]
+        if 'framework_specific' in tiered_results:
+            validation_results['framework_specific'] = tiered_results['framework_specific']
         
         # Generate user-friendly feedback
         feedback_data = {
+            **validation_results,
             'parse_success': True,
-            'imports': validation_results.get('imports', {}),
-            'structure': validation_results.get('structure', {}),
-            'behavior': validation_results.get('behavior', {}),
-            'semantic': validation_results.get('semantic', {}),
             'verdict': verdict,
             'total_score': overall_score,
             'difficulty': problem.difficulty,
@@ -183,8 +243,8 @@ class SubmissionService:
         
         feedback = FeedbackGenerator.generate_feedback(feedback_data)
         
-        total_ms = (time.time() - start) * 1000
-        logger.info(f"[{sub_id}] Complete: {verdict} ({overall_score:.1f}) in {total_ms:.0f}ms")
+        logger.info("[%s] Complete: %s (%.1f) in %.0fms",
+                    sub_id, verdict, overall_score, (time.perf_counter_ns() - start_ns) / 1e6)
         
         # Prepare final results
         results = {
@@ -194,7 +254,7 @@ class SubmissionService:
             'validation_results': validation_results,
             'feedback': feedback,
             'matched_patterns': tiered_results.get('matched_patterns', []),
-            'execution_time_ms': parse_ms + validate_ms,
+            'execution_time_ms': (parse_ns + validate_ns) / 1e6,
             'validator_info': {
                 'validator_used': tiered_results.get('validator_used', 'unknown'),
                 'difficulty': problem.difficulty,
@@ -204,13 +264,32 @@ class SubmissionService:
         
         return results
     
+    @staticmethod
+    def _get_validation_spec(problem) -> Dict[str, Any]:
+        """Return the tiered validator spec for a problem, rebuilt only when the problem changes"""
+        key = (problem.pk, problem.updated_at, problem.framework.name)
+        spec = _spec_cache.get(key)
+        if spec is not None:
+            return spec
+        
+        spec = {
+            'difficulty': problem.difficulty,
+            'framework': problem.framework.name,
+            'required_imports': problem.validation_spec.get('required_imports', []),
+            'required_structure': problem.validation_spec.get('required_structure', {}),
+            'behavior_patterns': problem.validation_spec.get('behavior_patterns', []),
+            'scoring': {
+                'import_weight': float(problem.import_weight),
+                'structure_weight': float(problem.structure_weight),
+                'behavior_weight': float(problem.behavior_weight)
+            },
+            'passing_score': float(problem.passing_score)
+        }
+        
+        _spec_cache.put(key, spec)
+        return spec
+    
     @staticmethod
     def _determine_language(framework_name: str) -> str:
         """Determine programming language from framework name"""
-        language_map = {
-            'django': 'python',
-            'react': 'javascript',
-            'angular': 'typescript',
-            'express': 'javascript'
-        }
-        return language_map.get(framework_name, 'python')
\ No newline at end of file
+        return _LANGUAGE_MAP.get(framework_name, 'python')
\ No newline at end of file
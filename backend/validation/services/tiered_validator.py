@@ -4,13 +4,31 @@ Supports: Django (Python) and React/Express/Angular (JavaScript)
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Set, Tuple
+from collections.abc import Mapping
+from typing import Callable, Dict, List, Any, Optional, Set, Tuple
+from functools import lru_cache
 import re
 import logging
 from enum import Enum
 
+from validation.services._cache import BoundedCache, source_digest
+from validation.services.parser_service import ParserService
+
 logger = logging.getLogger('validation')
 
+# Semantic analysis results keyed on (framework, parser used, SHA-256 of the code)
+SEMANTICS_CACHE_SIZE = 256
+_semantics_cache = BoundedCache(SEMANTICS_CACHE_SIZE)
+
+# Parse results the semantic analyzers read; cached analyses hold only these, not the AST
+_SEMANTIC_PARSE_KEYS = ('classes', 'functions', 'raw_code')
+
+
+@lru_cache(maxsize=1024)
+def _pattern_keywords(text: str) -> Tuple[str, ...]:
+    """Lowercased keywords (words longer than 3 chars) of a behavior pattern, cached per pattern text"""
+    return tuple(kw.lower() for kw in text.split() if len(kw) > 3)
+
 
 # ===== Base Validator Classes (ADDED BACK) =====
 
@@ -55,8 +73,34 @@ class BaseValidator(ABC):
         
         return imports
 
-    def _is_import_match_enhanced(self, required: str, found_imports: List[str]) -> bool:
+    def _analyze_semantics(self, framework: str, code: str, parsed_code: Dict) -> Dict[str, Any]:
+        """Run the framework's semantic analyzer, reusing the result for recently seen code"""
+        # A regex fallback parse extracts different classes and functions than a full parse
+        key = (framework.lower(), parsed_code.get('parser_used'), source_digest(code))
+        semantics = _semantics_cache.get(key)
+        if semantics is not None:
+            return semantics
+        
+        parse_results = {name: parsed_code[name] for name in _SEMANTIC_PARSE_KEYS if name in parsed_code}
+        analyzer = FrameworkAnalyzerFactory.create_analyzer(framework)
+        semantics = analyzer.analyze(code, parse_results)
+        
+        _semantics_cache.put(key, semantics)
+        return semantics
+
+    def _index_by_name(self, items: List[Dict]) -> Dict[str, Dict]:
+        """Map each name to its first item, as a linear search by name would find it"""
+        index = {}
+        for item in items:
+            index.setdefault(item['name'], item)
+        return index
+
+    def _is_import_match_enhanced(self, required: str, found_imports: Set[str]) -> bool:
         """Enhanced import matching - UNCHANGED"""
+        # An exact hit satisfies every substring rule below
+        if required in found_imports:
+            return True
+        
         if required.startswith('.'):
             required_abs = required.lstrip('.')
             variations = [
@@ -86,7 +130,7 @@ class BaseValidator(ABC):
                 'details': ["No imports required for validation"]
             }
         
-        found_imports = self._extract_all_imports(parsed_code)
+        found_imports = set(self._extract_all_imports(parsed_code))
         missing = []
         
         for required in required_imports:
@@ -114,8 +158,7 @@ class BeginnerValidator(BaseValidator):
         
         # Add lightweight semantic analysis
         if framework != 'unknown':
-            analyzer = FrameworkAnalyzerFactory.create_analyzer(framework)
-            semantics = analyzer.analyze(code, parsed_code)
+            semantics = self._analyze_semantics(framework, code, parsed_code)
             parsed_code['semantics'] = semantics
             parsed_code['framework'] = framework
         
@@ -140,13 +183,13 @@ class BeginnerValidator(BaseValidator):
         # CLASS VALIDATION
         # ====================================
         if 'classes' in required_structure and required_structure['classes']:
+            class_index = self._index_by_name(parsed_code.get('classes', []))
             for class_spec in required_structure['classes']:
                 class_name = class_spec.get('name') if isinstance(class_spec, dict) else class_spec
                 
                 # Check if class exists
                 total_checks += 1
-                found_class = next((cls for cls in parsed_code.get('classes', []) 
-                                if cls['name'] == class_name), None)
+                found_class = class_index.get(class_name)
                 
                 if not found_class:
                     details.append(f"✗ Class '{class_name}' not found")
@@ -171,7 +214,7 @@ class BeginnerValidator(BaseValidator):
                     
                     # Check required methods
                     if 'methods' in class_spec:
-                        class_methods = [m['name'] for m in found_class.get('methods', [])]
+                        class_methods = {m['name'] for m in found_class.get('methods', [])}
                         
                         for required_method in class_spec['methods']:
                             total_checks += 1
@@ -204,13 +247,15 @@ class BeginnerValidator(BaseValidator):
         # FUNCTION VALIDATION
         # ====================================
         if 'functions' in required_structure and required_structure['functions']:
+            func_index = self._index_by_name(parsed_code.get('functions', []))
+            export_names = {exp.get('declaration') for exp in parsed_code.get('exports', [])}
+            prop_types_imported = None
             for func_spec in required_structure['functions']:
                 func_name = func_spec.get('name') if isinstance(func_spec, dict) else func_spec
                 
                 # Check if function exists
                 total_checks += 1
-                found_func = next((f for f in parsed_code.get('functions', []) 
-                                if f['name'] == func_name), None)
+                found_func = func_index.get(func_name)
                 
                 if not found_func:
                     details.append(f"✗ Function '{func_name}' not found")
@@ -252,8 +297,10 @@ class BeginnerValidator(BaseValidator):
                     # Check for PropTypes (React specific)
                     if func_spec.get('has_prop_types'):
                         total_checks += 1
-                        # Simple check: look for PropTypes in code
-                        if 'PropTypes' in str(parsed_code.get('imports', [])):
+                        # Simple check: look for PropTypes in the imports, once per validation
+                        if prop_types_imported is None:
+                            prop_types_imported = 'PropTypes' in str(parsed_code.get('imports', []))
+                        if prop_types_imported:
                             checks_passed += 1
                             details.append(f"  ✓ PropTypes imported")
                         else:
@@ -262,8 +309,7 @@ class BeginnerValidator(BaseValidator):
                     # Check for export
                     if func_spec.get('has_export'):
                         total_checks += 1
-                        exports = parsed_code.get('exports', [])
-                        if any(exp.get('declaration') == func_name for exp in exports):
+                        if func_name in export_names:
                             checks_passed += 1
                             details.append(f"  ✓ Function is exported")
                         else:
@@ -301,11 +347,12 @@ class BeginnerValidator(BaseValidator):
         details = []
         matched = 0
         total = len(behavior_patterns)
+        code_lower = code.lower()
         
         for pattern in behavior_patterns:
             if isinstance(pattern, str):
                 # Legacy string pattern - use enhanced keyword matching
-                result = self._validate_string_pattern_enhanced(pattern, code, semantics, framework)
+                result = self._validate_string_pattern_enhanced(pattern, code_lower, semantics, framework)
                 if result:
                     matched += 1
                     details.append(f"✓ {pattern}")
@@ -314,7 +361,7 @@ class BeginnerValidator(BaseValidator):
             
             elif isinstance(pattern, dict) and pattern.get('type'):
                 # Structured pattern - use basic semantic validation
-                result = self._validate_structured_pattern_basic(pattern, semantics, code, framework)
+                result = self._validate_structured_pattern_basic(pattern, semantics, code, framework, code_lower)
                 if result['passed']:
                     matched += 1
                     details.append(f"✓ {result['message']}")
@@ -323,8 +370,7 @@ class BeginnerValidator(BaseValidator):
             else:
                 # Fallback to keyword matching
                 pattern_str = pattern if isinstance(pattern, str) else str(pattern)
-                keywords = [kw.lower() for kw in pattern_str.split() if len(kw) > 3]
-                if any(keyword in code.lower() for keyword in keywords):
+                if any(keyword in code_lower for keyword in _pattern_keywords(pattern_str)):
                     matched += 1
                     details.append(f"✓ {pattern_str}")
                 else:
@@ -338,18 +384,14 @@ class BeginnerValidator(BaseValidator):
             'details': details
         }
     
-    def _validate_string_pattern_enhanced(self, pattern: str, code: str, semantics: Dict, framework: str) -> bool:
+    def _validate_string_pattern_enhanced(self, pattern: str, code_lower: str, semantics: Dict, framework: str) -> bool:
         """
         Enhanced string pattern matching with semantic awareness
         """
         pattern_lower = pattern.lower()
-        code_lower = code.lower()
-        
-        # Extract keywords (words > 3 chars)
-        keywords = [kw for kw in pattern.split() if len(kw) > 3]
         
-        # Basic keyword matching
-        basic_match = any(keyword.lower() in code_lower for keyword in keywords)
+        # Basic keyword matching (words > 3 chars)
+        basic_match = any(keyword in code_lower for keyword in _pattern_keywords(pattern))
         
         if not basic_match:
             return False
@@ -399,7 +441,7 @@ class BeginnerValidator(BaseValidator):
         # Default to keyword match
         return True
     
-    def _validate_structured_pattern_basic(self, pattern: Dict, semantics: Dict, code: str, framework: str) -> Dict:
+    def _validate_structured_pattern_basic(self, pattern: Dict, semantics: Dict, code: str, framework: str, code_lower: str) -> Dict:
         """
         Basic structured pattern validation for beginners
         """
@@ -473,8 +515,7 @@ class BeginnerValidator(BaseValidator):
         
         # Fallback to keyword matching
         description = pattern.get('description', str(pattern))
-        keywords = [kw.lower() for kw in description.split() if len(kw) > 3]
-        if any(keyword in code.lower() for keyword in keywords):
+        if any(keyword in code_lower for keyword in _pattern_keywords(description)):
             return {'passed': True, 'message': description}
         else:
             return {'passed': False, 'message': description}
@@ -502,11 +543,22 @@ class LanguageType(Enum):
 class FrameworkAnalyzerFactory:
     """Factory to create framework-specific semantic analyzers"""
     
+    # Analyzers keep no per-call state, so one instance per framework is shared
+    _analyzers: Dict[str, 'BaseSemanticAnalyzer'] = {}
+    
     @staticmethod
     def create_analyzer(framework: str):
-        """Create appropriate analyzer for framework"""
+        """Return the shared analyzer for framework, creating it on first use"""
         framework_lower = framework.lower()
-        
+        analyzer = FrameworkAnalyzerFactory._analyzers.get(framework_lower)
+        if analyzer is None:
+            analyzer = FrameworkAnalyzerFactory._build_analyzer(framework_lower)
+            FrameworkAnalyzerFactory._analyzers[framework_lower] = analyzer
+        return analyzer
+    
+    @staticmethod
+    def _build_analyzer(framework_lower: str):
+        """Create appropriate analyzer for a lowercased framework name"""
         if framework_lower == FrameworkType.DJANGO.value:
             return DjangoSemanticAnalyzer()
         elif framework_lower == FrameworkType.REACT.value:
@@ -521,6 +573,50 @@ class FrameworkAnalyzerFactory:
             return BaseSemanticAnalyzer()
 
 
+class LazySemantics(Mapping):
+    """
+    Semantic analysis results, each extracted on first access
+    
+    Validators only read the few keys their patterns need, so the other
+    extractors never run. Unknown keys behave as missing, like a dict.
+    """
+    
+    def __init__(self, extractors: Dict[str, Callable[[], Any]]):
+        self._extractors = extractors
+        self._values = {}
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in self._values:
+            return self._values[key]
+        value = self._extractors[key]()
+        self._values[key] = value
+        return value
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        # Checked up front so a KeyError raised inside an extractor isn't mistaken for a missing key
+        if key not in self._extractors:
+            return default
+        return self[key]
+    
+    def __contains__(self, key: object) -> bool:
+        return key in self._extractors
+    
+    def __iter__(self):
+        return iter(self._extractors)
+    
+    def __len__(self) -> int:
+        return len(self._extractors)
+
+
+# Language detection hints
+_PYTHON_SYNTAX_RE = re.compile(r'\bimport\s+|from\s+\w+\s+import|\bdef\s+\w+\s*\(|class\s+\w+')
+_TYPESCRIPT_SYNTAX_RE = re.compile(r'\binterface\s+\w+|type\s+\w+|:\s*\w+[\[\]]?')
+_JAVASCRIPT_SYNTAX_RE = re.compile(r'\bconst\s+|let\s+|var\s+|function\s+\w+|\bexport\s+')
+
+# Newline offsets of recently analyzed code, so each file is scanned once however many lines are looked up
+_newline_offsets = lru_cache(maxsize=32)(ParserService._newline_offsets)
+
+
 class BaseSemanticAnalyzer(ABC):
     """Base class for all semantic analyzers"""
     
@@ -532,112 +628,280 @@ class BaseSemanticAnalyzer(ABC):
     def _detect_language(self, code: str) -> LanguageType:
         """Detect programming language from code"""
         # Python detection
-        if re.search(r'\bimport\s+|from\s+\w+\s+import|\bdef\s+\w+\s*\(|class\s+\w+', code):
+        if _PYTHON_SYNTAX_RE.search(code):
             return LanguageType.PYTHON
         # TypeScript detection
-        elif re.search(r'\binterface\s+\w+|type\s+\w+|:\s*\w+[\[\]]?', code):
+        elif _TYPESCRIPT_SYNTAX_RE.search(code):
             return LanguageType.TYPESCRIPT
         # JavaScript detection
-        elif re.search(r'\bconst\s+|let\s+|var\s+|function\s+\w+|\bexport\s+', code):
+        elif _JAVASCRIPT_SYNTAX_RE.search(code):
             return LanguageType.JAVASCRIPT
         return LanguageType.UNKNOWN
+    
+    def _line_of(self, code: str, pos: int) -> int:
+        """1-based line number of offset pos in code"""
+        return ParserService._get_line_number(_newline_offsets(code), pos)
+
+
+def _field_declarations(module: str, field_types: List[str]) -> Tuple[Dict[str, int], re.Pattern]:
+    """
+    Compile a single scan for `name = [module.]FieldType(params)` declarations
+    
+    Returns each field type's position in field_types and the pattern. The
+    match is a lookahead, so a declaration nested in another's arguments is
+    still found; the leading word boundary stops a failed match being
+    retried at every offset inside an identifier.
+    """
+    pattern = re.compile(
+        rf'\b(?=(\w+)\s*=\s*({module}\.)?({"|".join(field_types)})\s*\(([^)]*)\))',
+        re.DOTALL
+    )
+    return {field_type: index for index, field_type in enumerate(field_types)}, pattern
+
+
+_MODEL_FIELDS = _field_declarations('models', [
+    'CharField', 'TextField', 'IntegerField', 'FloatField', 'DecimalField',
+    'BooleanField', 'DateField', 'DateTimeField', 'EmailField', 'URLField',
+    'ForeignKey', 'ManyToManyField', 'OneToOneField', 'ImageField', 'FileField',
+    'AutoField', 'BigAutoField', 'BigIntegerField', 'BinaryField', 'DurationField',
+    'GenericIPAddressField', 'PositiveIntegerField', 'PositiveSmallIntegerField',
+    'SlugField', 'SmallIntegerField', 'TimeField', 'UUIDField'
+])
+
+_SERIALIZER_FIELDS = _field_declarations('serializers', [
+    'CharField', 'IntegerField', 'BooleanField', 'DateTimeField',
+    'SerializerMethodField', 'PrimaryKeyRelatedField', 'SlugRelatedField',
+    'EmailField', 'URLField', 'FileField', 'ImageField', 'ListField',
+    'DictField', 'JSONField', 'HiddenField', 'ReadOnlyField',
+    'ModelField', 'StringRelatedField', 'HyperlinkedRelatedField',
+    'HyperlinkedIdentityField', 'MultipleChoiceField', 'ChoiceField',
+])
+
+_FORM_FIELDS = _field_declarations('forms', [
+    'CharField', 'IntegerField', 'BooleanField', 'DateField',
+    'DateTimeField', 'EmailField', 'URLField', 'ChoiceField',
+    'MultipleChoiceField', 'FileField', 'ImageField', 'ModelChoiceField',
+    'ModelMultipleChoiceField',
+])
+
+_RELATIONSHIP_PATTERNS = tuple(
+    (rel_type, re.compile(rf'\b(\w+)\s*=\s*models\.{rel_type}\s*\(([^)]*)\)', re.DOTALL))
+    for rel_type in ('ForeignKey', 'ManyToManyField', 'OneToOneField')
+)
+
+_META_CLASS_RE = re.compile(r'class\s+Meta\s*:\s*(.*?)(?=\n\S|\Z)', re.DOTALL | re.IGNORECASE)
+_META_OPTION_PATTERNS = {
+    option_name: re.compile(rf'{option_name}\s*=\s*(.+)')
+    for option_name in (
+        'verbose_name', 'verbose_name_plural', 'ordering', 'permissions',
+        'unique_together', 'indexes', 'constraints',
+    )
+}
+_RELATED_MODEL_RE = re.compile(r"to=['\"]([^'\"]+)['\"]")
+
+# Views and permissions
+_VIEW_FUNCTION_RE = re.compile(r'def\s+(\w+)\s*\([^)]*request')
+_VIEW_DECORATOR_NAMES = (
+    'login_required',
+    'permission_required',
+    'user_passes_test',
+    'staff_member_required',
+    'superuser_required',
+    'csrf_exempt',
+    'require_http_methods',
+    'require_GET',
+    'require_POST',
+    'require_safe',
+    'cache_control',
+    'never_cache',
+    'condition',
+    'etag',
+    'last_modified',
+    'vary_on_cookie',
+    'vary_on_headers',
+)
+# Name lists that share a literal prefix or word boundary are scanned as one
+# alternation: a single pass over the code instead of one search per name.
+_VIEW_DECORATOR_RE = re.compile(r'@(' + '|'.join(_VIEW_DECORATOR_NAMES) + r')')
+_PERMISSION_CLASSES_PATTERNS = (
+    re.compile(r'permission_classes\s*=\s*\[([^\]]+)\]'),
+    re.compile(r'permission_classes\s*:\s*List\[[^\]]*\]\s*=\s*\[([^\]]+)\]'),
+)
+_PERMISSION_CLASS_NAME_RE = re.compile(r'([A-Z][A-Za-z]+Permission|IsAuthenticated|AllowAny|IsAdminUser)')
+_AUTHENTICATION_CLASSES_PATTERNS = (
+    re.compile(r'authentication_classes\s*=\s*\[([^\]]+)\]'),
+    re.compile(r'authentication_classes\s*:\s*List\[[^\]]*\]\s*=\s*\[([^\]]+)\]'),
+)
+_AUTHENTICATION_CLASS_NAME_RE = re.compile(r'([A-Z][A-Za-z]+Authentication|TokenAuthentication|SessionAuthentication|BasicAuthentication)')
+_LOGIN_REQUIRED_RE = re.compile(r'@login_required|login_required\(')
+_PERMISSION_REQUIRED_RE = re.compile(r'@permission_required|permission_required\(')
+_USER_PASSES_TEST_RE = re.compile(r'@user_passes_test|user_passes_test\(')
+_HAS_PERM_CALL_RE = re.compile(r'\.has_perm\(')
+_HAS_PERMS_CALL_RE = re.compile(r'\.has_perms\(')
+_CHECK_PERMISSION_CALL_RE = re.compile(r'check_permissions\(|test_func\(')
+_PERMISSION_CHECK_PATTERNS = (
+    (re.compile(r'\.has_perm\([\'\"]([^\'\"]+)[\'\"]'), 'has_perm'),
+    (re.compile(r'\.has_perms\([\'\"]([^\'\"]+)[\'\"]'), 'has_perms'),
+    (re.compile(r'check_permissions\([^)]*\)'), 'check_permissions'),
+    (re.compile(r'test_func\([^)]*\)'), 'test_func'),
+)
+_GROUP_CREATION_RE = re.compile(r'Group\.objects\.(create|get_or_create)\(')
+_PERMISSION_ASSIGNMENT_RE = re.compile(r'\.permissions\.(set|add|remove)\(')
+_USER_GROUP_ASSIGNMENT_RE = re.compile(r'\.groups\.(set|add|remove)\(')
+_CONTENT_TYPE_USAGE_RE = re.compile(r'ContentType\.objects\.get\(')
+_PERMISSION_CREATION_RE = re.compile(r'Permission\.objects\.(create|get_or_create)\(')
+_ROLE_CHECK_PATTERNS = (
+    re.compile(r'has_role\([\'\"]([^\'\"]+)[\'\"]'),
+    re.compile(r'role_required\([^)]*roles\s*=\s*\[([^\]]+)\]'),
+    re.compile(r'required_roles\s*=\s*\[([^\]]+)\]'),
+    re.compile(r'role\s*(?:==|in)\s*[\'\"]([^\'\"]+)[\'\"]'),
+)
+_QUOTED_STRING_RE = re.compile(r'[\'\"]([^\'\"]+)[\'\"]')
+_MIDDLEWARE_METHOD_NAMES = (
+    'process_request',
+    'process_view',
+    'process_response',
+    'process_exception',
+    '__call__',
+    '__init__',
+)
+_MIDDLEWARE_METHOD_RE = re.compile(r'\b(' + '|'.join(_MIDDLEWARE_METHOD_NAMES) + r')\b')
+
+# ORM, URLs and templates
+_QUERYSET_OP_NAMES = (
+    'filter', 'exclude', 'get', 'all', 'first', 'last', 'count',
+    'aggregate', 'annotate', 'order_by', 'distinct', 'values', 'values_list',
+    'select_related', 'prefetch_related', 'only', 'defer', 'using',
+    'raw', 'exists', 'update', 'delete', 'bulk_create', 'bulk_update',
+    'iterator', 'earliest', 'latest', 'create', 'get_or_create',
+    'update_or_create', 'in_bulk', 'explain',
+)
+_QUERYSET_OP_RE = re.compile(r'\.(' + '|'.join(_QUERYSET_OP_NAMES) + r')\s*\(')
+# Method chaining: .method1().method2().method3()
+_QUERYSET_CHAIN_RE = re.compile(r'\.(\w+)\([^)]*\)(?:\.\w+\([^)]*\))*')
+_CHAINED_METHOD_RE = re.compile(r'\.(\w+)\(')
+_URL_PATH_PATTERNS = (
+    (re.compile(r'path\([\'\"]([^\'\"]+)[\'\"],\s*([^,]+),\s*'), 'path'),
+    (re.compile(r're_path\([\'\"]([^\'\"]+)[\'\"],\s*([^,]+),\s*'), 're_path'),
+    (re.compile(r'url\([\'\"]([^\'\"]+)[\'\"],\s*([^,]+),\s*'), 'url'),
+)
+_URL_INCLUDE_RE = re.compile(r'include\([\'\"]([^\'\"]+)[\'\"]\)')
+_RENDER_CALL_RE = re.compile(r'render\(')
+_TEMPLATE_NAME_RE = re.compile(r'template_name\s*=')
+_GET_TEMPLATE_CALL_RE = re.compile(r'get_template\(')
+_LOADER_CALL_RE = re.compile(r'loader\.')
+_TEMPLATE_RESPONSE_RE = re.compile(r'TemplateResponse')
+_CONTEXT_ASSIGNMENT_RE = re.compile(r'context\s*=')
+_GET_CONTEXT_DATA_RE = re.compile(r'def\s+get_context_data\s*\([^)]*\)\s*:\s*(.*?)(?=\ndef\s|\nclass\s|\Z)', re.DOTALL)
+_CONTEXT_VAR_PATTERNS = (
+    re.compile(r'context\[[\'\"]([^\'\"]+)[\'\"]\]\s*=\s*([^,\n]+)'),
+    re.compile(r'context\.update\(([^)]+)\)'),
+)
+_CONTEXT_UPDATE_PAIR_RE = re.compile(r'[\'\"]([^\'\"]+)[\'\"]\s*:\s*([^,}]+)')
+
+# Signals, admin and tests
+_SIGNAL_RECEIVER_RE = re.compile(r'@receiver\(([^)]+)\)')
+_SIGNAL_CONNECT_RE = re.compile(r'\.connect\(([^)]+)\)')
+_ADMIN_REGISTER_RE = re.compile(r'admin\.site\.register\(([^)]+)\)')
+_TEST_METHOD_RE = re.compile(r'def\s+(test_\w+)\s*\(')
 
 
 class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
     """Semantic analyzer for Django framework"""
     
-    def analyze(self, code: str, parsed_code: Dict) -> Dict[str, Any]:
+    def analyze(self, code: str, parsed_code: Dict) -> Mapping:
         """Analyze Django code for semantic patterns"""
-        semantics = {
+        semantics = LazySemantics({
             # Model-related patterns
-            'model_fields': self._extract_model_fields(code),
-            'model_meta': self._extract_model_meta(code),
-            'model_relationships': self._extract_model_relationships(code),
-            'model_methods': self._extract_model_methods(parsed_code),
+            'model_fields': lambda: self._extract_model_fields(code),
+            'model_meta': lambda: self._extract_model_meta(code),
+            'model_relationships': lambda: self._extract_model_relationships(code),
+            'model_methods': lambda: self._extract_model_methods(parsed_code),
             
             # View-related patterns
-            'view_classes': self._extract_view_classes(parsed_code),
-            'view_methods': self._extract_view_methods(code, parsed_code),
-            'view_decorators': self._extract_view_decorators(code),
-            'permission_classes': self._extract_permission_classes(code),
+            'view_classes': lambda: self._extract_view_classes(parsed_code),
+            'view_methods': lambda: self._extract_view_methods(code, parsed_code),
+            'view_decorators': lambda: self._extract_view_decorators(code),
+            'permission_classes': lambda: self._extract_permission_classes(code),
             
             # Authentication patterns
-            'authentication_usage': self._extract_auth_usage(code),
-            'permission_checks': self._extract_permission_checks(code),
-            'group_permissions': self._extract_group_permissions(code),
+            'authentication_usage': lambda: self._extract_auth_usage(code),
+            'permission_checks': lambda: self._extract_permission_checks(code),
+            'group_permissions': lambda: self._extract_group_permissions(code),
             
             # Middleware patterns
-            'middleware_classes': self._extract_middleware_classes(parsed_code),
-            'middleware_methods': self._extract_middleware_methods(code),
+            'middleware_classes': lambda: self._extract_middleware_classes(parsed_code),
+            'middleware_methods': lambda: self._extract_middleware_methods(code),
             
             # Serializer patterns
-            'serializer_fields': self._extract_serializer_fields(code),
-            'serializer_classes': self._extract_serializer_classes(parsed_code),
+            'serializer_fields': lambda: self._extract_serializer_fields(code),
+            'serializer_classes': lambda: self._extract_serializer_classes(parsed_code),
             
             # ORM patterns
-            'queryset_operations': self._extract_queryset_ops(code),
-            'queryset_methods': self._extract_queryset_methods(code),
+            'queryset_operations': lambda: self._extract_queryset_ops(code),
+            'queryset_methods': lambda: self._extract_queryset_methods(code),
             
             # URL patterns
-            'url_patterns': self._extract_url_patterns(code),
-            'url_includes': self._extract_url_includes(code),
+            'url_patterns': lambda: self._extract_url_patterns(code),
+            'url_includes': lambda: self._extract_url_includes(code),
             
             # Template patterns
-            'template_usage': self._extract_template_usage(code),
-            'context_data': self._extract_context_data(code),
+            'template_usage': lambda: self._extract_template_usage(code),
+            'context_data': lambda: self._extract_context_data(code),
             
             # Form patterns
-            'form_fields': self._extract_form_fields(code),
-            'form_classes': self._extract_form_classes(parsed_code),
+            'form_fields': lambda: self._extract_form_fields(code),
+            'form_classes': lambda: self._extract_form_classes(parsed_code),
             
             # Signal patterns
-            'signal_handlers': self._extract_signal_handlers(code),
-            'signal_connections': self._extract_signal_connections(code),
+            'signal_handlers': lambda: self._extract_signal_handlers(code),
+            'signal_connections': lambda: self._extract_signal_connections(code),
             
             # Admin patterns
-            'admin_classes': self._extract_admin_classes(parsed_code),
-            'admin_registrations': self._extract_admin_registrations(code),
+            'admin_classes': lambda: self._extract_admin_classes(parsed_code),
+            'admin_registrations': lambda: self._extract_admin_registrations(code),
             
             # Test patterns
-            'test_classes': self._extract_test_classes(parsed_code),
-            'test_methods': self._extract_test_methods(code),
-        }
+            'test_classes': lambda: self._extract_test_classes(parsed_code),
+            'test_methods': lambda: self._extract_test_methods(code),
+        })
         return semantics
     
     # ===== Django Semantic Extractors =====
     
     def _extract_model_fields(self, code: str) -> List[Dict]:
         """Extract Django model field definitions"""
-        fields = []
-        django_field_types = [
-            'CharField', 'TextField', 'IntegerField', 'FloatField', 'DecimalField',
-            'BooleanField', 'DateField', 'DateTimeField', 'EmailField', 'URLField',
-            'ForeignKey', 'ManyToManyField', 'OneToOneField', 'ImageField', 'FileField',
-            'AutoField', 'BigAutoField', 'BigIntegerField', 'BinaryField', 'DurationField',
-            'GenericIPAddressField', 'PositiveIntegerField', 'PositiveSmallIntegerField',
-            'SlugField', 'SmallIntegerField', 'TimeField', 'UUIDField'
-        ]
-        
-        for field_type in django_field_types:
-            pattern = rf'(\w+)\s*=\s*(models\.)?{field_type}\s*\(([^)]*)\)'
-            for match in re.finditer(pattern, code, re.DOTALL):
-                field_name, _, params = match.groups()
-                fields.append({
-                    'field_type': field_type,
-                    'name': field_name,
-                    'params': params.strip(),
-                    'line': code[:match.start()].count('\n') + 1
-                })
+        return self._extract_field_declarations(code, _MODEL_FIELDS)
+    
+    def _extract_field_declarations(self, code: str, declarations: Tuple[Dict[str, int], re.Pattern]) -> List[Dict]:
+        """Extract `name = FieldType(...)` declarations, grouped by field type"""
+        field_order, pattern = declarations
+        found = []
+        next_start = {}
+        
+        for match in pattern.finditer(code):
+            field_name, _, field_type, params = match.groups()
+            start = match.start()
+            # Skip a declaration inside the arguments of an earlier one of the same type
+            if start < next_start.get(field_type, 0):
+                continue
+            next_start[field_type] = match.end(4) + 1
+            found.append((field_order[field_type], start, {
+                'field_type': field_type,
+                'name': field_name,
+                'params': params.strip(),
+                'line': self._line_of(code, start)
+            }))
         
-        return fields
+        found.sort(key=lambda item: item[:2])
+        return [field for _, _, field in found]
     
     def _extract_model_meta(self, code: str) -> Dict[str, Any]:
         """Extract Model Meta class information"""
         meta_info = {}
         
         # Extract Meta class patterns
-        meta_pattern = r'class\s+Meta\s*:\s*(.*?)(?=\n\S|\Z)'
-        meta_match = re.search(meta_pattern, code, re.DOTALL | re.IGNORECASE)
+        meta_match = _META_CLASS_RE.search(code)
         
         if meta_match:
             meta_content = meta_match.group(1)
@@ -657,8 +921,7 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
     
     def _extract_meta_option(self, meta_content: str, option_name: str) -> Any:
         """Extract specific Meta option"""
-        pattern = rf'{option_name}\s*=\s*(.+)'
-        match = re.search(pattern, meta_content)
+        match = _META_OPTION_PATTERNS[option_name].search(meta_content)
         if match:
             return match.group(1).strip()
         return None
@@ -667,20 +930,16 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract model relationship fields"""
         relationships = []
         
-        relationship_patterns = [
-            (r'(\w+)\s*=\s*models\.ForeignKey\s*\(([^)]*)\)', 'ForeignKey'),
-            (r'(\w+)\s*=\s*models\.ManyToManyField\s*\(([^)]*)\)', 'ManyToManyField'),
-            (r'(\w+)\s*=\s*models\.OneToOneField\s*\(([^)]*)\)', 'OneToOneField'),
-        ]
-        
-        for pattern, rel_type in relationship_patterns:
-            for match in re.finditer(pattern, code, re.DOTALL):
+        for rel_type, pattern in _RELATIONSHIP_PATTERNS:
+            if rel_type not in code:
+                continue
+            for match in pattern.finditer(code):
                 field_name, params = match.groups()
                 
                 # Extract related model from params
                 related_model = None
                 if 'to=' in params:
-                    model_match = re.search(r"to=['\"]([^'\"]+)['\"]", params)
+                    model_match = _RELATED_MODEL_RE.search(params)
                     if model_match:
                         related_model = model_match.group(1)
                 elif ',' in params:
@@ -694,7 +953,7 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
                     'type': rel_type,
                     'related_model': related_model,
                     'params': params.strip(),
-                    'line': code[:match.start()].count('\n') + 1
+                    'line': self._line_of(code, match.start())
                 })
         
         return relationships
@@ -720,17 +979,10 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract Django view classes"""
         view_classes = []
         
-        view_base_classes = [
-            'View', 'TemplateView', 'ListView', 'DetailView', 
-            'CreateView', 'UpdateView', 'DeleteView', 'FormView',
-            'RedirectView', 'ArchiveIndexView', 'YearArchiveView',
-            'MonthArchiveView', 'WeekArchiveView', 'DayArchiveView',
-            'TodayArchiveView', 'DateDetailView'
-        ]
-        
         for cls in parsed_code.get('classes', []):
             parent_class = cls.get('parent_class', '')
-            if any(base_class in parent_class for base_class in view_base_classes):
+            # View, TemplateView, ListView, ... DateDetailView all contain 'View'
+            if 'View' in parent_class:
                 view_classes.append({
                     'class_name': cls.get('name'),
                     'parent_class': parent_class,
@@ -751,8 +1003,7 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
                     methods_found.append(method['name'])
         
         # Also look for function-based views
-        func_pattern = r'def\s+(\w+)\s*\([^)]*request'
-        for match in re.finditer(func_pattern, code):
+        for match in _VIEW_FUNCTION_RE.finditer(code):
             func_name = match.group(1)
             if func_name in http_methods or any(meth in func_name for meth in ['view', 'handler']):
                 methods_found.append(func_name)
@@ -763,29 +1014,9 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract view decorators"""
         decorators = []
         
-        common_decorators = [
-            r'@login_required',
-            r'@permission_required',
-            r'@user_passes_test',
-            r'@staff_member_required',
-            r'@superuser_required',
-            r'@csrf_exempt',
-            r'@require_http_methods',
-            r'@require_GET',
-            r'@require_POST',
-            r'@require_safe',
-            r'@cache_control',
-            r'@never_cache',
-            r'@condition',
-            r'@etag',
-            r'@last_modified',
-            r'@vary_on_cookie',
-            r'@vary_on_headers',
-        ]
-        
-        for decorator_pattern in common_decorators:
-            if re.search(decorator_pattern, code):
-                decorator_name = decorator_pattern.replace('@', '').replace('\\', '')
+        found = set(_VIEW_DECORATOR_RE.findall(code))
+        for decorator_name in _VIEW_DECORATOR_NAMES:
+            if decorator_name in found:
                 decorators.append(decorator_name)
         
         return decorators
@@ -794,16 +1025,11 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract DRF permission classes"""
         permission_classes = []
         
-        patterns = [
-            r'permission_classes\s*=\s*\[([^\]]+)\]',
-            r'permission_classes\s*:\s*List\[[^\]]*\]\s*=\s*\[([^\]]+)\]',
-        ]
-        
-        for pattern in patterns:
-            for match in re.finditer(pattern, code):
+        for pattern in _PERMISSION_CLASSES_PATTERNS:
+            for match in pattern.finditer(code):
                 classes_text = match.group(1)
                 # Extract class names
-                class_matches = re.findall(r'([A-Z][A-Za-z]+Permission|IsAuthenticated|AllowAny|IsAdminUser)', classes_text)
+                class_matches = _PERMISSION_CLASS_NAME_RE.findall(classes_text)
                 permission_classes.extend(class_matches)
         
         return list(set(permission_classes))
@@ -811,12 +1037,12 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
     def _extract_auth_usage(self, code: str) -> Dict[str, Any]:
         """Extract authentication-related patterns"""
         auth_patterns = {
-            'login_required': bool(re.search(r'@login_required|login_required\(', code)),
-            'permission_required': bool(re.search(r'@permission_required|permission_required\(', code)),
-            'user_passes_test': bool(re.search(r'@user_passes_test|user_passes_test\(', code)),
-            'has_perm_calls': len(list(re.finditer(r'\.has_perm\(', code))),
-            'has_perms_calls': len(list(re.finditer(r'\.has_perms\(', code))),
-            'check_permission_calls': len(list(re.finditer(r'check_permissions\(|test_func\(', code))),
+            'login_required': bool(_LOGIN_REQUIRED_RE.search(code)),
+            'permission_required': bool(_PERMISSION_REQUIRED_RE.search(code)),
+            'user_passes_test': bool(_USER_PASSES_TEST_RE.search(code)),
+            'has_perm_calls': len(list(_HAS_PERM_CALL_RE.finditer(code))),
+            'has_perms_calls': len(list(_HAS_PERMS_CALL_RE.finditer(code))),
+            'check_permission_calls': len(list(_CHECK_PERMISSION_CALL_RE.finditer(code))),
             'authentication_classes': self._extract_authentication_classes(code),
         }
         return auth_patterns
@@ -825,15 +1051,10 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract DRF authentication classes"""
         auth_classes = []
         
-        patterns = [
-            r'authentication_classes\s*=\s*\[([^\]]+)\]',
-            r'authentication_classes\s*:\s*List\[[^\]]*\]\s*=\s*\[([^\]]+)\]',
-        ]
-        
-        for pattern in patterns:
-            for match in re.finditer(pattern, code):
+        for pattern in _AUTHENTICATION_CLASSES_PATTERNS:
+            for match in pattern.finditer(code):
                 classes_text = match.group(1)
-                class_matches = re.findall(r'([A-Z][A-Za-z]+Authentication|TokenAuthentication|SessionAuthentication|BasicAuthentication)', classes_text)
+                class_matches = _AUTHENTICATION_CLASS_NAME_RE.findall(classes_text)
                 auth_classes.extend(class_matches)
         
         return list(set(auth_classes))
@@ -842,19 +1063,12 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract permission check patterns"""
         checks = []
         
-        check_patterns = [
-            (r'\.has_perm\([\'\"]([^\'\"]+)[\'\"]', 'has_perm'),
-            (r'\.has_perms\([\'\"]([^\'\"]+)[\'\"]', 'has_perms'),
-            (r'check_permissions\([^)]*\)', 'check_permissions'),
-            (r'test_func\([^)]*\)', 'test_func'),
-        ]
-        
-        for pattern, check_type in check_patterns:
-            for match in re.finditer(pattern, code):
+        for pattern, check_type in _PERMISSION_CHECK_PATTERNS:
+            for match in pattern.finditer(code):
                 checks.append({
                     'type': check_type,
                     'match': match.group(0),
-                    'line': code[:match.start()].count('\n') + 1
+                    'line': self._line_of(code, match.start())
                 })
         
         return checks
@@ -862,11 +1076,11 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
     def _extract_group_permissions(self, code: str) -> Dict[str, Any]:
         """Extract group and permission management patterns"""
         patterns = {
-            'group_creation': bool(re.search(r'Group\.objects\.(create|get_or_create)\(', code)),
-            'permission_assignment': bool(re.search(r'\.permissions\.(set|add|remove)\(', code)),
-            'user_group_assignment': bool(re.search(r'\.groups\.(set|add|remove)\(', code)),
-            'content_type_usage': bool(re.search(r'ContentType\.objects\.get\(', code)),
-            'permission_creation': bool(re.search(r'Permission\.objects\.(create|get_or_create)\(', code)),
+            'group_creation': bool(_GROUP_CREATION_RE.search(code)),
+            'permission_assignment': bool(_PERMISSION_ASSIGNMENT_RE.search(code)),
+            'user_group_assignment': bool(_USER_GROUP_ASSIGNMENT_RE.search(code)),
+            'content_type_usage': bool(_CONTENT_TYPE_USAGE_RE.search(code)),
+            'permission_creation': bool(_PERMISSION_CREATION_RE.search(code)),
             'role_based_checks': self._extract_role_checks(code),
         }
         return patterns
@@ -875,17 +1089,10 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract role-based permission checks"""
         role_checks = []
         
-        patterns = [
-            r'has_role\([\'\"]([^\'\"]+)[\'\"]',
-            r'role_required\([^)]*roles\s*=\s*\[([^\]]+)\]',
-            r'required_roles\s*=\s*\[([^\]]+)\]',
-            r'role\s*(?:==|in)\s*[\'\"]([^\'\"]+)[\'\"]',
-        ]
-        
-        for pattern in patterns:
-            for match in re.finditer(pattern, code):
+        for pattern in _ROLE_CHECK_PATTERNS:
+            for match in pattern.finditer(code):
                 role_text = match.group(1) if len(match.groups()) > 0 else match.group(0)
-                roles = re.findall(r'[\'\"]([^\'\"]+)[\'\"]', role_text)
+                roles = _QUOTED_STRING_RE.findall(role_text)
                 role_checks.extend(roles)
         
         return list(set(role_checks))
@@ -910,46 +1117,16 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract middleware method calls"""
         middleware_methods = []
         
-        method_patterns = [
-            'process_request',
-            'process_view',
-            'process_response',
-            'process_exception',
-            '__call__',
-            '__init__',
-        ]
-        
-        for method in method_patterns:
-            if re.search(rf'\b{method}\b', code):
+        found = set(_MIDDLEWARE_METHOD_RE.findall(code))
+        for method in _MIDDLEWARE_METHOD_NAMES:
+            if method in found:
                 middleware_methods.append(method)
         
         return middleware_methods
     
     def _extract_serializer_fields(self, code: str) -> List[Dict]:
         """Extract serializer fields"""
-        fields = []
-        
-        serializer_field_types = [
-            'CharField', 'IntegerField', 'BooleanField', 'DateTimeField',
-            'SerializerMethodField', 'PrimaryKeyRelatedField', 'SlugRelatedField',
-            'EmailField', 'URLField', 'FileField', 'ImageField', 'ListField',
-            'DictField', 'JSONField', 'HiddenField', 'ReadOnlyField',
-            'ModelField', 'StringRelatedField', 'HyperlinkedRelatedField',
-            'HyperlinkedIdentityField', 'MultipleChoiceField', 'ChoiceField',
-        ]
-        
-        for field_type in serializer_field_types:
-            pattern = rf'(\w+)\s*=\s*(serializers\.)?{field_type}\s*\(([^)]*)\)'
-            for match in re.finditer(pattern, code, re.DOTALL):
-                field_name, _, params = match.groups()
-                fields.append({
-                    'field_type': field_type,
-                    'name': field_name,
-                    'params': params.strip(),
-                    'line': code[:match.start()].count('\n') + 1
-                })
-        
-        return fields
+        return self._extract_field_declarations(code, _SERIALIZER_FIELDS)
     
     def _extract_serializer_classes(self, parsed_code: Dict) -> List[Dict]:
         """Extract serializer classes"""
@@ -970,17 +1147,9 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract Django ORM queryset operations"""
         operations = []
         
-        queryset_ops = [
-            'filter', 'exclude', 'get', 'all', 'first', 'last', 'count',
-            'aggregate', 'annotate', 'order_by', 'distinct', 'values', 'values_list',
-            'select_related', 'prefetch_related', 'only', 'defer', 'using',
-            'raw', 'exists', 'update', 'delete', 'bulk_create', 'bulk_update',
-            'iterator', 'earliest', 'latest', 'create', 'get_or_create',
-            'update_or_create', 'in_bulk', 'explain',
-        ]
-        
-        for op in queryset_ops:
-            if re.search(rf'\.{op}\s*\(', code):
+        found = set(_QUERYSET_OP_RE.findall(code))
+        for op in _QUERYSET_OP_NAMES:
+            if op in found:
                 operations.append(op)
         
         return list(set(operations))
@@ -989,17 +1158,14 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract queryset method chains"""
         methods = []
         
-        # Pattern for method chaining: .method1().method2().method3()
-        chain_pattern = r'\.(\w+)\([^)]*\)(?:\.\w+\([^)]*\))*'
-        
-        for match in re.finditer(chain_pattern, code):
+        for match in _QUERYSET_CHAIN_RE.finditer(code):
             chain = match.group(0)
-            method_names = re.findall(r'\.(\w+)\(', chain)
+            method_names = _CHAINED_METHOD_RE.findall(chain)
             if len(method_names) >= 2:  # Only consider actual chains
                 methods.append({
                     'chain': method_names,
                     'full_chain': chain,
-                    'line': code[:match.start()].count('\n') + 1
+                    'line': self._line_of(code, match.start())
                 })
         
         return methods
@@ -1008,21 +1174,15 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract URL patterns"""
         url_patterns = []
         
-        # Pattern for path() and re_path() calls
-        path_patterns = [
-            (r'path\([\'\"]([^\'\"]+)[\'\"],\s*([^,]+),\s*', 'path'),
-            (r're_path\([\'\"]([^\'\"]+)[\'\"],\s*([^,]+),\s*', 're_path'),
-            (r'url\([\'\"]([^\'\"]+)[\'\"],\s*([^,]+),\s*', 'url'),
-        ]
-        
-        for pattern, pattern_type in path_patterns:
-            for match in re.finditer(pattern, code):
+        # path(), re_path() and url() calls
+        for pattern, pattern_type in _URL_PATH_PATTERNS:
+            for match in pattern.finditer(code):
                 url_path, view = match.groups()
                 url_patterns.append({
                     'type': pattern_type,
                     'path': url_path,
                     'view': view.strip(),
-                    'line': code[:match.start()].count('\n') + 1
+                    'line': self._line_of(code, match.start())
                 })
         
         return url_patterns
@@ -1031,9 +1191,7 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract URL includes"""
         includes = []
         
-        include_pattern = r'include\([\'\"]([^\'\"]+)[\'\"]\)'
-        
-        for match in re.finditer(include_pattern, code):
+        for match in _URL_INCLUDE_RE.finditer(code):
             include_path = match.group(1)
             includes.append(include_path)
         
@@ -1042,12 +1200,12 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
     def _extract_template_usage(self, code: str) -> Dict[str, Any]:
         """Extract template-related patterns"""
         template_patterns = {
-            'render_calls': len(list(re.finditer(r'render\(', code))),
-            'template_name_usage': bool(re.search(r'template_name\s*=', code)),
-            'get_template_calls': len(list(re.finditer(r'get_template\(', code))),
-            'loader_calls': len(list(re.finditer(r'loader\.', code))),
-            'template_response': bool(re.search(r'TemplateResponse', code)),
-            'context_usage': bool(re.search(r'context\s*=', code)),
+            'render_calls': len(list(_RENDER_CALL_RE.finditer(code))),
+            'template_name_usage': bool(_TEMPLATE_NAME_RE.search(code)),
+            'get_template_calls': len(list(_GET_TEMPLATE_CALL_RE.finditer(code))),
+            'loader_calls': len(list(_LOADER_CALL_RE.finditer(code))),
+            'template_response': bool(_TEMPLATE_RESPONSE_RE.search(code)),
+            'context_usage': bool(_CONTEXT_ASSIGNMENT_RE.search(code)),
         }
         return template_patterns
     
@@ -1055,27 +1213,21 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract context data patterns"""
         context_data = []
         
-        # Pattern for get_context_data method
-        context_pattern = r'def\s+get_context_data\s*\([^)]*\)\s*:\s*(.*?)(?=\ndef\s|\nclass\s|\Z)'
-        context_match = re.search(context_pattern, code, re.DOTALL)
+        # Body of the get_context_data method
+        context_match = _GET_CONTEXT_DATA_RE.search(code)
         
         if context_match:
             context_body = context_match.group(1)
             # Look for context variable assignments
-            var_patterns = [
-                r'context\[[\'\"]([^\'\"]+)[\'\"]\]\s*=\s*([^,\n]+)',
-                r'context\.update\(([^)]+)\)',
-            ]
-            
-            for pattern in var_patterns:
-                for var_match in re.finditer(pattern, context_body):
-                    if '[' in pattern:
+            for pattern in _CONTEXT_VAR_PATTERNS:
+                for var_match in pattern.finditer(context_body):
+                    if '[' in pattern.pattern:
                         key, value = var_match.groups()
                         context_data.append({'key': key, 'value': value.strip()})
                     else:
                         # Parse update dict
                         update_text = var_match.group(1)
-                        key_value_pairs = re.findall(r'[\'\"]([^\'\"]+)[\'\"]\s*:\s*([^,}]+)', update_text)
+                        key_value_pairs = _CONTEXT_UPDATE_PAIR_RE.findall(update_text)
                         for key, value in key_value_pairs:
                             context_data.append({'key': key, 'value': value.strip()})
         
@@ -1086,43 +1238,24 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
     
     def _extract_form_fields(self, code: str) -> List[Dict]:
         """Extract form field definitions"""
-        fields = []
-        form_field_types = [
-            'CharField', 'IntegerField', 'BooleanField', 'DateField',
-            'DateTimeField', 'EmailField', 'URLField', 'ChoiceField',
-            'MultipleChoiceField', 'FileField', 'ImageField', 'ModelChoiceField',
-            'ModelMultipleChoiceField',
-        ]
-        
-        for field_type in form_field_types:
-            pattern = rf'(\w+)\s*=\s*(forms\.)?{field_type}\s*\(([^)]*)\)'
-            for match in re.finditer(pattern, code, re.DOTALL):
-                field_name, _, params = match.groups()
-                fields.append({
-                    'field_type': field_type,
-                    'name': field_name,
-                    'params': params.strip(),
-                    'line': code[:match.start()].count('\n') + 1
-                })
-        
-        return fields
+        return self._extract_field_declarations(code, _FORM_FIELDS)
     
     def _extract_signal_handlers(self, code: str) -> List[Dict]:
         """Extract signal handler decorators"""
         handlers = []
         
         signal_patterns = [
-            (r'@receiver\(([^)]+)\)', 'receiver'),
-            (r'\.connect\(([^)]+)\)', 'connect'),
+            (_SIGNAL_RECEIVER_RE, 'receiver'),
+            (_SIGNAL_CONNECT_RE, 'connect'),
         ]
         
         for pattern, handler_type in signal_patterns:
-            for match in re.finditer(pattern, code):
+            for match in pattern.finditer(code):
                 params = match.group(1)
                 handlers.append({
                     'type': handler_type,
                     'params': params,
-                    'line': code[:match.start()].count('\n') + 1
+                    'line': self._line_of(code, match.start())
                 })
         
         return handlers
@@ -1147,11 +1280,10 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract test classes"""
         test_classes = []
         
-        test_base_classes = ['TestCase', 'APITestCase', 'SimpleTestCase', 'TransactionTestCase']
-        
         for cls in parsed_code.get('classes', []):
             parent_class = cls.get('parent_class', '')
-            if any(base_class in parent_class for base_class in test_base_classes):
+            # TestCase, APITestCase, SimpleTestCase and TransactionTestCase all contain 'TestCase'
+            if 'TestCase' in parent_class:
                 test_classes.append({
                     'class_name': cls.get('name'),
                     'parent_class': parent_class,
@@ -1164,12 +1296,11 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract signal connection patterns"""
         connections = []
         
-        connect_pattern = r'\.connect\(([^)]+)\)'
-        for match in re.finditer(connect_pattern, code):
+        for match in _SIGNAL_CONNECT_RE.finditer(code):
             params = match.group(1)
             connections.append({
                 'params': params,
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         return connections
@@ -1193,8 +1324,7 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract admin registration calls"""
         registrations = []
         
-        admin_pattern = r'admin\.site\.register\(([^)]+)\)'
-        for match in re.finditer(admin_pattern, code):
+        for match in _ADMIN_REGISTER_RE.finditer(code):
             params = match.group(1)
             registrations.append(params.strip())
         
@@ -1204,101 +1334,476 @@ class DjangoSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract test method patterns"""
         test_methods = []
         
-        test_pattern = r'def\s+(test_\w+)\s*\('
-        for match in re.finditer(test_pattern, code):
+        for match in _TEST_METHOD_RE.finditer(code):
             test_methods.append(match.group(1))
         
         return test_methods
 
 
+# ===== React patterns =====
+
+# Hooks
+_REACT_HOOKS = (
+    'useState', 'useEffect', 'useContext', 'useReducer',
+    'useCallback', 'useMemo', 'useRef', 'useImperativeHandle',
+    'useLayoutEffect', 'useDebugValue', 'useTransition',
+    'useDeferredValue', 'useId', 'useSyncExternalStore',
+)
+_HOOK_ORDER = {hook: index for index, hook in enumerate(_REACT_HOOKS)}
+# One scan for every built-in hook; a lookahead, like the Django field
+# declarations, so a hook call in another hook's arguments is still found
+_HOOK_CALL_RE = re.compile(r'\b(?=(' + '|'.join(_REACT_HOOKS) + r')\s*\(([^)]*)\))')
+_OPEN_FUNCTION_BODY_RE = re.compile(r'(?:function\s+\w+|const\s+\w+\s*=\s*\([^)]*\)\s*=>)\s*\{[^}]*$', re.DOTALL)
+_CUSTOM_HOOK_START_RE = re.compile(r'(?:function\s+use[A-Z]|const\s+use[A-Z]\w+\s*=\s*\([^)]*\)\s*=>)')
+_OPEN_CLASS_COMPONENT_BODY_RE = re.compile(r'class\s+\w+\s+extends\s+(?:React\.)?Component\s*\{[^}]*$', re.DOTALL)
+_OPEN_LIFECYCLE_BODY_PATTERNS = tuple(
+    (method, re.compile(rf'{method}\s*\([^)]*\)\s*{{[^}}]*$', re.DOTALL))
+    for method in ('componentDidMount', 'componentDidUpdate', 'componentWillUnmount', 'render')
+)
+# Dependencies of useEffect, useCallback and useMemo
+_HOOK_DEPENDENCY_RE = re.compile(r'(useEffect|useCallback|useMemo)\s*\([^,]+,\s*\[([^\]]+)\]\)')
+# Custom hook functions (start with 'use')
+_CUSTOM_HOOK_PATTERNS = (
+    re.compile(r'function\s+(use[A-Z]\w+)\s*\(([^)]*)\)'),
+    re.compile(r'const\s+(use[A-Z]\w+)\s*=\s*\(([^)]*)\)\s*=>'),
+)
+_BUILTIN_HOOK_CALL_RE = re.compile(r'\b(useState|useEffect|useContext|useReducer|useCallback|useMemo|useRef)\s*\(')
+
+# State
+_CLASS_STATE_INIT_RE = re.compile(r'class\s+\w+\s+extends\s+(?:React\.)?Component\s*{[\s\S]*?constructor\s*\([^)]*\)\s*{[\s\S]*?this\.state\s*=\s*({[^}]+})', re.DOTALL)
+_STATE_PROPERTY_RE = re.compile(r'(\w+)\s*:\s*([^,\n}]+)')
+_SET_STATE_CALL_RE = re.compile(r'this\.setState\s*\(([^)]+)\)')
+_USE_STATE_DECLARATION_RE = re.compile(r'const\s*\[([^\]]+)\]\s*=\s*useState\s*\(([^)]*)\)')
+_USE_REDUCER_DECLARATION_RE = re.compile(r'const\s*\[([^\]]+)\]\s*=\s*useReducer\s*\(([^)]*)\)')
+_CREATE_CONTEXT_RE = re.compile(r'createContext\s*\(([^)]*)\)')
+_USE_CONTEXT_RE = re.compile(r'useContext\s*\(([^)]+)\)')
+_REDUX_PATTERNS = (
+    (re.compile(r'createStore\s*\('), 'redux_create_store'),
+    (re.compile(r'useSelector\s*\('), 'redux_use_selector'),
+    (re.compile(r'useDispatch\s*\('), 'redux_use_dispatch'),
+    (re.compile(r'configureStore\s*\('), 'redux_toolkit_configure_store'),
+    (re.compile(r'createSlice\s*\('), 'redux_toolkit_create_slice'),
+)
+_ZUSTAND_PATTERNS = (
+    (re.compile(r'create\s*\('), 'zustand_create'),
+    (re.compile(r'useStore\s*\('), 'zustand_use_store'),
+)
+_MOBX_PATTERNS = (
+    (re.compile(r'makeObservable\s*\('), 'mobx_make_observable'),
+    (re.compile(r'makeAutoObservable\s*\('), 'mobx_make_auto_observable'),
+    (re.compile(r'observable\s*\('), 'mobx_observable'),
+    (re.compile(r'action\s*\('), 'mobx_action'),
+    (re.compile(r'computed\s*\('), 'mobx_computed'),
+)
+_USE_STATE_VARIABLES_RE = re.compile(r'const\s*\[([^\]]+)\]\s*=\s*useState')
+_CLASS_STATE_ACCESS_RE = re.compile(r'this\.state\.(\w+)')
+_USE_STATE_INIT_RE = re.compile(r'useState\s*\(([^)]*)\)')
+_CLASS_STATE_ASSIGNMENT_RE = re.compile(r'this\.state\s*=\s*({[^}]+})')
+_SETTER_CALL_RE = re.compile(r'(\w+Setter|\w+Dispatch)\s*\(([^)]*)\)')
+_FUNCTIONAL_UPDATE_RE = re.compile(r'set\w+\s*\(.*?=>.*?\)', re.DOTALL)
+_BATCH_UPDATE_RE = re.compile(r'flushSync\s*\(|startTransition\s*\(')
+_DISPATCH_ACTION_RE = re.compile(r'dispatch\s*\(({[^}]+})\)')
+_STATE_MANAGEMENT_LIB_PATTERNS = {
+    lib_name: tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+    for lib_name, patterns in {
+        'redux': [
+            r'from\s+[\'"]redux[\'"]',
+            r'from\s+[\'"]@reduxjs/toolkit[\'"]',
+            r'import.*redux',
+            r'createStore\s*\(',
+            r'useSelector\s*\(',
+            r'useDispatch\s*\(',
+        ],
+        'zustand': [
+            r'from\s+[\'"]zustand[\'"]',
+            r'import.*zustand',
+            r'create\s*\(',
+            r'useStore\s*\(',
+        ],
+        'mobx': [
+            r'from\s+[\'"]mobx[\'"]',
+            r'from\s+[\'"]mobx-react[\'"]',
+            r'import.*mobx',
+            r'makeObservable\s*\(',
+            r'observable\s*\(',
+        ],
+        'recoil': [
+            r'from\s+[\'"]recoil[\'"]',
+            r'import.*recoil',
+            r'atom\s*\(',
+            r'useRecoilState\s*\(',
+            r'useRecoilValue\s*\(',
+        ],
+        'jotai': [
+            r'from\s+[\'"]jotai[\'"]',
+            r'import.*jotai',
+            r'atom\s*\(',
+            r'useAtom\s*\(',
+        ],
+        'xstate': [
+            r'from\s+[\'"]xstate[\'"]',
+            r'from\s+[\'"]@xstate/react[\'"]',
+            r'import.*xstate',
+            r'createMachine\s*\(',
+            r'useMachine\s*\(',
+        ],
+        'context': [
+            r'createContext\s*\(',
+            r'useContext\s*\(',
+            r'Context\.Provider',
+        ],
+    }.items()
+}
+
+# Effects
+_EFFECT_WITH_CLEANUP_RE = re.compile(r'useEffect\s*\(\(\)\s*=>\s*{([\s\S]*?)return\s*\(\)\s*=>\s*{([\s\S]*?)}([\s\S]*?)}\s*,\s*\[([^\]]*)\]\)', re.DOTALL)
+_CLEANUP_OPERATION_PATTERNS = (
+    (re.compile(r'clearInterval\s*\(([^)]+)\)'), 'clear_interval'),
+    (re.compile(r'clearTimeout\s*\(([^)]+)\)'), 'clear_timeout'),
+    (re.compile(r'removeEventListener\s*\(([^)]+)\)'), 'remove_event_listener'),
+    (re.compile(r'abort\s*\(\)'), 'abort_controller'),
+    (re.compile(r'\.unsubscribe\s*\(\)'), 'unsubscribe'),
+    (re.compile(r'\.cancel\s*\(\)'), 'cancel'),
+    (re.compile(r'\.close\s*\(\)'), 'close'),
+    (re.compile(r'\.disconnect\s*\(\)'), 'disconnect'),
+    (re.compile(r'\.stop\s*\(\)'), 'stop'),
+)
+_SIMPLE_EFFECT_CLEANUP_RE = re.compile(r'useEffect\s*\(.*?return.*?=>.*?{', re.DOTALL)
+_EFFECT_DEPENDENCY_PATTERNS = (
+    (re.compile(r'useEffect\s*\([^,]+,\s*\[([^\]]+)\]\)'), 'useEffect'),
+    (re.compile(r'useCallback\s*\([^,]+,\s*\[([^\]]+)\]\)'), 'useCallback'),
+    (re.compile(r'useMemo\s*\([^,]+,\s*\[([^\]]+)\]\)'), 'useMemo'),
+)
+_STATE_DEPENDENCY_RE = re.compile(r'set\w+|dispatch', re.IGNORECASE)
+# ESLint missing dependency warnings
+_MISSING_DEPENDENCY_RE = re.compile(r'React Hook .*? has a missing dependency: \'(\w+)\'')
+
+# Memoization and optimization
+_REACT_MEMO_RE = re.compile(r'(?:React\.)?memo\s*\(([^)]+)\)')
+_USE_MEMO_RE = re.compile(r'useMemo\s*\(([^,]+),\s*\[([^\]]+)\]\)')
+_USE_CALLBACK_RE = re.compile(r'useCallback\s*\(([^,]+),\s*\[([^\]]+)\]\)')
+_PURE_COMPONENT_RE = re.compile(r'extends\s+(?:React\.)?PureComponent')
+_OPTIMIZATION_PATTERNS = tuple(
+    (re.compile(pattern, re.IGNORECASE), optimization)
+    for pattern, optimization in (
+        (r'React\.memo\s*\(', 'react_memo'),
+        (r'useMemo\s*\(', 'use_memo'),
+        (r'useCallback\s*\(', 'use_callback'),
+        (r'extends\s+PureComponent', 'pure_component'),
+        (r'React\.lazy\s*\(', 'react_lazy'),
+        (r'Suspense', 'suspense'),
+        (r'startTransition\s*\(', 'start_transition'),
+        (r'useDeferredValue\s*\(', 'use_deferred_value'),
+        (r'useTransition\s*\(', 'use_transition'),
+        (r'profiler', 'profiler'),
+        (r'key\s*=\s*{', 'list_keys'),
+        (r'window\.addEventListener\s*\(', 'event_listener_optimization'),
+        (r'IntersectionObserver', 'intersection_observer'),
+        (r'ResizeObserver', 'resize_observer'),
+        (r'requestAnimationFrame', 'raf_optimization'),
+        (r'requestIdleCallback', 'idle_callback'),
+        (r'debounce\s*\(', 'debounce'),
+        (r'throttle\s*\(', 'throttle'),
+        (r'memo\s*=\s*{?\[?', 'custom_memoization'),
+    )
+)
+
+# Events
+_INLINE_EVENT_HANDLER_RE = re.compile(r'on(\w+)\s*=\s*{([^}]+)}')
+_EVENT_HANDLER_REFERENCE_RE = re.compile(r'on(\w+)\s*=\s*{?(\w+)}?')
+_EVENT_HANDLER_DEFINITION_RE = re.compile(r'(?:const\s+)?(handle\w+|on\w+)\s*=\s*(?:\(([^)]*)\)\s*=>|function(?:\s+\w+)?\s*\(([^)]*)\))')
+_SYNTHETIC_EVENT_USAGE_RE = re.compile(r'\.(preventDefault|stopPropagation|nativeEvent|target|currentTarget)\b')
+# Common React event types
+_REACT_EVENTS = (
+    'onClick', 'onChange', 'onSubmit', 'onMouseEnter', 'onMouseLeave',
+    'onMouseMove', 'onMouseDown', 'onMouseUp', 'onKeyDown', 'onKeyUp',
+    'onKeyPress', 'onFocus', 'onBlur', 'onInput', 'onScroll',
+    'onLoad', 'onError', 'onDragStart', 'onDragEnd', 'onDragOver',
+    'onDrop', 'onCopy', 'onCut', 'onPaste', 'onDoubleClick',
+    'onContextMenu', 'onWheel', 'onTouchStart', 'onTouchEnd',
+    'onTouchMove', 'onAnimationStart', 'onAnimationEnd',
+    'onTransitionEnd'
+)
+_REACT_EVENT_RE = re.compile(r'\b(' + '|'.join(_REACT_EVENTS) + r')\b')
+# Custom events (starting with on)
+_CUSTOM_EVENT_RE = re.compile(r'\bon([A-Z][a-zA-Z]+)\b')
+
+# Forms
+# Controlled components (value + onChange)
+_CONTROLLED_COMPONENT_RE = re.compile(r'value\s*=\s*{([^}]+)}[\s\S]*?onChange\s*=\s*{([^}]+)}', re.DOTALL)
+_REF_ATTRIBUTE_RE = re.compile(r'ref\s*=\s*{?(\w+)}?')
+_FORM_LIBRARY_PATTERNS = {
+    lib_name: tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+    for lib_name, patterns in {
+        'formik': [r'from\s+[\'"]formik[\'"]', r'useFormik\s*\(', r'<Formik'],
+        'react-hook-form': [r'from\s+[\'"]react-hook-form[\'"]', r'useForm\s*\(', r'register\s*\('],
+        'final-form': [r'from\s+[\'"]react-final-form[\'"]', r'useField\s*\(', r'<Form'],
+        'redux-form': [r'from\s+[\'"]redux-form[\'"]', r'reduxForm\s*\('],
+    }.items()
+}
+_SUBMIT_HANDLER_RE = re.compile(r'onSubmit\s*=\s*{([^}]+)}')
+_RESET_HANDLER_RE = re.compile(r'onReset\s*=\s*{([^}]+)}')
+_INLINE_VALIDATION_PATTERNS = (
+    (re.compile(r'required\s*='), 'required_field'),
+    (re.compile(r'pattern\s*=\s*{?/(.+)/}?'), 'regex_pattern'),
+    (re.compile(r'minLength\s*='), 'min_length'),
+    (re.compile(r'maxLength\s*='), 'max_length'),
+    (re.compile(r'min\s*='), 'min_value'),
+    (re.compile(r'max\s*='), 'max_value'),
+)
+_VALIDATION_FUNCTION_CALL_RE = re.compile(r'validate\w*\s*\(([^)]*)\)')
+_VALIDATION_ERROR_PATTERNS = (
+    (re.compile(r'error\s*=\s*{'), 'error_state'),
+    (re.compile(r'errors\.'), 'errors_object'),
+    (re.compile(r'\.error'), 'dot_error'),
+    (re.compile(r'isValid\s*='), 'is_valid_check'),
+    (re.compile(r'validateOnBlur'), 'validate_on_blur'),
+    (re.compile(r'validateOnChange'), 'validate_on_change'),
+)
+_YUP_VALIDATION_RE = re.compile(r'\byup\b|\.object\(|\.string\(|\.number\(|\.required\(|\.matches\(', re.IGNORECASE)
+_ZOD_VALIDATION_RE = re.compile(r'\bzod\b|z\.object\(|z\.string\(|z\.number\(', re.IGNORECASE)
+
+# Routing
+_ROUTER_LIBRARY_PATTERNS = {
+    lib_name: tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+    for lib_name, patterns in {
+        'react-router': [
+            r'from\s+[\'"]react-router-dom[\'"]',
+            r'from\s+[\'"]react-router[\'"]',
+            r'<BrowserRouter',
+            r'<Router',
+            r'<Routes',
+            r'<Route',
+        ],
+        'nextjs': [
+            r'from\s+[\'"]next/router[\'"]',
+            r'useRouter\s*\(\)',
+            r'Link\s+from\s+[\'"]next/link[\'"]',
+            r'getServerSideProps',
+            r'getStaticProps',
+        ],
+        'wouter': [
+            r'from\s+[\'"]wouter[\'"]',
+            r'useRoute\s*\(\)',
+            r'useLocation\s*\(\)',
+        ],
+        'reach-router': [
+            r'from\s+[\'"]@reach/router[\'"]',
+            r'<Router\s+',
+        ],
+    }.items()
+}
+_ROUTE_ELEMENT_RE = re.compile(r'<Route\s+(.*?)/?>', re.DOTALL)
+_ROUTE_PATH_ATTRIBUTE_RE = re.compile(r'path\s*=\s*[\'"]([^\'"]+)[\'"]')
+_ROUTE_ELEMENT_ATTRIBUTE_RE = re.compile(r'element\s*=\s*{([^}]+)}')
+_ROUTE_COMPONENT_ATTRIBUTE_RE = re.compile(r'component\s*=\s*{([^}]+)}')
+_NAVIGATION_PATTERNS = (
+    (re.compile(r'useNavigate\s*\(\)'), 'use_navigate'),
+    (re.compile(r'useHistory\s*\(\)'), 'use_history'),
+    (re.compile(r'history\.push\s*\('), 'history_push'),
+    (re.compile(r'history\.replace\s*\('), 'history_replace'),
+    (re.compile(r'navigate\s*\('), 'navigate'),
+    (re.compile(r'<Link\s+'), 'link_component'),
+    (re.compile(r'<NavLink\s+'), 'navlink_component'),
+)
+_ROUTE_PARAM_RE = re.compile(r':(\w+)')
+_NESTED_ROUTE_RE = re.compile(r'<Route.*?>.*?<Route', re.DOTALL)
+
+
+@lru_cache(maxsize=256)
+def _route_component_patterns(component: str) -> Tuple[re.Pattern, ...]:
+    """Patterns for component used as a Route element or component prop, cached per name"""
+    return (
+        re.compile(rf'element\s*=\s*{{.*?{component}.*?}}', re.DOTALL),
+        re.compile(rf'component\s*=\s*{{.*?{component}.*?}}', re.DOTALL),
+        re.compile(rf'<Route.*?>\s*<{component}', re.DOTALL),
+    )
+
+
+# Data fetching
+_FETCH_CALL_RE = re.compile(r'fetch\s*\(([^)]*)\)')
+_FETCH_METHOD_OPTION_RE = re.compile(r'method\s*:\s*[\'"]([^\'"]+)[\'"]')
+_FETCH_HEADERS_OPTION_RE = re.compile(r'headers\s*:\s*({[^}]+})')
+_FETCH_BODY_OPTION_RE = re.compile(r'body\s*:\s*([^,]+)')
+_AXIOS_CALL_RE = re.compile(r'axios\.(get|post|put|delete|patch|request)\s*\(([^)]*)\)')
+_REACT_QUERY_PATTERNS = (
+    (re.compile(r'useQuery\s*\(([^)]*)\)'), 'use_query'),
+    (re.compile(r'useMutation\s*\(([^)]*)\)'), 'use_mutation'),
+    (re.compile(r'useInfiniteQuery\s*\(([^)]*)\)'), 'use_infinite_query'),
+)
+_SWR_CALL_RE = re.compile(r'useSWR\s*\(([^)]*)\)')
+_ABORT_CONTROLLER_RE = re.compile(r'new\s+AbortController\s*\(\)')
+_RESPONSE_HANDLING_PATTERNS = (
+    (re.compile(r'\.json\s*\(\)'), 'json_response'),
+    (re.compile(r'\.text\s*\(\)'), 'text_response'),
+    (re.compile(r'\.blob\s*\(\)'), 'blob_response'),
+    (re.compile(r'\.arrayBuffer\s*\(\)'), 'array_buffer_response'),
+)
+
+# Async code
+_ASYNC_FUNCTION_RE = re.compile(r'async\s+(?:function\s+(\w+)|const\s+(\w+)\s*=\s*async|(\w+)\s*=\s*async\s*\()')
+_ASYNC_ARROW_FUNCTION_RE = re.compile(r'const\s+(\w+)\s*=\s*async\s*\([^)]*\)\s*=>')
+_AWAIT_CALL_RE = re.compile(r'await\s+(\w+)\s*\(')
+_PROMISE_PATTERNS = (
+    (re.compile(r'\.then\s*\(([^)]+)\)'), 'promise_then'),
+    (re.compile(r'\.catch\s*\(([^)]+)\)'), 'promise_catch'),
+    (re.compile(r'\.finally\s*\(([^)]+)\)'), 'promise_finally'),
+    (re.compile(r'Promise\.all\s*\('), 'promise_all'),
+    (re.compile(r'Promise\.race\s*\('), 'promise_race'),
+    (re.compile(r'Promise\.resolve\s*\('), 'promise_resolve'),
+    (re.compile(r'Promise\.reject\s*\('), 'promise_reject'),
+)
+_ASYNC_USE_EFFECT_RE = re.compile(r'useEffect\s*\(\(\)\s*=>\s*{[\s\S]*?await', re.DOTALL)
+_ERROR_HANDLING_PATTERNS = (
+    (re.compile(r'try\s*{'), 'try_block'),
+    (re.compile(r'catch\s*\('), 'catch_block'),
+)
+
+# TypeScript
+_TYPESCRIPT_PATTERNS = (
+    # Type annotations
+    (re.compile(r':\s*\w+(?:\s*<[^>]+>)?(?:\s*\[\])?(?:\s*\|\s*\w+)*'), 'type_annotation'),
+    # Interfaces
+    (re.compile(r'interface\s+(\w+)'), 'interface'),
+    # Type aliases
+    (re.compile(r'type\s+(\w+)'), 'type_alias'),
+    # Generics
+    (re.compile(r'<[A-Z][a-zA-Z]*>'), 'generic'),
+    # Enums
+    (re.compile(r'enum\s+(\w+)'), 'enum'),
+    # Decorators
+    (re.compile(r'@(\w+)'), 'decorator'),
+)
+_TYPE_IMPORT_RE = re.compile(r'import\s+type\s+')
+
+# Props, effects and API calls
+_FUNCTION_COMPONENT_PROPS_RE = re.compile(r'function\s+\w+\s*\(({[^}]*}|\w+)\)')
+_ARROW_COMPONENT_PROPS_RE = re.compile(r'const\s+\w+\s*=\s*\(({[^}]*}|\w+)\)\s*=>')
+_PROP_TYPES_ASSIGNMENT_RE = re.compile(r'(\w+)\.propTypes\s*=\s*\{')
+_DEFAULT_PROPS_ASSIGNMENT_RE = re.compile(r'(\w+)\.defaultProps\s*=\s*\{([^}]+)\}', re.DOTALL)
+_USE_EFFECT_WITH_DEPS_RE = re.compile(r'useEffect\s*\(([^,]+),\s*\[([^\]]+)\]\)')
+_API_CALL_PATTERNS = (
+    (_FETCH_CALL_RE, 'fetch'),
+    (re.compile(r'axios\.(get|post|put|delete|patch)\s*\(([^)]*)\)'), 'axios'),
+    (re.compile(r'\.then\s*\(([^)]*)\)'), 'promise_then'),
+    (re.compile(r'\.catch\s*\(([^)]*)\)'), 'promise_catch'),
+)
+_TRAILING_AWAIT_RE = re.compile(r'\bawait\s+$')
+
+# JSX
+# Self-closing elements with props (both PascalCase and lowercase)
+_JSX_SELF_CLOSING_RE = re.compile(r'<([A-Z][a-zA-Z0-9]*|[a-z][a-z0-9-]*)\s+[^/>]*/>')
+_JSX_OPENING_TAG_RE = re.compile(r'<([A-Z][a-zA-Z0-9]*|[a-z][a-z0-9-]*)\s+[^>]*>')
+_JSX_CLOSING_TAG_RE = re.compile(r'</([A-Z][a-zA-Z0-9]*|[a-z][a-z0-9-]*)>')
+_JSX_FRAGMENT_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'<>',
+    r'</>',
+    r'<React\.Fragment>',
+    r'</React\.Fragment>',
+    r'<Fragment>',
+    r'</Fragment>'
+))
+# Custom components (PascalCase without < >)
+_JSX_CUSTOM_COMPONENT_RE = re.compile(r'\b([A-Z][a-zA-Z0-9]+)\b(?=[^>]*</)')
+_BUILTIN_REACT_COMPONENTS = tuple(
+    (comp, re.compile(rf'<{comp}\b'), re.compile(rf'</{comp}>'))
+    for comp in ('Suspense', 'Profiler', 'StrictMode', 'lazy', 'memo', 'forwardRef')
+)
+_JSX_TAG_RE = re.compile(r'<([A-Za-z][A-Za-z0-9-]*)(\s+[^>]*?)(/?)>')
+_JSX_ATTRIBUTE_RE = re.compile(r'(\w+)(?:\s*=\s*(?:{([^}]+)}|[\'"]([^\'"]+)[\'"]))?')
+_JSX_SPREAD_ATTRIBUTE_RE = re.compile(r'\.\.\.(\w+)')
+_JSX_BOOLEAN_ATTRIBUTE_RE = re.compile(r'<[^>]*\s(\w+)(?=\s|/?>)')
+_JSX_DATA_ARIA_ATTRIBUTE_RE = re.compile(r'\s((?:data|aria)-[\w-]+)\s*=\s*(?:{([^}]+)}|[\'"]([^\'"]+)[\'"])')
+
+
 class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
     """Semantic analyzer for React framework"""
     
-    def analyze(self, code: str, parsed_code: Dict) -> Dict[str, Any]:
+    def analyze(self, code: str, parsed_code: Dict) -> Mapping:
         """Analyze React code for semantic patterns"""
-        semantics = {
+        semantics = LazySemantics({
             # Hook-related patterns
-            'hook_calls': self._extract_hook_calls(code, parsed_code),
-            'hook_dependencies': self._extract_hook_dependencies(code),
-            'custom_hooks': self._extract_custom_hooks(code, parsed_code),
+            'hook_calls': lambda: self._extract_hook_calls(code, parsed_code),
+            'hook_dependencies': lambda: self._extract_hook_dependencies(code),
+            'custom_hooks': lambda: self._extract_custom_hooks(code, parsed_code),
             
             # Component patterns
-            'component_types': self._extract_component_types(parsed_code),
-            'component_props': self._extract_component_props(code, parsed_code),
-            'component_state': self._extract_component_state(code),
+            'component_types': lambda: self._extract_component_types(parsed_code),
+            'component_props': lambda: self._extract_component_props(code, parsed_code),
+            'component_state': lambda: self._extract_component_state(code),
             
             # State management patterns
-            'state_declarations': self._extract_state_declarations(code),
-            'state_updates': self._extract_state_updates(code),
-            'state_management_libs': self._extract_state_management_libs(code),
+            'state_declarations': lambda: self._extract_state_declarations(code),
+            'state_updates': lambda: self._extract_state_updates(code),
+            'state_management_libs': lambda: self._extract_state_management_libs(code),
             
             # Effect patterns
-            'effect_usage': self._extract_effect_usage(code),
-            'effect_cleanup': self._extract_effect_cleanup(code),
-            'effect_dependencies': self._extract_effect_dependencies(code),
+            'effect_usage': lambda: self._extract_effect_usage(code),
+            'effect_cleanup': lambda: self._extract_effect_cleanup(code),
+            'effect_dependencies': lambda: self._extract_effect_dependencies(code),
             
             # Performance patterns
-            'memoization_usage': self._extract_memoization_usage(code),
-            'optimization_patterns': self._extract_optimization_patterns(code),
+            'memoization_usage': lambda: self._extract_memoization_usage(code),
+            'optimization_patterns': lambda: self._extract_optimization_patterns(code),
             
             # Event handling patterns
-            'event_handlers': self._extract_event_handlers(code),
-            'event_types': self._extract_event_types(code),
+            'event_handlers': lambda: self._extract_event_handlers(code),
+            'event_types': lambda: self._extract_event_types(code),
             
             # Form patterns
-            'form_handling': self._extract_form_handling(code),
-            'form_validation': self._extract_form_validation(code),
+            'form_handling': lambda: self._extract_form_handling(code),
+            'form_validation': lambda: self._extract_form_validation(code),
             
             # Routing patterns
-            'routing_usage': self._extract_routing_usage(code),
-            'route_components': self._extract_route_components(parsed_code),
+            'routing_usage': lambda: self._extract_routing_usage(code),
+            'route_components': lambda: self._extract_route_components(parsed_code),
             
             # API patterns
-            'api_calls': self._extract_api_calls(code),
-            'fetch_patterns': self._extract_fetch_patterns(code),
-            'async_patterns': self._extract_async_patterns(code, parsed_code),
+            'api_calls': lambda: self._extract_api_calls(code),
+            'fetch_patterns': lambda: self._extract_fetch_patterns(code),
+            'async_patterns': lambda: self._extract_async_patterns(code, parsed_code),
             
             # JSX patterns
-            'jsx_elements': self._extract_jsx_elements(code),
-            'jsx_attributes': self._extract_jsx_attributes(code),
+            'jsx_elements': lambda: self._extract_jsx_elements(code),
+            'jsx_attributes': lambda: self._extract_jsx_attributes(code),
             
             # TypeScript patterns (if applicable)
-            'typescript_features': self._extract_typescript_features(code),
-        }
+            'typescript_features': lambda: self._extract_typescript_features(code),
+        })
         return semantics
     
     # ===== React Semantic Extractors =====
     
     def _extract_hook_calls(self, code: str, parsed_code: Dict) -> List[Dict]:
         """Extract React hook calls with detailed information"""
+        found = []
+        next_start = {}
+        
+        for match in _HOOK_CALL_RE.finditer(code):
+            hook, params = match.groups()
+            start = match.start()
+            # Skip a call inside the arguments of an earlier call to the same hook
+            if start < next_start.get(hook, 0):
+                continue
+            next_start[hook] = match.end(2) + 1
+            found.append((_HOOK_ORDER[hook], start, hook, params))
+        
+        # Grouped by hook, in source order within each hook
+        found.sort(key=lambda item: item[:2])
         hook_calls = []
-        
-        react_hooks = [
-            'useState', 'useEffect', 'useContext', 'useReducer',
-            'useCallback', 'useMemo', 'useRef', 'useImperativeHandle',
-            'useLayoutEffect', 'useDebugValue', 'useTransition',
-            'useDeferredValue', 'useId', 'useSyncExternalStore',
-        ]
-        
-        for hook in react_hooks:
-            pattern = rf'\b{hook}\s*\(([^)]*)\)'
-            matches = list(re.finditer(pattern, code))
+        for _, start, hook, params in found:
+            line = self._line_of(code, start)
             
-            if matches:
-                for match in matches:
-                    params = match.group(1)
-                    line = code[:match.start()].count('\n') + 1
-                    
-                    # Analyze hook parameters
-                    param_analysis = self._analyze_hook_params(hook, params)
-                    
-                    hook_calls.append({
-                        'hook': hook,
-                        'params': params.strip(),
-                        'param_analysis': param_analysis,
-                        'line': line,
-                        'context': self._get_hook_context(code, match.start())
-                    })
+            # Analyze hook parameters
+            param_analysis = self._analyze_hook_params(hook, params)
+            
+            hook_calls.append({
+                'hook': hook,
+                'params': params.strip(),
+                'param_analysis': param_analysis,
+                'line': line,
+                'context': self._get_hook_context(code, start)
+            })
         
         return hook_calls
     
@@ -1350,20 +1855,19 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         code_before = code[:position]
         
         # Check if inside function component
-        if re.search(r'(?:function\s+\w+|const\s+\w+\s*=\s*\([^)]*\)\s*=>)\s*\{[^}]*$', code_before, re.DOTALL):
+        if _OPEN_FUNCTION_BODY_RE.search(code_before):
             return 'function_component'
         
         # Check if inside custom hook (starts with 'use')
-        if re.search(r'(?:function\s+use[A-Z]|const\s+use[A-Z]\w+\s*=\s*\([^)]*\)\s*=>)', code_before):
+        if _CUSTOM_HOOK_START_RE.search(code_before):
             return 'custom_hook'
         
         # Check if inside class component method
-        if re.search(r'class\s+\w+\s+extends\s+(?:React\.)?Component\s*\{[^}]*$', code_before, re.DOTALL):
+        if _OPEN_CLASS_COMPONENT_BODY_RE.search(code_before):
             # Check if inside lifecycle method or custom method
-            method_patterns = ['componentDidMount', 'componentDidUpdate', 'componentWillUnmount', 'render']
-            for pattern in method_patterns:
-                if re.search(rf'{pattern}\s*\([^)]*\)\s*{{[^}}]*$', code_before, re.DOTALL):
-                    return f'class_component_{pattern}'
+            for method, pattern in _OPEN_LIFECYCLE_BODY_PATTERNS:
+                if pattern.search(code_before):
+                    return f'class_component_{method}'
             return 'class_component_other'
         
         return 'unknown'
@@ -1372,10 +1876,7 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract hook dependency arrays"""
         dependencies = []
         
-        # Pattern for useEffect, useCallback, useMemo dependencies
-        dep_pattern = r'(useEffect|useCallback|useMemo)\s*\([^,]+,\s*\[([^\]]+)\]\)'
-        
-        for match in re.finditer(dep_pattern, code):
+        for match in _HOOK_DEPENDENCY_RE.finditer(code):
             hook_name, deps_text = match.groups()
             dep_list = [d.strip() for d in deps_text.split(',') if d.strip()]
             
@@ -1383,7 +1884,7 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
                 'hook': hook_name,
                 'dependencies': dep_list,
                 'count': len(dep_list),
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         return dependencies
@@ -1392,14 +1893,8 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract custom hook definitions"""
         custom_hooks = []
         
-        # Pattern for custom hook functions (start with 'use')
-        patterns = [
-            r'function\s+(use[A-Z]\w+)\s*\(([^)]*)\)',
-            r'const\s+(use[A-Z]\w+)\s*=\s*\(([^)]*)\)\s*=>',
-        ]
-        
-        for pattern in patterns:
-            for match in re.finditer(pattern, code):
+        for pattern in _CUSTOM_HOOK_PATTERNS:
+            for match in pattern.finditer(code):
                 hook_name, params = match.groups()
                 
                 # Find hook body
@@ -1421,7 +1916,7 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
                 hook_body = code[func_start:func_end] if func_end > func_start else ''
                 
                 # Analyze hook body
-                uses_react_hooks = bool(re.search(r'\b(useState|useEffect|useContext|useReducer|useCallback|useMemo|useRef)\s*\(', hook_body))
+                uses_react_hooks = bool(_BUILTIN_HOOK_CALL_RE.search(hook_body))
                 returns_value = 'return' in hook_body
                 
                 custom_hooks.append({
@@ -1429,7 +1924,7 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
                     'params': [p.strip() for p in params.split(',') if p.strip()],
                     'uses_react_hooks': uses_react_hooks,
                     'returns_value': returns_value,
-                    'line': code[:match.start()].count('\n') + 1
+                    'line': self._line_of(code, match.start())
                 })
         
         return custom_hooks
@@ -1485,30 +1980,27 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract state from React class components"""
         class_states = []
         
-        # Pattern for class component state initialization
-        state_init_pattern = r'class\s+\w+\s+extends\s+(?:React\.)?Component\s*{[\s\S]*?constructor\s*\([^)]*\)\s*{[\s\S]*?this\.state\s*=\s*({[^}]+})'
-        
-        for match in re.finditer(state_init_pattern, code, re.DOTALL):
+        # Class component state initialization
+        for match in _CLASS_STATE_INIT_RE.finditer(code):
             state_obj = match.group(1)
             # Parse state object
             state_items = []
-            for prop_match in re.finditer(r'(\w+)\s*:\s*([^,\n}]+)', state_obj):
+            for prop_match in _STATE_PROPERTY_RE.finditer(state_obj):
                 key, value = prop_match.groups()
                 state_items.append({
                     'key': key.strip(),
                     'value': value.strip(),
-                    'line': code[:match.start()].count('\n') + 1
+                    'line': self._line_of(code, match.start())
                 })
             
             class_states.append({
                 'type': 'class_component',
                 'initial_state': state_items,
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
-        # Pattern for setState calls
-        setstate_pattern = r'this\.setState\s*\(([^)]+)\)'
-        for match in re.finditer(setstate_pattern, code):
+        # setState calls
+        for match in _SET_STATE_CALL_RE.finditer(code):
             params = match.group(1).strip()
             is_function = params.startswith('(') or '=>' in params
             is_object = params.startswith('{')
@@ -1518,7 +2010,7 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
                 'params': params,
                 'is_function': is_function,
                 'is_object': is_object,
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         return class_states
@@ -1528,9 +2020,8 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract state from React function components"""
         function_states = []
         
-        # Pattern for useState hooks
-        usestate_pattern = r'const\s*\[([^\]]+)\]\s*=\s*useState\s*\(([^)]*)\)'
-        for match in re.finditer(usestate_pattern, code):
+        # useState hooks
+        for match in _USE_STATE_DECLARATION_RE.finditer(code):
             variables, initial_value = match.groups()
             var_list = [v.strip() for v in variables.split(',')]
             
@@ -1539,12 +2030,11 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
                 'variables': var_list,
                 'initial_value': initial_value.strip(),
                 'is_function_initializer': '=>' in initial_value or initial_value.strip().startswith('()'),
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
-        # Pattern for useReducer hooks
-        usereducer_pattern = r'const\s*\[([^\]]+)\]\s*=\s*useReducer\s*\(([^)]*)\)'
-        for match in re.finditer(usereducer_pattern, code):
+        # useReducer hooks
+        for match in _USE_REDUCER_DECLARATION_RE.finditer(code):
             variables, reducer_params = match.groups()
             var_list = [v.strip() for v in variables.split(',')]
             
@@ -1552,7 +2042,7 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
                 'type': 'use_reducer',
                 'variables': var_list,
                 'reducer_params': reducer_params.strip(),
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         return function_states
@@ -1562,24 +2052,22 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract state from React Context API"""
         contexts = []
         
-        # Pattern for createContext
-        createcontext_pattern = r'createContext\s*\(([^)]*)\)'
-        for match in re.finditer(createcontext_pattern, code):
+        # createContext
+        for match in _CREATE_CONTEXT_RE.finditer(code):
             default_value = match.group(1).strip()
             contexts.append({
                 'type': 'create_context',
                 'default_value': default_value,
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
-        # Pattern for useContext
-        usecontext_pattern = r'useContext\s*\(([^)]+)\)'
-        for match in re.finditer(usecontext_pattern, code):
+        # useContext
+        for match in _USE_CONTEXT_RE.finditer(code):
             context_ref = match.group(1).strip()
             contexts.append({
                 'type': 'use_context',
                 'context_ref': context_ref,
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         return contexts
@@ -1590,16 +2078,8 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         global_states = []
         
         # Redux patterns
-        redux_patterns = [
-            (r'createStore\s*\(', 'redux_create_store'),
-            (r'useSelector\s*\(', 'redux_use_selector'),
-            (r'useDispatch\s*\(', 'redux_use_dispatch'),
-            (r'configureStore\s*\(', 'redux_toolkit_configure_store'),
-            (r'createSlice\s*\(', 'redux_toolkit_create_slice'),
-        ]
-        
-        for pattern, lib_type in redux_patterns:
-            if re.search(pattern, code):
+        for pattern, lib_type in _REDUX_PATTERNS:
+            if pattern.search(code):
                 global_states.append({
                     'library': 'redux',
                     'type': lib_type,
@@ -1607,13 +2087,8 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
                 })
         
         # Zustand patterns
-        zustand_patterns = [
-            (r'create\s*\(', 'zustand_create'),
-            (r'useStore\s*\(', 'zustand_use_store'),
-        ]
-        
-        for pattern, lib_type in zustand_patterns:
-            if re.search(pattern, code):
+        for pattern, lib_type in _ZUSTAND_PATTERNS:
+            if pattern.search(code):
                 global_states.append({
                     'library': 'zustand',
                     'type': lib_type,
@@ -1621,16 +2096,8 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
                 })
         
         # MobX patterns
-        mobx_patterns = [
-            (r'makeObservable\s*\(', 'mobx_make_observable'),
-            (r'makeAutoObservable\s*\(', 'mobx_make_auto_observable'),
-            (r'observable\s*\(', 'mobx_observable'),
-            (r'action\s*\(', 'mobx_action'),
-            (r'computed\s*\(', 'mobx_computed'),
-        ]
-        
-        for pattern, lib_type in mobx_patterns:
-            if re.search(pattern, code):
+        for pattern, lib_type in _MOBX_PATTERNS:
+            if pattern.search(code):
                 global_states.append({
                     'library': 'mobx',
                     'type': lib_type,
@@ -1645,15 +2112,13 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         state_vars = []
         
         # Extract from useState
-        usestate_var_pattern = r'const\s*\[([^\]]+)\]\s*=\s*useState'
-        for match in re.finditer(usestate_var_pattern, code):
+        for match in _USE_STATE_VARIABLES_RE.finditer(code):
             variables = match.group(1)
             vars_list = [v.strip() for v in variables.split(',') if v.strip()]
             state_vars.extend(vars_list)
         
         # Extract from class state
-        class_state_pattern = r'this\.state\.(\w+)'
-        for match in re.finditer(class_state_pattern, code):
+        for match in _CLASS_STATE_ACCESS_RE.finditer(code):
             state_vars.append(match.group(1))
         
         return list(set(state_vars))
@@ -1664,26 +2129,24 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         initializations = []
         
         # Function component state initialization
-        func_init_pattern = r'useState\s*\(([^)]*)\)'
-        for match in re.finditer(func_init_pattern, code):
+        for match in _USE_STATE_INIT_RE.finditer(code):
             value = match.group(1).strip()
             init_type = 'function' if '=>' in value or value.startswith('(') else 'value'
             initializations.append({
                 'type': 'useState_init',
                 'value': value,
                 'init_type': init_type,
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         # Class component state initialization
-        class_init_pattern = r'this\.state\s*=\s*({[^}]+})'
-        for match in re.finditer(class_init_pattern, code):
+        for match in _CLASS_STATE_ASSIGNMENT_RE.finditer(code):
             state_obj = match.group(1)
             initializations.append({
                 'type': 'class_state_init',
                 'value': state_obj,
                 'init_type': 'object',
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         return initializations
@@ -1694,43 +2157,39 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         updates = []
         
         # useState setter calls
-        setter_pattern = r'(\w+Setter|\w+Dispatch)\s*\(([^)]*)\)'
-        for match in re.finditer(setter_pattern, code):
+        for match in _SETTER_CALL_RE.finditer(code):
             func_name, params = match.groups()
             updates.append({
                 'type': 'setter_call',
                 'setter': func_name,
                 'params': params.strip(),
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         # Functional updates pattern
-        func_update_pattern = r'set\w+\s*\(.*?=>.*?\)'
-        for match in re.finditer(func_update_pattern, code, re.DOTALL):
+        for match in _FUNCTIONAL_UPDATE_RE.finditer(code):
             update_text = match.group(0)
             updates.append({
                 'type': 'functional_update',
                 'update': update_text.strip(),
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         # Batch updates (React 18+)
-        batch_pattern = r'flushSync\s*\(|startTransition\s*\('
-        for match in re.finditer(batch_pattern, code):
+        for match in _BATCH_UPDATE_RE.finditer(code):
             updates.append({
                 'type': 'batch_update',
                 'method': match.group(0).replace('(', '').strip(),
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         # Redux dispatch
-        dispatch_pattern = r'dispatch\s*\(({[^}]+})\)'
-        for match in re.finditer(dispatch_pattern, code):
+        for match in _DISPATCH_ACTION_RE.finditer(code):
             action = match.group(1)
             updates.append({
                 'type': 'redux_dispatch',
                 'action': action.strip(),
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         return updates
@@ -1740,58 +2199,9 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         """Detect React state management libraries"""
         libraries = []
         
-        lib_patterns = {
-            'redux': [
-                r'from\s+[\'"]redux[\'"]',
-                r'from\s+[\'"]@reduxjs/toolkit[\'"]',
-                r'import.*redux',
-                r'createStore\s*\(',
-                r'useSelector\s*\(',
-                r'useDispatch\s*\(',
-            ],
-            'zustand': [
-                r'from\s+[\'"]zustand[\'"]',
-                r'import.*zustand',
-                r'create\s*\(',
-                r'useStore\s*\(',
-            ],
-            'mobx': [
-                r'from\s+[\'"]mobx[\'"]',
-                r'from\s+[\'"]mobx-react[\'"]',
-                r'import.*mobx',
-                r'makeObservable\s*\(',
-                r'observable\s*\(',
-            ],
-            'recoil': [
-                r'from\s+[\'"]recoil[\'"]',
-                r'import.*recoil',
-                r'atom\s*\(',
-                r'useRecoilState\s*\(',
-                r'useRecoilValue\s*\(',
-            ],
-            'jotai': [
-                r'from\s+[\'"]jotai[\'"]',
-                r'import.*jotai',
-                r'atom\s*\(',
-                r'useAtom\s*\(',
-            ],
-            'xstate': [
-                r'from\s+[\'"]xstate[\'"]',
-                r'from\s+[\'"]@xstate/react[\'"]',
-                r'import.*xstate',
-                r'createMachine\s*\(',
-                r'useMachine\s*\(',
-            ],
-            'context': [
-                r'createContext\s*\(',
-                r'useContext\s*\(',
-                r'Context\.Provider',
-            ],
-        }
-        
-        for lib_name, patterns in lib_patterns.items():
+        for lib_name, patterns in _STATE_MANAGEMENT_LIB_PATTERNS.items():
             for pattern in patterns:
-                if re.search(pattern, code, re.IGNORECASE):
+                if pattern.search(code):
                     if lib_name not in libraries:
                         libraries.append(lib_name)
                     break
@@ -1803,29 +2213,15 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract React effect cleanup patterns"""
         cleanups = []
         
-        # Pattern for useEffect with cleanup
-        effect_cleanup_pattern = r'useEffect\s*\(\(\)\s*=>\s*{([\s\S]*?)return\s*\(\)\s*=>\s*{([\s\S]*?)}([\s\S]*?)}\s*,\s*\[([^\]]*)\]\)'
-        
-        for match in re.finditer(effect_cleanup_pattern, code, re.DOTALL):
+        # useEffect with cleanup
+        for match in _EFFECT_WITH_CLEANUP_RE.finditer(code):
             effect_body, cleanup_body, after_cleanup, deps = match.groups()
             
             cleanup_operations = []
             
             # Check for common cleanup operations
-            cleanup_patterns = [
-                (r'clearInterval\s*\(([^)]+)\)', 'clear_interval'),
-                (r'clearTimeout\s*\(([^)]+)\)', 'clear_timeout'),
-                (r'removeEventListener\s*\(([^)]+)\)', 'remove_event_listener'),
-                (r'abort\s*\(\)', 'abort_controller'),
-                (r'\.unsubscribe\s*\(\)', 'unsubscribe'),
-                (r'\.cancel\s*\(\)', 'cancel'),
-                (r'\.close\s*\(\)', 'close'),
-                (r'\.disconnect\s*\(\)', 'disconnect'),
-                (r'\.stop\s*\(\)', 'stop'),
-            ]
-            
-            for pattern, op_type in cleanup_patterns:
-                if re.search(pattern, cleanup_body):
+            for pattern, op_type in _CLEANUP_OPERATION_PATTERNS:
+                if pattern.search(cleanup_body):
                     cleanup_operations.append(op_type)
             
             cleanups.append({
@@ -1833,17 +2229,16 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
                 'cleanup_body': cleanup_body.strip(),
                 'cleanup_operations': cleanup_operations,
                 'dependencies': [d.strip() for d in deps.split(',') if d.strip()],
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         # Also look for simpler patterns
-        simple_cleanup_pattern = r'useEffect\s*\(.*?return.*?=>.*?{'
-        simple_matches = list(re.finditer(simple_cleanup_pattern, code, re.DOTALL))
+        simple_matches = list(_SIMPLE_EFFECT_CLEANUP_RE.finditer(code))
         if simple_matches and not cleanups:
             for match in simple_matches:
                 cleanups.append({
                     'has_cleanup': True,
-                    'line': code[:match.start()].count('\n') + 1,
+                    'line': self._line_of(code, match.start()),
                     'simple_pattern': True
                 })
         
@@ -1854,15 +2249,9 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract React effect dependency patterns"""
         dependencies = []
         
-        # Pattern for useEffect, useCallback, useMemo dependencies
-        dep_patterns = [
-            (r'useEffect\s*\([^,]+,\s*\[([^\]]+)\]\)', 'useEffect'),
-            (r'useCallback\s*\([^,]+,\s*\[([^\]]+)\]\)', 'useCallback'),
-            (r'useMemo\s*\([^,]+,\s*\[([^\]]+)\]\)', 'useMemo'),
-        ]
-        
-        for pattern, hook_type in dep_patterns:
-            for match in re.finditer(pattern, code):
+        # useEffect, useCallback and useMemo dependencies
+        for pattern, hook_type in _EFFECT_DEPENDENCY_PATTERNS:
+            for match in pattern.finditer(code):
                 deps_text = match.group(1)
                 dep_list = [d.strip() for d in deps_text.split(',') if d.strip()]
                 
@@ -1870,7 +2259,7 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
                 dependency_analysis = {
                     'count': len(dep_list),
                     'empty': len(dep_list) == 0,
-                    'includes_state': any(re.search(r'set\w+|dispatch', d, re.IGNORECASE) for d in dep_list),
+                    'includes_state': any(_STATE_DEPENDENCY_RE.search(d) for d in dep_list),
                     'includes_props': any('props' in d.lower() for d in dep_list),
                     'includes_refs': any('ref' in d.lower() for d in dep_list),
                     'complex_deps': any('.' in d or '[' in d for d in dep_list),
@@ -1880,17 +2269,16 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
                     'hook': hook_type,
                     'dependencies': dep_list,
                     'analysis': dependency_analysis,
-                    'line': code[:match.start()].count('\n') + 1
+                    'line': self._line_of(code, match.start())
                 })
         
         # Find missing dependency warnings (ESLint pattern)
-        missing_dep_pattern = r'React Hook .*? has a missing dependency: \'(\w+)\''
-        for match in re.finditer(missing_dep_pattern, code):
+        for match in _MISSING_DEPENDENCY_RE.finditer(code):
             dependencies.append({
                 'hook': 'eslint_warning',
                 'missing_dependency': match.group(1),
                 'warning': match.group(0),
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         return dependencies
@@ -1907,44 +2295,40 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         }
         
         # React.memo() usage
-        react_memo_pattern = r'(?:React\.)?memo\s*\(([^)]+)\)'
-        for match in re.finditer(react_memo_pattern, code):
+        for match in _REACT_MEMO_RE.finditer(code):
             memoized_component = match.group(1).strip()
             memoization['react_memo'].append({
                 'component': memoized_component,
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         # useMemo usage
-        use_memo_pattern = r'useMemo\s*\(([^,]+),\s*\[([^\]]+)\]\)'
-        for match in re.finditer(use_memo_pattern, code):
+        for match in _USE_MEMO_RE.finditer(code):
             factory, deps = match.groups()
             dep_list = [d.strip() for d in deps.split(',') if d.strip()]
             
             memoization['use_memo'].append({
                 'factory': factory.strip(),
                 'dependencies': dep_list,
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         # useCallback usage
-        use_callback_pattern = r'useCallback\s*\(([^,]+),\s*\[([^\]]+)\]\)'
-        for match in re.finditer(use_callback_pattern, code):
+        for match in _USE_CALLBACK_RE.finditer(code):
             callback, deps = match.groups()
             dep_list = [d.strip() for d in deps.split(',') if d.strip()]
             
             memoization['use_callback'].append({
                 'callback': callback.strip(),
                 'dependencies': dep_list,
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         # PureComponent usage
-        pure_component_pattern = r'extends\s+(?:React\.)?PureComponent'
-        if re.search(pure_component_pattern, code):
+        if _PURE_COMPONENT_RE.search(code):
             memoization['pure_components'].append({
                 'detected': True,
-                'count': len(list(re.finditer(pure_component_pattern, code)))
+                'count': len(list(_PURE_COMPONENT_RE.finditer(code)))
             })
         
         # Count memoized components
@@ -1959,30 +2343,8 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract React optimization patterns"""
         optimizations = []
         
-        optimization_patterns = [
-            (r'React\.memo\s*\(', 'react_memo'),
-            (r'useMemo\s*\(', 'use_memo'),
-            (r'useCallback\s*\(', 'use_callback'),
-            (r'extends\s+PureComponent', 'pure_component'),
-            (r'React\.lazy\s*\(', 'react_lazy'),
-            (r'Suspense', 'suspense'),
-            (r'startTransition\s*\(', 'start_transition'),
-            (r'useDeferredValue\s*\(', 'use_deferred_value'),
-            (r'useTransition\s*\(', 'use_transition'),
-            (r'profiler', 'profiler'),
-            (r'key\s*=\s*{', 'list_keys'),
-            (r'window\.addEventListener\s*\(', 'event_listener_optimization'),
-            (r'IntersectionObserver', 'intersection_observer'),
-            (r'ResizeObserver', 'resize_observer'),
-            (r'requestAnimationFrame', 'raf_optimization'),
-            (r'requestIdleCallback', 'idle_callback'),
-            (r'debounce\s*\(', 'debounce'),
-            (r'throttle\s*\(', 'throttle'),
-            (r'memo\s*=\s*{?\[?', 'custom_memoization'),
-        ]
-        
-        for pattern, optimization in optimization_patterns:
-            if re.search(pattern, code, re.IGNORECASE):
+        for pattern, optimization in _OPTIMIZATION_PATTERNS:
+            if pattern.search(code):
                 optimizations.append(optimization)
         
         # Check for virtualized lists
@@ -2003,8 +2365,7 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         handlers = []
         
         # Inline event handlers
-        inline_pattern = r'on(\w+)\s*=\s*{([^}]+)}'
-        for match in re.finditer(inline_pattern, code):
+        for match in _INLINE_EVENT_HANDLER_RE.finditer(code):
             event_type, handler = match.groups()
             handlers.append({
                 'type': 'inline',
@@ -2012,12 +2373,11 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
                 'handler': handler.strip(),
                 'is_arrow_function': '=>' in handler,
                 'is_function_call': handler.strip().endswith(')'),
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         # Function event handlers
-        func_pattern = r'on(\w+)\s*=\s*{?(\w+)}?'
-        for match in re.finditer(func_pattern, code):
+        for match in _EVENT_HANDLER_REFERENCE_RE.finditer(code):
             event_type, func_name = match.groups()
             # Make sure it's not already captured as inline
             if not any(h['event'] == event_type and h['handler'] == func_name for h in handlers):
@@ -2025,12 +2385,11 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
                     'type': 'function_reference',
                     'event': event_type,
                     'handler': func_name,
-                    'line': code[:match.start()].count('\n') + 1
+                    'line': self._line_of(code, match.start())
                 })
         
         # Event handler function definitions
-        handler_func_pattern = r'(?:const\s+)?(handle\w+|on\w+)\s*=\s*(?:\(([^)]*)\)\s*=>|function(?:\s+\w+)?\s*\(([^)]*)\))'
-        for match in re.finditer(handler_func_pattern, code):
+        for match in _EVENT_HANDLER_DEFINITION_RE.finditer(code):
             func_name = match.group(1)
             params1 = match.group(2)
             params2 = match.group(3)
@@ -2040,16 +2399,15 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
                 'type': 'handler_definition',
                 'name': func_name,
                 'params': [p.strip() for p in params.split(',') if p.strip()],
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         # Synthetic event usage
-        synth_pattern = r'\.(preventDefault|stopPropagation|nativeEvent|target|currentTarget)\b'
-        for match in re.finditer(synth_pattern, code):
+        for match in _SYNTHETIC_EVENT_USAGE_RE.finditer(code):
             handlers.append({
                 'type': 'synthetic_event_usage',
                 'method': match.group(1),
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         return handlers
@@ -2058,27 +2416,15 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract React event types"""
         event_types = []
         
-        # Common React event types
-        react_events = [
-            'onClick', 'onChange', 'onSubmit', 'onMouseEnter', 'onMouseLeave',
-            'onMouseMove', 'onMouseDown', 'onMouseUp', 'onKeyDown', 'onKeyUp',
-            'onKeyPress', 'onFocus', 'onBlur', 'onInput', 'onScroll',
-            'onLoad', 'onError', 'onDragStart', 'onDragEnd', 'onDragOver',
-            'onDrop', 'onCopy', 'onCut', 'onPaste', 'onDoubleClick',
-            'onContextMenu', 'onWheel', 'onTouchStart', 'onTouchEnd',
-            'onTouchMove', 'onAnimationStart', 'onAnimationEnd',
-            'onTransitionEnd'
-        ]
-        
-        for event in react_events:
-            if re.search(rf'\b{event}\b', code):
+        found = set(_REACT_EVENT_RE.findall(code))
+        for event in _REACT_EVENTS:
+            if event in found:
                 event_types.append(event)
         
         # Custom events (starting with on)
-        custom_event_pattern = r'\bon([A-Z][a-zA-Z]+)\b'
-        for match in re.finditer(custom_event_pattern, code):
+        for match in _CUSTOM_EVENT_RE.finditer(code):
             event_name = match.group(0)
-            if event_name not in event_types and event_name not in react_events:
+            if event_name not in event_types and event_name not in _REACT_EVENTS:
                 event_types.append(event_name)
         
         return event_types
@@ -2095,59 +2441,48 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         }
         
         # Controlled components (value + onChange)
-        controlled_pattern = r'value\s*=\s*{([^}]+)}[\s\S]*?onChange\s*=\s*{([^}]+)}'
-        for match in re.finditer(controlled_pattern, code, re.DOTALL):
+        for match in _CONTROLLED_COMPONENT_RE.finditer(code):
             value, handler = match.groups()
             form_patterns['controlled_components'].append({
                 'value_source': value.strip(),
                 'change_handler': handler.strip(),
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         # Uncontrolled components (refs)
-        ref_pattern = r'ref\s*=\s*{?(\w+)}?'
-        for match in re.finditer(ref_pattern, code):
+        for match in _REF_ATTRIBUTE_RE.finditer(code):
             ref_name = match.group(1)
             # Check if it's likely a form element
             if any(tag in code for tag in ['<input', '<select', '<textarea']):
                 form_patterns['uncontrolled_components'].append({
                     'ref': ref_name,
-                    'line': code[:match.start()].count('\n') + 1
+                    'line': self._line_of(code, match.start())
                 })
         
         # Form library detection
-        form_libs = {
-            'formik': [r'from\s+[\'"]formik[\'"]', r'useFormik\s*\(', r'<Formik'],
-            'react-hook-form': [r'from\s+[\'"]react-hook-form[\'"]', r'useForm\s*\(', r'register\s*\('],
-            'final-form': [r'from\s+[\'"]react-final-form[\'"]', r'useField\s*\(', r'<Form'],
-            'redux-form': [r'from\s+[\'"]redux-form[\'"]', r'reduxForm\s*\('],
-        }
-        
-        for lib_name, patterns in form_libs.items():
+        for lib_name, patterns in _FORM_LIBRARY_PATTERNS.items():
             for pattern in patterns:
-                if re.search(pattern, code, re.IGNORECASE):
+                if pattern.search(code):
                     if lib_name not in form_patterns['form_libraries']:
                         form_patterns['form_libraries'].append(lib_name)
                     break
         
         # Form submission patterns
-        submit_pattern = r'onSubmit\s*=\s*{([^}]+)}'
-        for match in re.finditer(submit_pattern, code):
+        for match in _SUBMIT_HANDLER_RE.finditer(code):
             handler = match.group(1).strip()
             form_patterns['form_state'].append({
                 'type': 'submit_handler',
                 'handler': handler,
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         # Form reset patterns
-        reset_pattern = r'onReset\s*=\s*{([^}]+)}'
-        for match in re.finditer(reset_pattern, code):
+        for match in _RESET_HANDLER_RE.finditer(code):
             handler = match.group(1).strip()
             form_patterns['form_state'].append({
                 'type': 'reset_handler',
                 'handler': handler,
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         return form_patterns
@@ -2158,62 +2493,41 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         validations = []
         
         # Inline validation
-        inline_patterns = [
-            (r'required\s*=', 'required_field'),
-            (r'pattern\s*=\s*{?/(.+)/}?', 'regex_pattern'),
-            (r'minLength\s*=', 'min_length'),
-            (r'maxLength\s*=', 'max_length'),
-            (r'min\s*=', 'min_value'),
-            (r'max\s*=', 'max_value'),
-        ]
-        
-        for pattern, val_type in inline_patterns:
-            for match in re.finditer(pattern, code):
+        for pattern, val_type in _INLINE_VALIDATION_PATTERNS:
+            for match in pattern.finditer(code):
                 validations.append({
                     'type': val_type,
                     'pattern': match.group(0),
-                    'line': code[:match.start()].count('\n') + 1
+                    'line': self._line_of(code, match.start())
                 })
         
         # Validation function calls
-        validation_func_pattern = r'validate\w*\s*\(([^)]*)\)'
-        for match in re.finditer(validation_func_pattern, code):
+        for match in _VALIDATION_FUNCTION_CALL_RE.finditer(code):
             params = match.group(1)
             validations.append({
                 'type': 'validation_function',
                 'function': match.group(0).split('(')[0],
                 'params': params,
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         # Error state patterns
-        error_patterns = [
-            (r'error\s*=\s*{', 'error_state'),
-            (r'errors\.', 'errors_object'),
-            (r'\.error', 'dot_error'),
-            (r'isValid\s*=', 'is_valid_check'),
-            (r'validateOnBlur', 'validate_on_blur'),
-            (r'validateOnChange', 'validate_on_change'),
-        ]
-        
-        for pattern, val_type in error_patterns:
-            if re.search(pattern, code):
+        for pattern, val_type in _VALIDATION_ERROR_PATTERNS:
+            if pattern.search(code):
                 validations.append({
                     'type': val_type,
                     'detected': True
                 })
         
         # Yup validation patterns
-        yup_pattern = r'\byup\b|\.object\(|\.string\(|\.number\(|\.required\(|\.matches\('
-        if re.search(yup_pattern, code, re.IGNORECASE):
+        if _YUP_VALIDATION_RE.search(code):
             validations.append({
                 'type': 'yup_validation',
                 'detected': True
             })
         
         # Zod validation patterns
-        zod_pattern = r'\bzod\b|z\.object\(|z\.string\(|z\.number\('
-        if re.search(zod_pattern, code, re.IGNORECASE):
+        if _ZOD_VALIDATION_RE.search(code):
             validations.append({
                 'type': 'zod_validation',
                 'detected': True
@@ -2235,86 +2549,46 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         }
         
         # Detect router library
-        router_patterns = {
-            'react-router': [
-                r'from\s+[\'"]react-router-dom[\'"]',
-                r'from\s+[\'"]react-router[\'"]',
-                r'<BrowserRouter',
-                r'<Router',
-                r'<Routes',
-                r'<Route',
-            ],
-            'nextjs': [
-                r'from\s+[\'"]next/router[\'"]',
-                r'useRouter\s*\(\)',
-                r'Link\s+from\s+[\'"]next/link[\'"]',
-                r'getServerSideProps',
-                r'getStaticProps',
-            ],
-            'wouter': [
-                r'from\s+[\'"]wouter[\'"]',
-                r'useRoute\s*\(\)',
-                r'useLocation\s*\(\)',
-            ],
-            'reach-router': [
-                r'from\s+[\'"]@reach/router[\'"]',
-                r'<Router\s+',
-            ],
-        }
-        
-        for lib_name, patterns in router_patterns.items():
+        for lib_name, patterns in _ROUTER_LIBRARY_PATTERNS.items():
             for pattern in patterns:
-                if re.search(pattern, code, re.IGNORECASE):
+                if pattern.search(code):
                     routing['router_detected'] = True
                     routing['router_library'] = lib_name
                     break
         
         # Extract routes
-        route_pattern = r'<Route\s+(.*?)/?>'
-        for match in re.finditer(route_pattern, code, re.DOTALL):
+        for match in _ROUTE_ELEMENT_RE.finditer(code):
             route_attrs = match.group(1)
             
             # Parse route attributes
-            path_match = re.search(r'path\s*=\s*[\'"]([^\'"]+)[\'"]', route_attrs)
-            element_match = re.search(r'element\s*=\s*{([^}]+)}', route_attrs)
-            component_match = re.search(r'component\s*=\s*{([^}]+)}', route_attrs)
+            path_match = _ROUTE_PATH_ATTRIBUTE_RE.search(route_attrs)
+            element_match = _ROUTE_ELEMENT_ATTRIBUTE_RE.search(route_attrs)
+            component_match = _ROUTE_COMPONENT_ATTRIBUTE_RE.search(route_attrs)
             
             route_info = {
                 'path': path_match.group(1) if path_match else None,
                 'element': element_match.group(1).strip() if element_match else None,
                 'component': component_match.group(1).strip() if component_match else None,
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             }
             
             routing['routes'].append(route_info)
         
         # Navigation methods
-        nav_patterns = [
-            (r'useNavigate\s*\(\)', 'use_navigate'),
-            (r'useHistory\s*\(\)', 'use_history'),
-            (r'history\.push\s*\(', 'history_push'),
-            (r'history\.replace\s*\(', 'history_replace'),
-            (r'navigate\s*\(', 'navigate'),
-            (r'<Link\s+', 'link_component'),
-            (r'<NavLink\s+', 'navlink_component'),
-        ]
-        
-        for pattern, nav_type in nav_patterns:
-            if re.search(pattern, code):
+        for pattern, nav_type in _NAVIGATION_PATTERNS:
+            if pattern.search(code):
                 routing['navigation_methods'].append(nav_type)
         
         # Route parameters
-        param_pattern = r':(\w+)'
-        for match in re.finditer(param_pattern, code):
+        for match in _ROUTE_PARAM_RE.finditer(code):
             if any(route['path'] and match.group(0) in route['path'] for route in routing['routes']):
                 routing['route_params'].append({
                     'param': match.group(1),
-                    'line': code[:match.start()].count('\n') + 1
+                    'line': self._line_of(code, match.start())
                 })
         
         # Nested routes detection
-        nested_pattern = r'<Route.*?>.*?<Route'
-        if re.search(nested_pattern, code, re.DOTALL):
+        if _NESTED_ROUTE_RE.search(code):
             routing['nested_routes'] = True
         
         return routing
@@ -2342,14 +2616,8 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         
         for component in components:
             # Check if component is used in Route element or component prop
-            route_patterns = [
-                rf'element\s*=\s*{{.*?{component}.*?}}',
-                rf'component\s*=\s*{{.*?{component}.*?}}',
-                rf'<Route.*?>\s*<{component}',
-            ]
-            
-            for pattern in route_patterns:
-                if re.search(pattern, code_text, re.DOTALL):
+            for pattern in _route_component_patterns(component):
+                if pattern.search(code_text):
                     route_components.append({
                         'name': component,
                         'type': 'route_component',
@@ -2365,14 +2633,13 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         fetch_patterns = []
         
         # Basic fetch calls
-        fetch_call_pattern = r'fetch\s*\(([^)]*)\)'
-        for match in re.finditer(fetch_call_pattern, code):
+        for match in _FETCH_CALL_RE.finditer(code):
             params = match.group(1).strip()
             
             # Analyze fetch parameters
-            method_match = re.search(r'method\s*:\s*[\'"]([^\'"]+)[\'"]', params)
-            headers_match = re.search(r'headers\s*:\s*({[^}]+})', params)
-            body_match = re.search(r'body\s*:\s*([^,]+)', params)
+            method_match = _FETCH_METHOD_OPTION_RE.search(params)
+            headers_match = _FETCH_HEADERS_OPTION_RE.search(params)
+            body_match = _FETCH_BODY_OPTION_RE.search(params)
             
             fetch_patterns.append({
                 'type': 'fetch',
@@ -2381,67 +2648,51 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
                 'has_headers': bool(headers_match),
                 'has_body': bool(body_match),
                 'is_async': self._is_await_call(code, match.start()),
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         # Axios calls
-        axios_pattern = r'axios\.(get|post|put|delete|patch|request)\s*\(([^)]*)\)'
-        for match in re.finditer(axios_pattern, code):
+        for match in _AXIOS_CALL_RE.finditer(code):
             method, params = match.groups()
             fetch_patterns.append({
                 'type': 'axios',
                 'method': method.upper(),
                 'params': params.strip(),
                 'is_async': self._is_await_call(code, match.start()),
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         # React Query patterns
-        react_query_patterns = [
-            (r'useQuery\s*\(([^)]*)\)', 'use_query'),
-            (r'useMutation\s*\(([^)]*)\)', 'use_mutation'),
-            (r'useInfiniteQuery\s*\(([^)]*)\)', 'use_infinite_query'),
-        ]
-        
-        for pattern, query_type in react_query_patterns:
-            for match in re.finditer(pattern, code):
+        for pattern, query_type in _REACT_QUERY_PATTERNS:
+            for match in pattern.finditer(code):
                 params = match.group(1)
                 fetch_patterns.append({
                     'type': 'react_query',
                     'query_type': query_type,
                     'params': params.strip(),
-                    'line': code[:match.start()].count('\n') + 1
+                    'line': self._line_of(code, match.start())
                 })
         
         # SWR patterns
-        swr_pattern = r'useSWR\s*\(([^)]*)\)'
-        for match in re.finditer(swr_pattern, code):
+        for match in _SWR_CALL_RE.finditer(code):
             params = match.group(1)
             fetch_patterns.append({
                 'type': 'swr',
                 'params': params.strip(),
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         # AbortController patterns (for fetch cancellation)
-        abort_pattern = r'new\s+AbortController\s*\(\)'
-        for match in re.finditer(abort_pattern, code):
+        for match in _ABORT_CONTROLLER_RE.finditer(code):
             fetch_patterns.append({
                 'type': 'abort_controller',
                 'detected': True,
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         # Response handling patterns
-        response_patterns = [
-            (r'\.json\s*\(\)', 'json_response'),
-            (r'\.text\s*\(\)', 'text_response'),
-            (r'\.blob\s*\(\)', 'blob_response'),
-            (r'\.arrayBuffer\s*\(\)', 'array_buffer_response'),
-        ]
-        
-        for pattern, resp_type in response_patterns:
-            if re.search(pattern, code):
+        for pattern, resp_type in _RESPONSE_HANDLING_PATTERNS:
+            if pattern.search(code):
                 fetch_patterns.append({
                     'type': 'response_handling',
                     'response_type': resp_type,
@@ -2456,71 +2707,52 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         async_patterns = []
         
         # Async function declarations
-        async_func_pattern = r'async\s+(?:function\s+(\w+)|const\s+(\w+)\s*=\s*async|(\w+)\s*=\s*async\s*\()'
-        for match in re.finditer(async_func_pattern, code):
+        for match in _ASYNC_FUNCTION_RE.finditer(code):
             func_name = match.group(1) or match.group(2) or match.group(3)
             
             async_patterns.append({
                 'type': 'async_function',
                 'name': func_name,
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         # Async arrow functions
-        async_arrow_pattern = r'const\s+(\w+)\s*=\s*async\s*\([^)]*\)\s*=>'
-        for match in re.finditer(async_arrow_pattern, code):
+        for match in _ASYNC_ARROW_FUNCTION_RE.finditer(code):
             func_name = match.group(1)
             async_patterns.append({
                 'type': 'async_arrow_function',
                 'name': func_name,
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         # Await usage
-        await_pattern = r'await\s+(\w+)\s*\('
-        for match in re.finditer(await_pattern, code):
+        for match in _AWAIT_CALL_RE.finditer(code):
             call_name = match.group(1)
             async_patterns.append({
                 'type': 'await_call',
                 'call': call_name,
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         # Promise chains
-        promise_patterns = [
-            (r'\.then\s*\(([^)]+)\)', 'promise_then'),
-            (r'\.catch\s*\(([^)]+)\)', 'promise_catch'),
-            (r'\.finally\s*\(([^)]+)\)', 'promise_finally'),
-            (r'Promise\.all\s*\(', 'promise_all'),
-            (r'Promise\.race\s*\(', 'promise_race'),
-            (r'Promise\.resolve\s*\(', 'promise_resolve'),
-            (r'Promise\.reject\s*\(', 'promise_reject'),
-        ]
-        
-        for pattern, promise_type in promise_patterns:
-            for match in re.finditer(pattern, code):
+        for pattern, promise_type in _PROMISE_PATTERNS:
+            for match in pattern.finditer(code):
                 async_patterns.append({
                     'type': promise_type,
                     'expression': match.group(1) if len(match.groups()) > 0 else '',
-                    'line': code[:match.start()].count('\n') + 1
+                    'line': self._line_of(code, match.start())
                 })
         
         # Async in useEffect
-        async_use_effect_pattern = r'useEffect\s*\(\(\)\s*=>\s*{[\s\S]*?await'
-        if re.search(async_use_effect_pattern, code, re.DOTALL):
+        if _ASYNC_USE_EFFECT_RE.search(code):
             async_patterns.append({
                 'type': 'async_use_effect',
                 'detected': True
             })
         
         # Error handling patterns
-        error_patterns = [
-            (r'try\s*{', 'try_block'),
-            (r'catch\s*\(', 'catch_block'),
-        ]
-        
-        for pattern, error_type in error_patterns:
-            matches = list(re.finditer(pattern, code))
+        for pattern, error_type in _ERROR_HANDLING_PATTERNS:
+            matches = list(pattern.finditer(code))
             if matches:
                 async_patterns.append({
                     'type': error_type,
@@ -2544,27 +2776,12 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         }
         
         # Check for TypeScript syntax
-        ts_patterns = [
-            # Type annotations
-            (r':\s*\w+(?:\s*<[^>]+>)?(?:\s*\[\])?(?:\s*\|\s*\w+)*', 'type_annotation'),
-            # Interfaces
-            (r'interface\s+(\w+)', 'interface'),
-            # Type aliases
-            (r'type\s+(\w+)', 'type_alias'),
-            # Generics
-            (r'<[A-Z][a-zA-Z]*>', 'generic'),
-            # Enums
-            (r'enum\s+(\w+)', 'enum'),
-            # Decorators
-            (r'@(\w+)', 'decorator'),
-        ]
-        
-        for pattern, feature_type in ts_patterns:
-            for match in re.finditer(pattern, code):
+        for pattern, feature_type in _TYPESCRIPT_PATTERNS:
+            for match in pattern.finditer(code):
                 if feature_type == 'type_annotation':
                     ts_features['type_annotations'].append({
                         'annotation': match.group(0),
-                        'line': code[:match.start()].count('\n') + 1
+                        'line': self._line_of(code, match.start())
                     })
                 elif feature_type == 'interface':
                     ts_features['interfaces'].append(match.group(1))
@@ -2578,8 +2795,7 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
                     ts_features['decorators'].append(match.group(1))
         
         # Type imports
-        type_import_pattern = r'import\s+type\s+'
-        if re.search(type_import_pattern, code):
+        if _TYPE_IMPORT_RE.search(code):
             ts_features['type_imports'] = True
         
         # Check for .tsx or .ts extension comments (not reliable but can help)
@@ -2600,36 +2816,33 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract component props patterns"""
         props_patterns = []
         
-        # Pattern for function component props
-        func_prop_pattern = r'function\s+\w+\s*\(({[^}]*}|\w+)\)'
-        for match in re.finditer(func_prop_pattern, code):
+        # Function component props
+        for match in _FUNCTION_COMPONENT_PROPS_RE.finditer(code):
             props = match.group(1)
             props_patterns.append({
                 'type': 'function_component',
                 'props': props,
                 'destructured': props.startswith('{'),
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
-        # Pattern for arrow function props
-        arrow_prop_pattern = r'const\s+\w+\s*=\s*\(({[^}]*}|\w+)\)\s*=>'
-        for match in re.finditer(arrow_prop_pattern, code):
+        # Arrow function props
+        for match in _ARROW_COMPONENT_PROPS_RE.finditer(code):
             props = match.group(1)
             props_patterns.append({
                 'type': 'arrow_function',
                 'props': props,
                 'destructured': props.startswith('{'),
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
             
                 # Check for PropTypes definitions
-        proptypes_pattern = r'(\w+)\.propTypes\s*=\s*\{'
-        for match in re.finditer(proptypes_pattern, code):
+        for match in _PROP_TYPES_ASSIGNMENT_RE.finditer(code):
             component_name = match.group(1)
             props_patterns.append({
                 'type': 'propTypes',
                 'component': component_name,
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
 
         return props_patterns  
@@ -2638,9 +2851,7 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
     def _validate_react_default_props(self, pattern: Dict, semantics: Dict, code: str) -> Dict:
         """Validate React defaultProps pattern"""
         # Check for defaultProps in code
-        default_props_pattern = r'(\w+)\.defaultProps\s*=\s*\{([^}]+)\}'
-        
-        matches = list(re.finditer(default_props_pattern, code, re.DOTALL))
+        matches = list(_DEFAULT_PROPS_ASSIGNMENT_RE.finditer(code))
         
         if matches:
             component_name = matches[0].group(1)
@@ -2663,8 +2874,7 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         state_declarations = []
         
         # useState patterns
-        state_pattern = r'const\s*\[([^\]]+)\]\s*=\s*useState\s*\(([^)]*)\)'
-        for match in re.finditer(state_pattern, code):
+        for match in _USE_STATE_DECLARATION_RE.finditer(code):
             state_vars, initial_value = match.groups()
             vars_list = [v.strip() for v in state_vars.split(',')]
             
@@ -2672,12 +2882,11 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
                 'type': 'useState',
                 'variables': vars_list,
                 'initial_value': initial_value.strip(),
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         # useReducer patterns
-        reducer_pattern = r'const\s*\[([^\]]+)\]\s*=\s*useReducer\s*\(([^)]*)\)'
-        for match in re.finditer(reducer_pattern, code):
+        for match in _USE_REDUCER_DECLARATION_RE.finditer(code):
             state_vars, reducer_params = match.groups()
             vars_list = [v.strip() for v in state_vars.split(',')]
             
@@ -2685,7 +2894,7 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
                 'type': 'useReducer',
                 'variables': vars_list,
                 'reducer_params': reducer_params.strip(),
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         return state_declarations
@@ -2694,8 +2903,7 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract useEffect patterns"""
         effects = []
         
-        effect_pattern = r'useEffect\s*\(([^,]+),\s*\[([^\]]+)\]\)'
-        for match in re.finditer(effect_pattern, code):
+        for match in _USE_EFFECT_WITH_DEPS_RE.finditer(code):
             effect_fn, deps = match.groups()
             dep_list = [d.strip() for d in deps.split(',') if d.strip()]
             
@@ -2704,7 +2912,7 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
                 'dependencies': dep_list,
                 'dependency_count': len(dep_list),
                 'empty_deps': len(dep_list) == 0,
-                'line': code[:match.start()].count('\n') + 1
+                'line': self._line_of(code, match.start())
             })
         
         return effects
@@ -2713,21 +2921,14 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         """Extract API call patterns"""
         api_calls = []
         
-        # fetch patterns
-        fetch_patterns = [
-            (r'fetch\s*\(([^)]*)\)', 'fetch'),
-            (r'axios\.(get|post|put|delete|patch)\s*\(([^)]*)\)', 'axios'),
-            (r'\.then\s*\(([^)]*)\)', 'promise_then'),
-            (r'\.catch\s*\(([^)]*)\)', 'promise_catch'),
-        ]
-        
-        for pattern, call_type in fetch_patterns:
-            for match in re.finditer(pattern, code):
+        # fetch, axios and promise patterns
+        for pattern, call_type in _API_CALL_PATTERNS:
+            for match in pattern.finditer(code):
                 params = match.group(1) if len(match.groups()) > 0 else ''
                 api_calls.append({
                     'type': call_type,
                     'params': params.strip(),
-                    'line': code[:match.start()].count('\n') + 1,
+                    'line': self._line_of(code, match.start()),
                     'has_await': self._is_await_call(code, match.start())
                 })
         
@@ -2739,39 +2940,27 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         jsx_elements = []
         
         # Self-closing elements with props (both PascalCase and lowercase)
-        self_closing_pattern = r'<([A-Z][a-zA-Z0-9]*|[a-z][a-z0-9-]*)\s+[^/>]*/>'
-        for match in re.finditer(self_closing_pattern, code):
+        for match in _JSX_SELF_CLOSING_RE.finditer(code):
             element = match.group(1)
             if element not in jsx_elements:
                 jsx_elements.append(element)
         
         # Opening tags with props
-        opening_pattern = r'<([A-Z][a-zA-Z0-9]*|[a-z][a-z0-9-]*)\s+[^>]*>'
-        for match in re.finditer(opening_pattern, code):
+        for match in _JSX_OPENING_TAG_RE.finditer(code):
             element = match.group(1)
             if element not in jsx_elements:
                 jsx_elements.append(element)
         
         # Closing tags (for elements without props)
-        closing_pattern = r'</([A-Z][a-zA-Z0-9]*|[a-z][a-z0-9-]*)>'
-        for match in re.finditer(closing_pattern, code):
+        for match in _JSX_CLOSING_TAG_RE.finditer(code):
             element = match.group(1)
             if element not in jsx_elements:
                 jsx_elements.append(element)
         
         # Fragment detection
-        fragment_patterns = [
-            r'<>',
-            r'</>',
-            r'<React\.Fragment>',
-            r'</React\.Fragment>',
-            r'<Fragment>',
-            r'</Fragment>'
-        ]
-        
         has_fragment = False
-        for pattern in fragment_patterns:
-            if re.search(pattern, code):
+        for pattern in _JSX_FRAGMENT_PATTERNS:
+            if pattern.search(code):
                 has_fragment = True
                 break
         
@@ -2779,8 +2968,7 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
             jsx_elements.append('Fragment')
         
         # Custom component detection (PascalCase without < >)
-        custom_comp_pattern = r'\b([A-Z][a-zA-Z0-9]+)\b(?=[^>]*</)'
-        for match in re.finditer(custom_comp_pattern, code):
+        for match in _JSX_CUSTOM_COMPONENT_RE.finditer(code):
             component = match.group(1)
             # Check if it's actually used as a component (not a prop or something else)
             if component not in jsx_elements and len(component) > 1:
@@ -2791,14 +2979,10 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
                     jsx_elements.append(component)
         
         # Built-in React components
-        react_components = [
-            'Suspense', 'Profiler', 'StrictMode', 'lazy', 'memo', 'forwardRef'
-        ]
-        
-        for comp in react_components:
+        for comp, opening_pattern, closing_pattern in _BUILTIN_REACT_COMPONENTS:
             if comp in code and comp not in jsx_elements:
                 # Check if used as JSX element
-                if re.search(rf'<{comp}\b', code) or re.search(rf'</{comp}>', code):
+                if opening_pattern.search(code) or closing_pattern.search(code):
                     jsx_elements.append(comp)
         
         # Remove duplicates and sort
@@ -2810,16 +2994,12 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         attributes = []
         
         # Find all JSX tags (self-closing and opening)
-        tag_pattern = r'<([A-Za-z][A-Za-z0-9-]*)(\s+[^>]*?)(/?)>'
-        
-        for match in re.finditer(tag_pattern, code):
+        for match in _JSX_TAG_RE.finditer(code):
             tag_name, attrs_text, is_self_closing = match.groups()
-            line_number = code[:match.start()].count('\n') + 1
+            line_number = self._line_of(code, match.start())
             
             # Extract individual attributes
-            attr_pattern = r'(\w+)(?:\s*=\s*(?:{([^}]+)}|[\'"]([^\'"]+)[\'"]))?'
-            
-            for attr_match in re.finditer(attr_pattern, attrs_text):
+            for attr_match in _JSX_ATTRIBUTE_RE.finditer(attrs_text):
                 attr_name = attr_match.group(1)
                 js_value = attr_match.group(2)
                 string_value = attr_match.group(3)
@@ -2866,8 +3046,7 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
                 attributes.append(attribute_info)
             
             # Check for spread attributes
-            spread_pattern = r'\.\.\.(\w+)'
-            for spread_match in re.finditer(spread_pattern, attrs_text):
+            for spread_match in _JSX_SPREAD_ATTRIBUTE_RE.finditer(attrs_text):
                 spread_var = spread_match.group(1)
                 attributes.append({
                     'tag': tag_name,
@@ -2880,9 +3059,8 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
                 })
         
         # Extract boolean attributes (attributes without values)
-        boolean_attr_pattern = r'<[^>]*\s(\w+)(?=\s|/?>)'
-        for match in re.finditer(boolean_attr_pattern, code):
-            line_number = code[:match.start()].count('\n') + 1
+        for match in _JSX_BOOLEAN_ATTRIBUTE_RE.finditer(code):
+            line_number = self._line_of(code, match.start())
             attr_name = match.group(1)
             
             # Check if this is already captured
@@ -2912,10 +3090,9 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
                     })
         
         # Extract data-* and aria-* attributes
-        data_aria_pattern = r'\s((?:data|aria)-[\w-]+)\s*=\s*(?:{([^}]+)}|[\'"]([^\'"]+)[\'"])'
-        for match in re.finditer(data_aria_pattern, code):
+        for match in _JSX_DATA_ARIA_ATTRIBUTE_RE.finditer(code):
             attr_name, js_value, string_value = match.groups()
-            line_number = code[:match.start()].count('\n') + 1
+            line_number = self._line_of(code, match.start())
             
             value = js_value.strip() if js_value is not None else string_value.strip() if string_value is not None else None
             
@@ -3038,7 +3215,7 @@ class ReactSemanticAnalyzer(BaseSemanticAnalyzer):
         """Check if API call is preceded by await"""
         code_before = code[:position]
         # Look for 'await' keyword before the call
-        return bool(re.search(r'\bawait\s+$', code_before.strip()[-20:]))
+        return bool(_TRAILING_AWAIT_RE.search(code_before.strip()[-20:]))
 
 
 # Placeholder classes for other frameworks
@@ -3059,6 +3236,14 @@ class NodeJSSemanticAnalyzer(BaseSemanticAnalyzer):
 
 # ===== Enhanced Intermediate Validator (UPDATED to inherit from BaseValidator) =====
 
+# Conditional rendering in React code
+_TERNARY_RE = re.compile(r'\?\s*[^:]+\s*:\s*')
+# && operator (short-circuit evaluation)
+_AND_CONDITIONAL_RE = re.compile(r'{\s*\w+\s*&&\s*')
+_IF_RETURN_RE = re.compile(r'if\s*\([^)]+\)\s*{[^}]*return', re.DOTALL)
+_SWITCH_RE = re.compile(r'switch\s*\([^)]+\)')
+
+
 class EnhancedIntermediateValidator(BaseValidator):
     """
     Enhanced Intermediate Validator with comprehensive framework support
@@ -3071,8 +3256,7 @@ class EnhancedIntermediateValidator(BaseValidator):
         framework = validation_spec.get('framework', 'unknown')
         
         # Get appropriate analyzer
-        analyzer = FrameworkAnalyzerFactory.create_analyzer(framework)
-        semantics = analyzer.analyze(code, parsed_code)
+        semantics = self._analyze_semantics(framework, code, parsed_code)
         
         # Store semantics for validation methods
         parsed_code['semantics'] = semantics
@@ -3095,6 +3279,7 @@ class EnhancedIntermediateValidator(BaseValidator):
         
         # Class validation with framework-specific checks
         if 'classes' in required_structure:
+            class_index = self._index_by_name(parsed_code.get('classes', []))
             for class_spec in required_structure['classes']:
                 if not isinstance(class_spec, dict):
                     continue
@@ -3104,7 +3289,7 @@ class EnhancedIntermediateValidator(BaseValidator):
                     continue
                 
                 total_checks += 1
-                found = next((c for c in parsed_code.get('classes', []) if c['name'] == class_name), None)
+                found = class_index.get(class_name)
                 
                 if found:
                     checks_passed += 1
@@ -3121,6 +3306,7 @@ class EnhancedIntermediateValidator(BaseValidator):
         
         # Function validation
         if 'functions' in required_structure:
+            func_index = self._index_by_name(parsed_code.get('functions', []))
             for func_spec in required_structure['functions']:
                 if not isinstance(func_spec, dict):
                     continue
@@ -3130,7 +3316,7 @@ class EnhancedIntermediateValidator(BaseValidator):
                     continue
                 
                 total_checks += 1
-                found = next((f for f in parsed_code.get('functions', []) if f['name'] == func_name), None)
+                found = func_index.get(func_name)
                 
                 if not found:
                     details.append(f"✗ Function '{func_name}' not found")
@@ -3246,11 +3432,12 @@ class EnhancedIntermediateValidator(BaseValidator):
         details = []
         matched = 0
         total = len(behavior_patterns)
+        code_lower = code.lower()
         
         for pattern in behavior_patterns:
             if isinstance(pattern, str):
                 # Legacy string pattern
-                result = self._validate_legacy_pattern(pattern, code)
+                result = self._validate_legacy_pattern(pattern, code_lower)
             else:
                 # Structured pattern with framework support
                 result = self._validate_structured_pattern(pattern, semantics, code, framework)
@@ -3925,20 +4112,16 @@ class EnhancedIntermediateValidator(BaseValidator):
         conditional_type = pattern.get('conditional_type', 'any')
         
         # Check for ternary operators
-        ternary_pattern = r'\?\s*[^:]+\s*:\s*'
-        ternary_count = len(list(re.finditer(ternary_pattern, code)))
+        ternary_count = len(list(_TERNARY_RE.finditer(code)))
         
         # Check for && operator (short-circuit evaluation)
-        and_conditional_pattern = r'{\s*\w+\s*&&\s*'
-        and_conditional_count = len(list(re.finditer(and_conditional_pattern, code)))
+        and_conditional_count = len(list(_AND_CONDITIONAL_RE.finditer(code)))
         
         # Check for if statements in JSX
-        if_statement_pattern = r'if\s*\([^)]+\)\s*{[^}]*return'
-        if_count = len(list(re.finditer(if_statement_pattern, code, re.DOTALL)))
+        if_count = len(list(_IF_RETURN_RE.finditer(code)))
         
         # Check for switch statements
-        switch_pattern = r'switch\s*\([^)]+\)'
-        switch_count = len(list(re.finditer(switch_pattern, code)))
+        switch_count = len(list(_SWITCH_RE.finditer(code)))
         
         total_conditionals = ternary_count + and_conditional_count + if_count + switch_count
         
@@ -4496,10 +4679,9 @@ class EnhancedIntermediateValidator(BaseValidator):
         else:
             return {'passed': False, 'message': "useEffect doesn't return cleanup function"}
     
-    def _validate_legacy_pattern(self, pattern: str, code: str) -> Dict:
-        """Fallback for old string patterns"""
-        keywords = [kw.lower() for kw in pattern.split() if len(kw) > 3]
-        if any(keyword in code.lower() for keyword in keywords):
+    def _validate_legacy_pattern(self, pattern: str, code_lower: str) -> Dict:
+        """Fallback for old string patterns, matched against the lowercased code"""
+        if any(keyword in code_lower for keyword in _pattern_keywords(pattern)):
             return {'passed': True, 'message': pattern}
         else:
             return {'passed': False, 'message': pattern}
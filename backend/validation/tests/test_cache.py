@@ -0,0 +1,177 @@
+"""
+Tests for the bounded LRU cache and the service caches built on it
+"""
+
+import gc
+import weakref
+from types import SimpleNamespace
+
+from django.test import SimpleTestCase
+
+from validation.services import parser_service, submission_service, tiered_validator
+from validation.services._cache import BoundedCache, source_digest
+from validation.services.parser_service import ParserService
+from validation.services.submission_service import SubmissionService
+from validation.services.tiered_validator import BeginnerValidator
+
+
+class BoundedCacheTests(SimpleTestCase):
+    """Hits, misses and least-recently-used eviction"""
+    
+    def test_get_returns_stored_value_and_none_on_miss(self):
+        cache = BoundedCache(2)
+        cache.put('a', 1)
+        
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+    
+    def test_evicts_least_recently_stored_entry(self):
+        cache = BoundedCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.put('c', 3)
+        
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual((cache.get('b'), cache.get('c')), (2, 3))
+        self.assertEqual(len(cache), 2)
+    
+    def test_get_marks_entry_recently_used(self):
+        cache = BoundedCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+    
+    def test_put_replaces_value_and_marks_entry_recently_used(self):
+        cache = BoundedCache(2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.put('a', 10)
+        cache.put('c', 3)
+        
+        self.assertEqual(cache.get('a'), 10)
+        self.assertIsNone(cache.get('b'))
+    
+    def test_clear_empties_cache(self):
+        cache = BoundedCache(2)
+        cache.put('a', 1)
+        cache.clear()
+        
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(cache.get('a'))
+    
+    def test_source_digest_depends_only_on_content(self):
+        self.assertEqual(source_digest('x = 1'), source_digest(''.join(['x = ', '1'])))
+        self.assertNotEqual(source_digest('x = 1'), source_digest('x = 2'))
+        self.assertEqual(len(source_digest('x = 1')), 32)
+
+
+class ParseCacheTests(SimpleTestCase):
+    """ParserService caches results by language and source content"""
+    
+    def setUp(self):
+        parser_service._parse_cache.clear()
+        self.addCleanup(parser_service._parse_cache.clear)
+    
+    def test_repeat_parse_is_served_from_cache(self):
+        first = ParserService.parse_code('import os\n', 'python')
+        
+        key = ParserService._cache_key('import os\n', 'python')
+        self.assertIsNotNone(parser_service._parse_cache.get(key))
+        self.assertEqual(ParserService.parse_code('import os\n', 'python'), first)
+    
+    def test_callers_get_copies_of_the_cached_result(self):
+        ParserService.parse_code('import os\n', 'python')['framework'] = 'django'
+        
+        self.assertNotIn('framework', ParserService.parse_code('import os\n', 'python'))
+    
+    def test_key_includes_language_and_content(self):
+        key = ParserService._cache_key('x = 1', 'python')
+        
+        self.assertEqual(key, ('python', source_digest('x = 1')))
+        self.assertNotEqual(key, ParserService._cache_key('x = 1', 'javascript'))
+        self.assertNotEqual(key, ParserService._cache_key('x = 2', 'python'))
+
+
+class SpecCacheTests(SimpleTestCase):
+    """Validation specs are rebuilt only when the problem changes"""
+    
+    def setUp(self):
+        submission_service._spec_cache.clear()
+        self.addCleanup(submission_service._spec_cache.clear)
+    
+    def _problem(self, updated_at, passing_score=70):
+        return SimpleNamespace(
+            pk=1,
+            updated_at=updated_at,
+            difficulty='beginner',
+            framework=SimpleNamespace(name='django'),
+            validation_spec={'required_imports': ['django.db.models']},
+            import_weight=20,
+            structure_weight=40,
+            behavior_weight=40,
+            passing_score=passing_score,
+        )
+    
+    def test_unchanged_problem_reuses_spec(self):
+        spec = SubmissionService._get_validation_spec(self._problem('t1'))
+        
+        self.assertIs(SubmissionService._get_validation_spec(self._problem('t1', passing_score=90)), spec)
+    
+    def test_updated_problem_rebuilds_spec(self):
+        SubmissionService._get_validation_spec(self._problem('t1'))
+        
+        spec = SubmissionService._get_validation_spec(self._problem('t2', passing_score=90))
+        self.assertEqual(spec['passing_score'], 90.0)
+        self.assertEqual(spec['required_imports'], ['django.db.models'])
+
+
+class _Tree:
+    """Stand-in for a parsed AST that can be weakly referenced"""
+
+
+class SemanticsCacheTests(SimpleTestCase):
+    """Semantic analyses are cached per framework, parser and source content"""
+    
+    CODE = 'from django.db import models\n\nclass Book(models.Model):\n    pass\n'
+    
+    def setUp(self):
+        tiered_validator._semantics_cache.clear()
+        self.addCleanup(tiered_validator._semantics_cache.clear)
+        self.validator = BeginnerValidator()
+    
+    def _parsed(self, parser_used, tree=None):
+        return {
+            'success': True,
+            'parser_used': parser_used,
+            'tree': tree,
+            'classes': [{'name': 'Book', 'bases': ['models.Model'], 'methods': []}],
+            'functions': [],
+        }
+    
+    def test_repeat_analysis_is_served_from_cache(self):
+        semantics = self.validator._analyze_semantics('django', self.CODE, self._parsed('ast'))
+        
+        self.assertIs(self.validator._analyze_semantics('Django', self.CODE, self._parsed('ast')), semantics)
+    
+    def test_key_includes_framework_parser_and_content(self):
+        semantics = self.validator._analyze_semantics('django', self.CODE, self._parsed('ast'))
+        
+        self.assertIsNot(self.validator._analyze_semantics('django', self.CODE, self._parsed('regex')), semantics)
+        self.assertIsNot(self.validator._analyze_semantics('react', self.CODE, self._parsed('ast')), semantics)
+        self.assertIsNot(self.validator._analyze_semantics('django', self.CODE + '\n', self._parsed('ast')), semantics)
+        self.assertEqual(len(tiered_validator._semantics_cache), 4)
+    
+    def test_cached_analysis_does_not_keep_the_tree_alive(self):
+        tree = _Tree()
+        tree_ref = weakref.ref(tree)
+        semantics = self.validator._analyze_semantics('django', self.CODE, self._parsed('ast', tree))
+        semantics['model_methods']
+        
+        del tree
+        gc.collect()
+        self.assertIsNone(tree_ref())
+        self.assertIs(self.validator._analyze_semantics('django', self.CODE, self._parsed('ast')), semantics)
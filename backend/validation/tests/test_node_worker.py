@@ -0,0 +1,150 @@
+"""
+Tests for the long-lived Node.js parser worker and its fallbacks
+
+The worker runs small stand-in scripts speaking the same line protocol as
+the esprima worker, so only Node.js itself is required.
+"""
+
+import shutil
+import subprocess
+import unittest
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from validation.services import parser_service
+from validation.services.parser_service import ParserService, _NodeWorker
+
+# Answers every request with a successful, empty parse that echoes the code
+_ECHO_WORKER_JS = r"""
+const readline = require('readline');
+const rl = readline.createInterface({ input: process.stdin, terminal: false });
+rl.on('line', line => {
+    const code = JSON.parse(line).code;
+    if (code === 'crash') process.exit(1);
+    process.stdout.write(JSON.stringify({
+        success: true, imports: [], classes: [], functions: [], echo: code, pid: process.pid
+    }) + '\n');
+});
+"""
+
+# Reads requests but never answers
+_SILENT_WORKER_JS = "process.stdin.resume();"
+
+# Exits immediately, as the real worker does when esprima is missing
+_EXITING_WORKER_JS = "process.exit(1);"
+
+
+@unittest.skipIf(shutil.which('node') is None, 'Node.js is not installed')
+class NodeWorkerTests(SimpleTestCase):
+    """Worker reuse, restarts and failure reporting"""
+    
+    def _worker(self, script, timeout=5):
+        patcher = mock.patch.object(parser_service, '_NODE_WORKER_JS', script)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        worker = _NodeWorker(timeout=timeout)
+        self.addCleanup(worker.stop)
+        return worker
+    
+    def test_one_process_serves_consecutive_requests(self):
+        worker = self._worker(_ECHO_WORKER_JS)
+        
+        first = worker.try_parse('const a = 1')
+        second = worker.try_parse('const b = 2')
+        
+        self.assertEqual((first['echo'], second['echo']), ('const a = 1', 'const b = 2'))
+        self.assertEqual(first['pid'], second['pid'])
+    
+    def test_batch_results_keep_request_order(self):
+        worker = self._worker(_ECHO_WORKER_JS)
+        
+        results = worker.try_parse_many(['a', 'b', 'c'])
+        
+        self.assertEqual([result['echo'] for result in results], ['a', 'b', 'c'])
+    
+    def test_restarts_after_the_process_is_killed(self):
+        worker = self._worker(_ECHO_WORKER_JS)
+        first_pid = worker.try_parse('a')['pid']
+        
+        worker._process.kill()
+        worker._process.wait()
+        
+        result = worker.try_parse('b')
+        self.assertEqual(result['echo'], 'b')
+        self.assertNotEqual(result['pid'], first_pid)
+    
+    def test_crash_mid_request_raises_and_next_request_restarts(self):
+        worker = self._worker(_ECHO_WORKER_JS)
+        
+        with self.assertRaises(RuntimeError):
+            worker.try_parse('crash')
+        self.assertIsNone(worker._process)
+        
+        self.assertEqual(worker.try_parse('after')['echo'], 'after')
+    
+    def test_unanswered_request_times_out_and_stops_the_process(self):
+        worker = self._worker(_SILENT_WORKER_JS, timeout=0.5)
+        
+        with self.assertRaises(subprocess.TimeoutExpired):
+            worker.try_parse('const a = 1')
+        self.assertIsNone(worker._process)
+    
+    def test_busy_worker_returns_none(self):
+        worker = self._worker(_ECHO_WORKER_JS)
+        
+        with worker._lock:
+            self.assertIsNone(worker.try_parse('a'))
+
+
+class NodeFallbackTests(SimpleTestCase):
+    """JavaScript parsing falls back to regex when the worker fails"""
+    
+    def setUp(self):
+        parser_service._parse_cache.clear()
+        self.addCleanup(parser_service._parse_cache.clear)
+        # Exercise the Node.js path even where tree-sitter is installed
+        patcher = mock.patch.object(parser_service, '_TS_JS_LANGUAGE', None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def _failing_worker(self, error):
+        worker = mock.Mock(spec=_NodeWorker)
+        worker.try_parse.side_effect = error
+        worker.try_parse_many.side_effect = error
+        patcher = mock.patch.object(parser_service, '_node_worker', worker)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_missing_node_falls_back_to_regex(self):
+        self._failing_worker(FileNotFoundError('node'))
+        
+        result = ParserService.parse_code("import React from 'react';\n", 'javascript')
+        
+        self.assertEqual(result['parser_used'], 'regex')
+        self.assertEqual(result['imports'][0]['module'], 'react')
+    
+    def test_worker_timeout_falls_back_to_regex(self):
+        self._failing_worker(subprocess.TimeoutExpired('node', 1))
+        
+        results = ParserService.parse_many(['const a = require("a");', 'const b = 1;'], 'javascript')
+        
+        self.assertEqual([result['parser_used'] for result in results], ['regex', 'regex'])
+    
+    def test_regex_fallback_is_not_cached(self):
+        self._failing_worker(RuntimeError('Node.js parser worker exited'))
+        
+        ParserService.parse_code('const a = 1;', 'javascript')
+        
+        self.assertEqual(len(parser_service._parse_cache), 0)
+    
+    @unittest.skipIf(shutil.which('node') is None, 'Node.js is not installed')
+    def test_worker_that_exits_on_start_falls_back_to_regex(self):
+        worker = _NodeWorker(timeout=5)
+        self.addCleanup(worker.stop)
+        with mock.patch.object(parser_service, '_NODE_WORKER_JS', _EXITING_WORKER_JS), \
+                mock.patch.object(parser_service, '_node_worker', worker), \
+                mock.patch.object(ParserService, '_parse_javascript_once', side_effect=FileNotFoundError):
+            result = ParserService.parse_code('const a = 1;', 'javascript')
+        
+        self.assertEqual(result['parser_used'], 'regex')
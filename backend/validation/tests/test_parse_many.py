@@ -0,0 +1,66 @@
+"""
+Tests for batch parsing and its interaction with single-source parsing
+"""
+
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from validation.services import parser_service
+from validation.services.parser_service import ParserService
+
+SOURCES = [
+    'import os\n\nclass A:\n    def run(self):\n        pass\n',
+    'from django.db import models\n\nclass B(models.Model):\n    pass\n',
+    'def helper(x):\n    return x\n',
+]
+
+
+class ParseManyPythonTests(SimpleTestCase):
+    """parse_many agrees with parse_code, whichever runs first"""
+    
+    def setUp(self):
+        parser_service._parse_cache.clear()
+        self.addCleanup(parser_service._parse_cache.clear)
+        # Send even small batches through worker processes, on any machine
+        for patcher in (
+            mock.patch.object(parser_service, 'PARALLEL_PARSE_MIN_SOURCES', 1),
+            mock.patch('os.cpu_count', return_value=2),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+    
+    @staticmethod
+    def _without_tree(result):
+        return {key: value for key, value in result.items() if key != 'tree'}
+    
+    def test_batch_results_match_single_source_parses(self):
+        batch = ParserService.parse_many(SOURCES, 'python')
+        parser_service._parse_cache.clear()
+        singles = [ParserService.parse_code(code, 'python') for code in SOURCES]
+        
+        self.assertEqual(batch, [self._without_tree(result) for result in singles])
+    
+    def test_parse_code_after_batch_returns_tree(self):
+        ParserService.parse_many(SOURCES, 'python')
+        
+        for code in SOURCES:
+            with self.subTest(code=code):
+                self.assertIn('tree', ParserService.parse_code(code, 'python'))
+                self.assertIn('tree', ParserService.parse_python(code))
+    
+    def test_batch_after_parse_code_reuses_cached_results(self):
+        singles = [ParserService.parse_code(code, 'python') for code in SOURCES]
+        
+        with mock.patch.object(ParserService, 'parse_many_python') as parse:
+            batch = ParserService.parse_many(SOURCES, 'python')
+        
+        parse.assert_not_called()
+        self.assertEqual(batch, singles)
+    
+    def test_results_keep_input_order_with_duplicates(self):
+        codes = [SOURCES[1], SOURCES[0], SOURCES[1]]
+        
+        batch = ParserService.parse_many(codes, 'python')
+        
+        self.assertEqual([result['classes'][0]['name'] for result in batch], ['B', 'A', 'B'])
@@ -0,0 +1,113 @@
+"""
+Tests for the optional SQLite parse cache
+"""
+
+import sqlite3
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from validation.services import parser_service
+from validation.services.parser_service import ParserService
+
+PYTHON_SOURCE = 'import os\n\nclass Report:\n    def render(self):\n        pass\n'
+
+
+class PersistentParseCacheTests(SimpleTestCase):
+    """Results survive restarts, keyed on PARSE_CACHE_VERSION"""
+    
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = str(Path(directory.name) / 'parse_cache.sqlite3')
+        
+        parser_service._parse_cache.clear()
+        self.addCleanup(parser_service._parse_cache.clear)
+        self.addCleanup(self._close)
+    
+    def _close(self):
+        if parser_service._persistent_cache is not None:
+            parser_service._persistent_cache.close()
+        parser_service._persistent_cache = None
+    
+    def _restart(self):
+        """Simulate a new process: empty in-memory cache, database reopened"""
+        self._close()
+        parser_service._parse_cache.clear()
+        ParserService.init_persistent_cache(self.path)
+    
+    def _rows(self):
+        return parser_service._persistent_cache.execute(
+            'SELECT lang, version FROM parse_cache'
+        ).fetchall()
+    
+    def test_result_is_read_back_after_restart_without_tree(self):
+        ParserService.init_persistent_cache(self.path)
+        parsed = ParserService.parse_code(PYTHON_SOURCE, 'python')
+        self.assertIn('tree', parsed)
+        
+        self._restart()
+        with mock.patch.object(ParserService, 'parse_many_python') as parse:
+            [cached] = ParserService.parse_many([PYTHON_SOURCE], 'python')
+        
+        parse.assert_not_called()
+        self.assertNotIn('tree', cached)
+        self.assertEqual(cached['classes'][0]['name'], 'Report')
+        self.assertEqual(cached['imports'], parsed['imports'])
+    
+    def test_parse_code_restores_tree_for_a_disk_hit(self):
+        ParserService.init_persistent_cache(self.path)
+        ParserService.parse_code(PYTHON_SOURCE, 'python')
+        
+        self._restart()
+        
+        self.assertIn('tree', ParserService.parse_code(PYTHON_SOURCE, 'python'))
+        self.assertIn('tree', ParserService.parse_code(PYTHON_SOURCE, 'python'))
+    
+    def test_rows_from_another_version_are_dropped_and_not_served(self):
+        ParserService.init_persistent_cache(self.path)
+        ParserService.parse_code(PYTHON_SOURCE, 'python')
+        
+        with mock.patch.object(parser_service, 'PARSE_CACHE_VERSION', parser_service.PARSE_CACHE_VERSION + 1):
+            self._restart()
+            self.assertEqual(self._rows(), [])
+            
+            ParserService.parse_code(PYTHON_SOURCE, 'python')
+            self.assertEqual(self._rows(), [('python', parser_service.PARSE_CACHE_VERSION)])
+    
+    def test_table_from_before_the_version_column_is_replaced(self):
+        connection = sqlite3.connect(self.path)
+        connection.execute('CREATE TABLE parse_cache (lang TEXT, sha BLOB, result TEXT, PRIMARY KEY (lang, sha))')
+        connection.execute(
+            'INSERT INTO parse_cache VALUES (?, ?, ?)',
+            ('python', ParserService._cache_key(PYTHON_SOURCE, 'python')[1], '{"success": true, "classes": []}')
+        )
+        connection.commit()
+        connection.close()
+        
+        ParserService.init_persistent_cache(self.path)
+        
+        self.assertEqual(self._rows(), [])
+        self.assertEqual(ParserService.parse_code(PYTHON_SOURCE, 'python')['classes'][0]['name'], 'Report')
+    
+    def test_regex_fallback_is_not_persisted(self):
+        ParserService.init_persistent_cache(self.path)
+        fallback = {'success': True, 'imports': [], 'classes': [], 'functions': [], 'parser_used': 'regex'}
+        
+        with mock.patch.object(ParserService, '_parse_code_uncached', return_value=fallback):
+            ParserService.parse_code('const a = 1;', 'javascript')
+        ParserService._cache_put(ParserService._cache_key('const b = 2;', 'javascript'), fallback)
+        
+        self.assertEqual(self._rows(), [])
+    
+    def test_unreadable_row_counts_as_a_miss(self):
+        ParserService.init_persistent_cache(self.path)
+        key = ParserService._cache_key(PYTHON_SOURCE, 'python')
+        parser_service._persistent_cache.execute(
+            'INSERT INTO parse_cache VALUES (?, ?, ?, ?)',
+            (*key, parser_service.PARSE_CACHE_VERSION, 'not json')
+        )
+        
+        self.assertEqual(ParserService.parse_code(PYTHON_SOURCE, 'python')['classes'][0]['name'], 'Report')
@@ -0,0 +1,70 @@
+"""
+Tests for the component scorers built by make_scorer
+"""
+
+from django.test import SimpleTestCase
+
+from validation.scorers.aggregator import ScoreAggregator
+from validation.scorers.base import make_scorer
+from validation.scorers.behavior_scorer import BehaviorScorer
+from validation.scorers.import_scorer import ImportScorer
+from validation.scorers.structure_scorer import StructureScorer
+
+
+class MakeScorerTests(SimpleTestCase):
+    """make_scorer output shape and weighting"""
+    
+    def test_weights_and_rounds_the_raw_score(self):
+        calculate = make_scorer('imports')
+        
+        score = calculate({'score': 66.667, 'passed': True, 'details': ['✓ Found import: x']}, 45.0)
+        
+        self.assertEqual(score, {
+            'component': 'imports',
+            'raw_score': 66.667,
+            'weight': 45.0,
+            'weighted_score': 30.0,
+            'passed': True,
+            'details': ['✓ Found import: x'],
+        })
+    
+    def test_missing_fields_default_to_a_failed_zero_score(self):
+        score = make_scorer('structure')({}, 40.0)
+        
+        self.assertEqual(score['raw_score'], 0.0)
+        self.assertEqual(score['weighted_score'], 0.0)
+        self.assertFalse(score['passed'])
+        self.assertEqual(score['details'], [])
+    
+    def test_details_are_passed_through_unchanged(self):
+        details = ['✗ Missing method: save', {'pattern': 'raw'}]
+        
+        score = make_scorer('behavior')({'score': 50.0, 'details': details}, 10.0)
+        
+        self.assertIs(score['details'], details)
+    
+    def test_component_scorers_label_their_results(self):
+        results = {'score': 80.0, 'passed': True}
+        
+        self.assertEqual(ImportScorer.calculate_score(results, 15.0)['component'], 'imports')
+        self.assertEqual(StructureScorer.calculate_score(results, 40.0)['component'], 'structure')
+        self.assertEqual(BehaviorScorer.calculate_score(results, 45.0)['component'], 'behavior')
+        self.assertEqual(BehaviorScorer.calculate_score(results, 45.0)['weighted_score'], 36.0)
+
+
+class ScoreAggregatorTests(SimpleTestCase):
+    """aggregate_scores totals, verdicts and breakdown"""
+    
+    def test_breakdown_rounds_unrounded_weighted_scores(self):
+        components = [
+            {'component': 'imports', 'raw_score': 100 / 3, 'weight': 0.3, 'weighted_score': 10 / 3, 'passed': False},
+            {'component': 'behavior', 'raw_score': 90.0, 'weight': 0.7, 'weighted_score': 63.0, 'passed': True},
+        ]
+        
+        result = ScoreAggregator.aggregate_scores(components, 60.0)
+        
+        self.assertEqual(result['breakdown']['imports']['weighted_score'], 3.33)
+        self.assertEqual(result['breakdown']['imports']['raw_score'], 33.33)
+        self.assertEqual(result['total_score'], 66.33)
+        self.assertEqual(result['verdict'], 'accepted')
+        self.assertEqual(result['breakdown']['summary']['components_passed'], 1)
@@ -0,0 +1,110 @@
+"""
+Tests for validating submissions one at a time and in batches
+"""
+
+import uuid
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import SimpleTestCase
+
+from validation.services import parser_service, submission_service
+from validation.services.submission_service import SubmissionService
+
+
+def _problem(pk, framework, validation_spec, difficulty='beginner'):
+    return SimpleNamespace(
+        pk=pk,
+        updated_at='t1',
+        difficulty=difficulty,
+        framework=SimpleNamespace(name=framework),
+        validation_spec=validation_spec,
+        import_weight=20,
+        structure_weight=40,
+        behavior_weight=40,
+        passing_score=70,
+    )
+
+
+MODEL_PROBLEM = _problem(1, 'django', {
+    'required_imports': ['django.db.models'],
+    'required_structure': {'classes': [{'name': 'Book', 'inherits': 'models.Model'}]},
+    'behavior_patterns': [],
+})
+VIEW_PROBLEM = _problem(2, 'django', {
+    'required_imports': ['django.http.JsonResponse'],
+    'required_structure': {'functions': [{'name': 'book_list'}]},
+    'behavior_patterns': [],
+}, difficulty='intermediate')
+COMPONENT_PROBLEM = _problem(3, 'react', {
+    'required_imports': ['react.useState'],
+    'required_structure': {'functions': [{'name': 'Counter'}]},
+    'behavior_patterns': [],
+})
+
+CASES = [
+    (MODEL_PROBLEM, 'from django.db import models\n\nclass Book(models.Model):\n'
+                    '    title = models.CharField(max_length=100)\n'),
+    (MODEL_PROBLEM, 'class Book:\n    pass\n'),
+    (VIEW_PROBLEM, 'from django.http import JsonResponse\n\ndef book_list(request):\n'
+                   '    return JsonResponse({"books": []})\n'),
+    (MODEL_PROBLEM, 'class Book(models.Model:\n'),
+    (COMPONENT_PROBLEM, "import { useState } from 'react';\n\nfunction Counter() {\n"
+                        "  const [count, setCount] = useState(0);\n  return count;\n}\n"),
+    (MODEL_PROBLEM, 'from django.db import models\n\nclass Book(models.Model):\n'
+                    '    title = models.CharField(max_length=100)\n'),
+]
+
+
+class ValidateSubmissionsTests(SimpleTestCase):
+    """validate_submissions gives the same results as validate_submission per submission"""
+    
+    def setUp(self):
+        for cache in (parser_service._parse_cache, submission_service._spec_cache):
+            cache.clear()
+            self.addCleanup(cache.clear)
+        self.submissions = [
+            SimpleNamespace(submission_id=uuid.uuid4(), problem=problem, code=code)
+            for problem, code in CASES
+        ]
+    
+    @staticmethod
+    def _comparable(results):
+        return [
+            {key: value for key, value in result.items() if key != 'execution_time_ms'}
+            for result in results
+        ]
+    
+    def _assert_batch_matches_singles(self):
+        batch = SubmissionService.validate_submissions(self.submissions)
+        parser_service._parse_cache.clear()
+        singles = [SubmissionService.validate_submission(submission) for submission in self.submissions]
+        
+        self.assertEqual(self._comparable(batch), self._comparable(singles))
+        self.assertEqual(batch[3]['verdict'], 'syntax_error')
+    
+    def test_batch_matches_single_validations(self):
+        self._assert_batch_matches_singles()
+    
+    def test_batch_parsed_in_worker_processes_matches_single_validations(self):
+        for patcher in (
+            mock.patch.object(parser_service, 'PARALLEL_PARSE_MIN_SOURCES', 1),
+            mock.patch('os.cpu_count', return_value=2),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        
+        self._assert_batch_matches_singles()
+    
+    def test_each_submission_logs_its_start(self):
+        with self.assertLogs('validation', level='INFO') as logs:
+            SubmissionService.validate_submissions(self.submissions)
+        
+        for submission in self.submissions:
+            self.assertIn(
+                'INFO:validation:[%s] Starting validation' % submission.submission_id.hex[:8],
+                logs.output,
+            )
+    
+    def test_empty_batch(self):
+        self.assertEqual(SubmissionService.validate_submissions([]), [])
@@ -0,0 +1,77 @@
+"""
+Tests comparing the tree-sitter JavaScript extraction with esprima's
+
+fixtures/esprima_javascript.json holds snippets with the structure the
+esprima worker extracts from them. Line numbers are left out: the esprima
+worker runs without location info and always reports null.
+"""
+
+import json
+import unittest
+from pathlib import Path
+
+from django.test import SimpleTestCase
+
+from validation.services import parser_service
+from validation.services.parser_service import ParserService
+from validation.services.tiered_validator import BeginnerValidator
+
+FIXTURES = json.loads(
+    (Path(__file__).parent / 'fixtures' / 'esprima_javascript.json').read_text(encoding='utf-8')
+)
+
+
+def _without_lines(value):
+    """Copy of an extraction result without 'line' and 'ast_type' keys"""
+    if isinstance(value, dict):
+        return {key: _without_lines(item) for key, item in value.items() if key not in ('line', 'ast_type')}
+    if isinstance(value, list):
+        return [_without_lines(item) for item in value]
+    return value
+
+
+@unittest.skipIf(parser_service._TS_JS_LANGUAGE is None, 'tree-sitter is not installed')
+class TreeSitterExtractionTests(SimpleTestCase):
+    """tree-sitter results match esprima's on the same snippets"""
+    
+    def test_matches_esprima_fixtures(self):
+        for name, fixture in FIXTURES.items():
+            with self.subTest(name):
+                result = ParserService._parse_javascript_with_tree_sitter(fixture['code'])
+                self.assertEqual(_without_lines(result), fixture['expected'])
+    
+    def test_reports_source_lines(self):
+        result = ParserService._parse_javascript_with_tree_sitter(FIXTURES['express_app']['code'])
+        
+        self.assertEqual(result['imports'][0]['line'], 1)
+        self.assertEqual(result['exports'][0]['line'], 8)
+    
+    def test_non_literal_require_imports_match_without_error(self):
+        result = ParserService._parse_javascript_with_tree_sitter("const name = require(moduleName);\nconst express = require('express');\n")
+        validator = BeginnerValidator()
+        
+        found = set(validator._extract_all_imports(result))
+        
+        self.assertNotIn(None, found)
+        self.assertTrue(validator._is_import_match_enhanced('express', found))
+    
+    def test_syntax_errors_are_left_to_the_other_parsers(self):
+        result = ParserService._parse_javascript_with_tree_sitter('const = ;')
+        
+        self.assertFalse(result['success'])
+
+
+class EsprimaFixtureTests(SimpleTestCase):
+    """The fixtures still describe what the esprima worker extracts"""
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        if not ParserService._parse_javascript_with_node('').get('success'):
+            raise unittest.SkipTest('Node.js with esprima is not available')
+    
+    def test_fixtures_match_esprima(self):
+        for name, fixture in FIXTURES.items():
+            with self.subTest(name):
+                result = ParserService._parse_javascript_with_node(fixture['code'])
+                self.assertEqual(_without_lines(result), fixture['expected'])